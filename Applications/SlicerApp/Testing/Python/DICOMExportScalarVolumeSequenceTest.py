@@ -0,0 +1,131 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+import vtk
+
+import slicer
+
+
+class DICOMExportScalarVolumeSequenceTest(unittest.TestCase):
+    """Check that a volume sequence exported by DICOMExportScalarVolumeSequence
+    matches the output of the CreateDICOMSeries CLI module (used by DICOMExportScalarVolume)
+    and that it can be loaded back.
+    """
+
+    def setUp(self):
+        slicer.mrmlScene.Clear(0)
+        self.tempDir = slicer.util.tempDirectory()
+
+    def tearDown(self):
+        slicer.mrmlScene.Clear(0)
+        shutil.rmtree(self.tempDir, ignore_errors=True)
+
+    def createFrameVolumes(self, numberOfFrames=3):
+        # Oblique volume with anisotropic spacing
+        rotation = vtk.vtkTransform()
+        rotation.RotateX(20)
+        rotation.RotateZ(-30)
+        ijkToRAS = slicer.util.arrayFromVTKMatrix(rotation.GetMatrix())
+        ijkToRAS[0:3, 0:3] = ijkToRAS[0:3, 0:3].dot(np.diag([0.8, 0.6, 2.5]))
+        ijkToRAS[0:3, 3] = [-12.5, 30.0, 7.25]
+
+        frameVolumeNodes = []
+        for frameIndex in range(numberOfFrames):
+            voxels = np.arange(4 * 5 * 6, dtype=np.int16).reshape(4, 5, 6) * (frameIndex + 1) - 50
+            volumeNode = slicer.util.addVolumeFromArray(voxels, ijkToRAS, name=f"Frame{frameIndex}")
+            volumeNode.CreateDefaultDisplayNodes()
+            volumeNode.GetDisplayNode().SetAutoWindowLevel(False)
+            volumeNode.GetDisplayNode().SetWindowLevel(350, 40)
+            frameVolumeNodes.append(volumeNode)
+        return frameVolumeNodes
+
+    def tags(self):
+        import pydicom
+
+        return {
+            "Patient Name": "Test^Patient",
+            "Patient ID": "TEST123",
+            "Patient Birth Date": "19700101",
+            "Patient Sex": "O",
+            "Patient Comments": "",
+            "Study ID": "1",
+            "Study Date": "20200102",
+            "Study Time": "101112",
+            "Study Description": "Volume sequence export",
+            "Modality": "CT",
+            "Manufacturer": "3D Slicer",
+            "Model": "",
+            "Series Description": "Test sequence",
+            "Series Number": "1",
+            "Series Date": "20200102",
+            "Series Time": "101112",
+            "Study Instance UID": pydicom.uid.generate_uid(),
+            "Series Instance UID": pydicom.uid.generate_uid(),
+            "Frame of Reference UID": pydicom.uid.generate_uid(),
+        }
+
+    def test_ExportMatchesCLI(self):
+        import pydicom
+        from DICOMLib import DICOMExportScalarVolume, DICOMExportScalarVolumeSequence
+
+        frameVolumeNodes = self.createFrameVolumes()
+        tags = self.tags()
+        frameTags = [{"Content Date": "20200102", "Content Time": f"1011{12 + frameIndex:02d}.000000"}
+                     for frameIndex in range(len(frameVolumeNodes))]
+
+        # Export using pydicom, all frames at once
+        sequenceDirectory = os.path.join(self.tempDir, "Sequence")
+        os.makedirs(sequenceDirectory)
+        exporter = DICOMExportScalarVolumeSequence(frameVolumeNodes, tags, sequenceDirectory, frameTags,
+                                                   frameVolumeNodes[0].GetDisplayNode())
+        self.assertTrue(exporter.export())
+
+        # Export using the CLI module, frame by frame
+        cliDirectory = os.path.join(self.tempDir, "CLI")
+        os.makedirs(cliDirectory)
+        for frameIndex, volumeNode in enumerate(frameVolumeNodes):
+            frameExportTags = dict(tags)
+            frameExportTags.update(frameTags[frameIndex])
+            cliExporter = DICOMExportScalarVolume(tags["Study ID"], volumeNode, frameExportTags, cliDirectory, f"IMG_{frameIndex:04d}_")
+            self.assertTrue(cliExporter.export())
+
+        fileNames = sorted(os.listdir(cliDirectory))
+        numberOfSlices = slicer.util.arrayFromVolume(frameVolumeNodes[0]).shape[0]
+        self.assertEqual(len(fileNames), len(frameVolumeNodes) * numberOfSlices)
+        self.assertEqual(sorted(os.listdir(sequenceDirectory)), fileNames)
+
+        for fileName in fileNames:
+            sequenceDataset = pydicom.dcmread(os.path.join(sequenceDirectory, fileName))
+            cliDataset = pydicom.dcmread(os.path.join(cliDirectory, fileName))
+            for attributeName in ["ImagePositionPatient", "ImageOrientationPatient", "PixelSpacing", "WindowCenter", "WindowWidth"]:
+                np.testing.assert_allclose(
+                    np.array(sequenceDataset[attributeName].value, dtype=float),
+                    np.array(cliDataset[attributeName].value, dtype=float), atol=1e-4, err_msg=f"{attributeName} in {fileName}")
+            for attributeName in ["ContentDate", "ContentTime", "Modality", "SOPClassUID", "SeriesInstanceUID", "InstanceNumber", "Rows", "Columns"]:
+                self.assertEqual(str(sequenceDataset[attributeName].value), str(cliDataset[attributeName].value), f"{attributeName} in {fileName}")
+            np.testing.assert_array_equal(sequenceDataset.pixel_array, cliDataset.pixel_array, err_msg=fileName)
+
+    def test_ExportAndReload(self):
+        from DICOMLib import DICOMExportScalarVolumeSequence
+
+        frameVolumeNodes = self.createFrameVolumes()
+        exporter = DICOMExportScalarVolumeSequence(frameVolumeNodes, self.tags(), self.tempDir)
+        self.assertTrue(exporter.export())
+
+        for frameIndex, volumeNode in enumerate(frameVolumeNodes):
+            # All frames are in the same series, therefore load each frame from a separate folder
+            frameDirectory = os.path.join(self.tempDir, f"Frame{frameIndex}")
+            os.makedirs(frameDirectory)
+            frameFileNames = sorted(fileName for fileName in os.listdir(self.tempDir) if fileName.startswith(f"IMG_{frameIndex:04d}_"))
+            for fileName in frameFileNames:
+                shutil.move(os.path.join(self.tempDir, fileName), frameDirectory)
+
+            loadedVolumeNode = slicer.util.loadVolume(os.path.join(frameDirectory, frameFileNames[0]))
+            np.testing.assert_array_equal(slicer.util.arrayFromVolume(loadedVolumeNode), slicer.util.arrayFromVolume(volumeNode))
+            loadedIjkToRAS = vtk.vtkMatrix4x4()
+            loadedVolumeNode.GetIJKToRASMatrix(loadedIjkToRAS)
+            ijkToRAS = vtk.vtkMatrix4x4()
+            volumeNode.GetIJKToRASMatrix(ijkToRAS)
+            np.testing.assert_allclose(slicer.util.arrayFromVTKMatrix(loadedIjkToRAS), slicer.util.arrayFromVTKMatrix(ijkToRAS), atol=1e-4)
@@ -0,0 +1,158 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import vtk
+
+import slicer
+from Endoscopy import EndoscopyLogic
+
+
+class EndoscopyOrientationsTest(unittest.TestCase):
+    """Check that the flythrough orientations that EndoscopyLogic computes for all control points at once
+    match the orientations computed point by point using :func:`EndoscopyLogic.relativeOrientationToWorld`.
+    """
+
+    def setUp(self):
+        slicer.mrmlScene.Clear(0)
+
+    def tearDown(self):
+        slicer.mrmlScene.Clear(0)
+
+    @staticmethod
+    def createInputCurve(className, parameters):
+        inputCurve = slicer.mrmlScene.AddNewNodeByClass(className)
+        controlPoints = np.stack((30.0 * np.cos(parameters), 20.0 * np.sin(parameters), 8.0 * np.sin(3.0 * parameters)), axis=1)
+        slicer.util.updateMarkupsControlPointsFromArray(inputCurve, controlPoints)
+        return inputCurve
+
+    def createOpenCurve(self):
+        return self.createInputCurve("vtkMRMLMarkupsCurveNode", np.linspace(0.0, 1.5 * np.pi, 8))
+
+    def createClosedCurve(self):
+        return self.createInputCurve("vtkMRMLMarkupsClosedCurveNode", np.linspace(0.0, 2.0 * np.pi, 8, endpoint=False))
+
+    def createPolynomialCurve(self):
+        # Unevenly spaced control points, so that the polynomial fitted to the resampled points
+        # does not go through the resampled points.
+        inputCurve = self.createInputCurve("vtkMRMLMarkupsCurveNode", 1.5 * np.pi * np.linspace(0.0, 1.0, 9) ** 2)
+        inputCurve.SetCurveTypeToPolynomial()
+        return inputCurve
+
+    @staticmethod
+    def setKeyframes(logic, inputCurve):
+        """Add keyframes to the input curve and update the logic.
+
+        Keyframes include consecutive orientations that are more than 180 degrees apart and
+        an orientation with a rotation angle of more than 180 degrees.
+        """
+        logic.setControlPointsByResamplingAndInterpolationFromInputCurve(inputCurve)
+        resampledCurve = logic.resampledCurve
+        numberOfControlPoints = resampledCurve.GetNumberOfControlPoints()
+        axis = np.array([1.0, 2.0, 0.5]) / np.linalg.norm([1.0, 2.0, 0.5])
+        worldOrientations = {
+            numberOfControlPoints // 5: EndoscopyLogic.relativeOrientationToWorld(
+                resampledCurve, numberOfControlPoints // 5, np.array([np.radians(170.0), *axis]), logic.planeNormal),
+            2 * numberOfControlPoints // 5: EndoscopyLogic.relativeOrientationToWorld(
+                resampledCurve, 2 * numberOfControlPoints // 5, np.array([np.radians(-170.0), *axis]), logic.planeNormal),
+            3 * numberOfControlPoints // 4: np.array([np.radians(250.0), 0.0, 1.0, 0.0]),
+        }
+        cameraOrientations = {
+            EndoscopyLogic.distanceAlongCurveOfNthControlPoint(resampledCurve, resampledCurvePointIndex): worldOrientation
+            for resampledCurvePointIndex, worldOrientation in worldOrientations.items()
+        }
+        EndoscopyLogic.setInputCurveCameraOrientations(inputCurve, cameraOrientations)
+        logic.setControlPointsByResamplingAndInterpolationFromInputCurve(inputCurve)
+        return worldOrientations
+
+    @staticmethod
+    def pointByPointOrientationMatrices(logic, cameraOrientations):
+        """Compute world orientations of the resampled curve control points one by one, using a vtkQuaternionInterpolator
+        and :func:`EndoscopyLogic.relativeOrientationToWorld`.
+        """
+        resampledCurve = logic.resampledCurve
+
+        quaternionInterpolator = vtk.vtkQuaternionInterpolator()
+        quaternionInterpolator.SetSearchMethod(0)  # binary search
+        quaternionInterpolator.SetInterpolationTypeToLinear()
+        resampledCurveLength = resampledCurve.GetCurveLengthWorld()
+        for distanceAlongResampledCurve in sorted({0.0} | set(cameraOrientations.keys()) | {resampledCurveLength}):
+            if distanceAlongResampledCurve in cameraOrientations.keys():
+                resampledCurvePointIndex = EndoscopyLogic.indexOfControlPointForDistanceAlongCurve(
+                    resampledCurve, distanceAlongResampledCurve)
+                relativeOrientation = EndoscopyLogic.worldOrientationToRelative(
+                    resampledCurve, resampledCurvePointIndex, cameraOrientations[distanceAlongResampledCurve], logic.planeNormal)
+                quaternion = EndoscopyLogic.orientationToQuaternion(relativeOrientation)
+            else:
+                quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+            quaternionInterpolator.AddQuaternion(distanceAlongResampledCurve, quaternion)
+
+        matrices = []
+        for resampledCurvePointIndex in range(resampledCurve.GetNumberOfControlPoints()):
+            distanceAlongResampledCurve = EndoscopyLogic.distanceAlongCurveOfNthControlPoint(resampledCurve, resampledCurvePointIndex)
+            quaternion = np.zeros((4,))
+            quaternionInterpolator.InterpolateQuaternion(distanceAlongResampledCurve, quaternion)
+            worldOrientation = EndoscopyLogic.relativeOrientationToWorld(
+                resampledCurve, resampledCurvePointIndex, EndoscopyLogic.quaternionToOrientation(quaternion), logic.planeNormal)
+            matrices.append(EndoscopyLogic.orientationToMatrix3x3(worldOrientation))
+        return np.array(matrices)
+
+    @staticmethod
+    def orientationMatrices(curve):
+        return np.array([
+            np.array(curve.GetNthControlPointOrientationMatrix(controlPointIndex)).reshape(3, 3)
+            for controlPointIndex in range(curve.GetNumberOfControlPoints())
+        ])
+
+    def checkOrientations(self, inputCurve, expectFallback):
+        logic = EndoscopyLogic()
+        with mock.patch.object(
+            EndoscopyLogic, "distanceAlongCurveOfNthControlPoint", wraps=EndoscopyLogic.distanceAlongCurveOfNthControlPoint,
+        ) as distanceAlongCurveOfNthControlPoint:
+            worldOrientations = self.setKeyframes(logic, inputCurve)
+            # Distances are only searched point by point if control points are not at the expected curve points
+            self.assertEqual(distanceAlongCurveOfNthControlPoint.call_count > len(worldOrientations), expectFallback)
+
+        orientationMatrices = self.orientationMatrices(logic.resampledCurve)
+        self.assertEqual(len(orientationMatrices), logic.getNumberOfControlPoints())
+        self.assertGreater(len(orientationMatrices), 100)
+
+        cameraOrientations = EndoscopyLogic.getCameraOrientationsFromInputCurve(inputCurve)
+        np.testing.assert_allclose(orientationMatrices, self.pointByPointOrientationMatrices(logic, cameraOrientations), atol=1e-6)
+
+        if expectFallback:
+            # Control points are not on the curve, therefore the closest control point to a keyframe distance
+            # may not be the one the keyframe was saved at.
+            return
+
+        # Keyframe orientations are reproduced exactly
+        self.assertEqual(sorted(logic.cameraOrientationResampledCurveIndices), sorted(worldOrientations.keys()))
+        for resampledCurvePointIndex, worldOrientation in worldOrientations.items():
+            np.testing.assert_allclose(
+                orientationMatrices[resampledCurvePointIndex], EndoscopyLogic.orientationToMatrix3x3(worldOrientation), atol=1e-6)
+
+    def test_OpenCurveOrientations(self):
+        self.checkOrientations(self.createOpenCurve(), expectFallback=False)
+
+    def test_ClosedCurveOrientations(self):
+        self.checkOrientations(self.createClosedCurve(), expectFallback=False)
+
+    def test_PolynomialCurveOrientations(self):
+        self.checkOrientations(self.createPolynomialCurve(), expectFallback=True)
+
+    def test_DistancesAlongCurveOfControlPoints(self):
+        for inputCurve, expectFallback in [
+            (self.createOpenCurve(), False),
+            (self.createClosedCurve(), False),
+            (self.createPolynomialCurve(), True),
+        ]:
+            expectedDistances = [
+                EndoscopyLogic.distanceAlongCurveOfNthControlPoint(inputCurve, controlPointIndex)
+                for controlPointIndex in range(inputCurve.GetNumberOfControlPoints())
+            ]
+            with mock.patch.object(
+                EndoscopyLogic, "distanceAlongCurveOfNthControlPoint", wraps=EndoscopyLogic.distanceAlongCurveOfNthControlPoint,
+            ) as distanceAlongCurveOfNthControlPoint:
+                distances = EndoscopyLogic.distancesAlongCurveOfControlPoints(inputCurve)
+                self.assertEqual(distanceAlongCurveOfNthControlPoint.called, expectFallback, inputCurve.GetClassName())
+            np.testing.assert_allclose(distances, expectedDistances, atol=1e-6, err_msg=inputCurve.GetClassName())
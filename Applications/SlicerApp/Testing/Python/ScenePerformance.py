@@ -170,6 +170,8 @@ class ScenePerformanceTest(ScriptedLoadableModuleTest):
         self.setLayout(8)
         self.restoreSceneView(0)
         self.restoreSceneView(0)
+        self.undoRedo(5000)
+        self.undoRedoScaling()
         self.closeScene()
 
     def reportPerformance(self, action, property, time):
@@ -277,3 +279,70 @@ class ScenePerformanceTest(ScriptedLoadableModuleTest):
             averageTime = averageTime + time
         averageTime = averageTime / self.Repeat
         return self.reportPerformance("ModifyNode", node.GetID(), averageTime)
+
+    def undoRedo(self, numberOfNodes):
+        self.delayDisplay("Starting the undo/redo test")
+        undoTimes, redoTimes = self.measureUndoRedo(numberOfNodes, self.Repeat)
+        return (self.reportPerformance("Undo", numberOfNodes, sum(undoTimes) / self.Repeat)
+                + self.reportPerformance("Redo", numberOfNodes, sum(redoTimes) / self.Repeat))
+
+    def undoRedoScaling(self, numberOfNodes=2000, scale=4):
+        """Check that undo/redo time grows linearly with the number of nodes in the scene.
+
+        Time is expected to grow by ``scale`` times for linear complexity and by ``scale**2`` times
+        for quadratic complexity. The threshold is between the two, and the fastest of several runs
+        is used, to make the check robust against occasional slowdowns of the test machine.
+        """
+        self.delayDisplay("Starting the undo/redo scaling test")
+        repeat = 5
+        # Small constant offset prevents failure due to the limited (millisecond) resolution of the timer
+        minimumTime = 5
+        smallUndoTimes, smallRedoTimes = self.measureUndoRedo(numberOfNodes, repeat)
+        largeUndoTimes, largeRedoTimes = self.measureUndoRedo(numberOfNodes * scale, repeat)
+        for action, smallTimes, largeTimes in (("Undo", smallUndoTimes, largeUndoTimes), ("Redo", smallRedoTimes, largeRedoTimes)):
+            self.reportPerformance(action, numberOfNodes, min(smallTimes))
+            self.reportPerformance(action, numberOfNodes * scale, min(largeTimes))
+            self.assertLess(min(largeTimes), scale * scale / 2 * max(min(smallTimes), minimumTime))
+
+    def measureUndoRedo(self, numberOfNodes, repeat):
+        """Measure time of undo and redo of a change of a single node in a scene with many nodes.
+
+        :param numberOfNodes: number of undo-enabled nodes added to the scene.
+        :param repeat: number of measurements.
+        :return: list of undo times and list of redo times (in milliseconds).
+        """
+        logic = ScenePerformanceLogic()
+        undoWasEnabled = slicer.mrmlScene.GetUndoFlag()
+        slicer.mrmlScene.SetUndoOn()
+        slicer.mrmlScene.ClearUndoStack()
+        slicer.mrmlScene.ClearRedoStack()
+        nodes = []
+        for nodeIndex in range(numberOfNodes):
+            node = slicer.vtkMRMLScriptedModuleNode()
+            node.SetUndoEnabled(True)
+            slicer.mrmlScene.AddNode(node)
+            nodes.append(node)
+        undoTimes = []
+        redoTimes = []
+        for x in range(repeat):
+            # Create an undo state where only one node changes
+            slicer.mrmlScene.SaveStateForUndo(nodes[0])
+            nodes[0].SetParameter("Value", str(x))
+            logic.startTiming()
+            slicer.mrmlScene.Undo()
+            time = logic.stopTiming()
+            self.displayPerformance("Undo", numberOfNodes, time)
+            self.assertEqual(nodes[0].GetParameter("Value"), "" if x == 0 else str(x - 1))
+            undoTimes.append(time)
+            logic.startTiming()
+            slicer.mrmlScene.Redo()
+            time = logic.stopTiming()
+            self.displayPerformance("Redo", numberOfNodes, time)
+            self.assertEqual(nodes[0].GetParameter("Value"), str(x))
+            redoTimes.append(time)
+        slicer.mrmlScene.ClearUndoStack()
+        slicer.mrmlScene.ClearRedoStack()
+        for node in nodes:
+            slicer.mrmlScene.RemoveNode(node)
+        slicer.mrmlScene.SetUndoFlag(undoWasEnabled)
+        return undoTimes, redoTimes
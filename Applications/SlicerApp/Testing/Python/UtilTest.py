@@ -74,7 +74,9 @@ class UtilTestTest(ScriptedLoadableModuleTest):
         self.test_findChild()
         self.test_arrayFromVolume()
         self.test_updateVolumeFromArray()
+        self.test_updateVolumeFromArray_shareMemory()
         self.test_updateTableFromArray()
+        self.test_arrayFromSegmentBinaryLabelmap()
         self.test_arrayFromModelPoints()
         self.test_arrayFromVTKMatrix()
         self.test_arrayFromTransformMatrix()
@@ -242,6 +244,79 @@ class UtilTestTest(ScriptedLoadableModuleTest):
 
         self.delayDisplay("Testing slicer.util.test_updateVolumeFromArray passed")
 
+    def test_updateVolumeFromArray_shareMemory(self):
+        # Test updating voxels without copying them and measure the achievable frame rate
+        import logging
+        import time
+        import numpy as np
+
+        self.delayDisplay("Test volume update with shared memory")
+        frames = np.random.default_rng().integers(0, 1000, size=(10, 64, 128, 128), dtype=np.int16)
+        volumeNode = slicer.util.addVolumeFromArray(frames[0], np.diag([0.5, 0.5, 2.0, 1.0]), shareMemory=True)
+        self.assertTrue(np.shares_memory(slicer.util.arrayFromVolume(volumeNode), frames[0]))
+        self.assertEqual(volumeNode.GetSpacing(), (0.5, 0.5, 2.0))
+
+        # modifying the shared array modifies the voxels
+        frames[0, 3, 4, 5] = 1234
+        self.assertEqual(volumeNode.GetImageData().GetScalarComponentAsDouble(5, 4, 3, 0), 1234)
+
+        self.delayDisplay("Test that geometry and voxels are updated in one modification")
+        modifiedEvents = []
+        imageDataModifiedEvents = []
+        modifiedObserver = volumeNode.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: modifiedEvents.append(event))
+        imageDataModifiedObserver = volumeNode.AddObserver(slicer.vtkMRMLVolumeNode.ImageDataModifiedEvent,
+                                                           lambda caller, event: imageDataModifiedEvents.append(event))
+        slicer.util.updateVolumeFromArray(volumeNode, frames[1], np.diag([1.0, 1.0, 3.0, 1.0]), shareMemory=True)
+        self.assertEqual(len(modifiedEvents), 1)
+        self.assertEqual(len(imageDataModifiedEvents), 1)
+        self.assertEqual(volumeNode.GetSpacing(), (1.0, 1.0, 3.0))
+        self.assertTrue(np.array_equal(slicer.util.arrayFromVolume(volumeNode), frames[1]))
+
+        # copying voxels sends the same notifications
+        modifiedEvents.clear()
+        imageDataModifiedEvents.clear()
+        slicer.util.updateVolumeFromArray(volumeNode, frames[0])
+        self.assertEqual(len(modifiedEvents), 1)
+        self.assertEqual(len(imageDataModifiedEvents), 1)
+        volumeNode.RemoveObserver(modifiedObserver)
+        volumeNode.RemoveObserver(imageDataModifiedObserver)
+
+        # an image data is created if the volume node does not have one yet
+        emptyVolumeNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScalarVolumeNode")
+        imageDataModifiedEvents.clear()
+        imageDataModifiedObserver = emptyVolumeNode.AddObserver(slicer.vtkMRMLVolumeNode.ImageDataModifiedEvent,
+                                                                lambda caller, event: imageDataModifiedEvents.append(event))
+        slicer.util.updateVolumeFromArray(emptyVolumeNode, frames[0])
+        emptyVolumeNode.RemoveObserver(imageDataModifiedObserver)
+        self.assertEqual(len(imageDataModifiedEvents), 1)
+        self.assertTrue(np.array_equal(slicer.util.arrayFromVolume(emptyVolumeNode), frames[0]))
+        slicer.mrmlScene.RemoveNode(emptyVolumeNode)
+
+        self.delayDisplay("Test that the image data is reused when copying voxels")
+        frame1 = frames[1].copy()
+        slicer.util.updateVolumeFromArray(volumeNode, frames[2])
+        # the array that was shared before must not be overwritten
+        self.assertTrue(np.array_equal(frames[1], frame1))
+        self.assertFalse(np.shares_memory(slicer.util.arrayFromVolume(volumeNode), frames[1]))
+        scalars = volumeNode.GetImageData().GetPointData().GetScalars()
+        slicer.util.updateVolumeFromArray(volumeNode, frames[3])
+        self.assertEqual(volumeNode.GetImageData().GetPointData().GetScalars(), scalars)
+        self.assertFalse(np.shares_memory(slicer.util.arrayFromVolume(volumeNode), frames[3]))
+        self.assertTrue(np.array_equal(slicer.util.arrayFromVolume(volumeNode), frames[3]))
+
+        self.delayDisplay("Measure frame rate")
+        for shareMemory in [False, True]:
+            numberOfUpdates = 0
+            startTime = time.perf_counter()
+            for _ in range(5):
+                for frame in frames:
+                    slicer.util.updateVolumeFromArray(volumeNode, frame, shareMemory=shareMemory)
+                    numberOfUpdates += 1
+            framesPerSecond = numberOfUpdates / (time.perf_counter() - startTime)
+            logging.info(f"updateVolumeFromArray with shareMemory={shareMemory}: {framesPerSecond:.1f} frames per second")
+
+        self.delayDisplay("Testing slicer.util.updateVolumeFromArray with shared memory passed")
+
     def test_updateTableFromArray(self):
         # Test if updating table values from a numpy array works
         import numpy as np
@@ -284,6 +359,17 @@ class UtilTestTest(ScriptedLoadableModuleTest):
         self.assertEqual(tableNode3.GetColumnName(1), "height")
         self.assertEqual(tableNode3.GetColumnType("height"), vtk.VTK_INT)
 
+        self.delayDisplay("Test in-place update of existing columns")
+        heightColumn = tableNode3.GetTable().GetColumnByName("height")
+        modifiedEvents = []
+        observerTag = tableNode3.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: modifiedEvents.append(event))
+        structured_array["height"] += 1
+        slicer.util.updateTableFromArray(tableNode3, structured_array)
+        tableNode3.RemoveObserver(observerTag)
+        self.assertIs(tableNode3.GetTable().GetColumnByName("height"), heightColumn)
+        self.assertEqual(tableNode3.GetTable().GetValue(0, 1), 8860)
+        self.assertEqual(len(modifiedEvents), 1)
+
         self.delayDisplay("Test boolean array update")
         tableNode4 = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLTableNode")
         narray = np.array([True, False, True])
@@ -308,6 +394,43 @@ class UtilTestTest(ScriptedLoadableModuleTest):
 
         self.delayDisplay("Testing slicer.util.test_updateTableFromArray passed")
 
+    def test_arrayFromSegmentBinaryLabelmap(self):
+        # Test if segment voxels can be read and written as numpy arrays without adding nodes to the scene
+
+        import numpy as np
+
+        volumeNode = slicer.util.addVolumeFromArray(np.zeros((20, 30, 40), np.int16), name="Reference")
+        segmentationNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSegmentationNode")
+        segmentationNode.CreateDefaultDisplayNodes()
+        segmentationNode.SetReferenceImageGeometryParameterFromVolumeNode(volumeNode)
+        segmentIds = [segmentationNode.GetSegmentation().AddEmptySegment(f"Segment{i}") for i in range(3)]
+
+        numberOfNodes = slicer.mrmlScene.GetNumberOfNodes()
+
+        self.delayDisplay("Test segment update from array")
+        for segmentIndex, segmentId in enumerate(segmentIds):
+            narray = np.zeros((20, 30, 40), bool)
+            narray[2 + segmentIndex * 5:5 + segmentIndex * 5, 10:20, 5:15] = True
+            slicer.util.updateSegmentBinaryLabelmapFromArray(narray, segmentationNode, segmentId, volumeNode)
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodes(), numberOfNodes)
+
+        self.delayDisplay("Test segment read to array")
+        for segmentIndex, segmentId in enumerate(segmentIds):
+            narray = slicer.util.arrayFromSegmentBinaryLabelmap(segmentationNode, segmentId, volumeNode)
+            self.assertEqual(narray.shape, (20, 30, 40))
+            self.assertEqual(np.count_nonzero(narray), 3 * 10 * 10)
+            self.assertTrue(np.all(narray[2 + segmentIndex * 5:5 + segmentIndex * 5, 10:20, 5:15] == 1))
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodes(), numberOfNodes)
+
+        self.delayDisplay("Test shared labelmap layer access")
+        segmentationNode.GetSegmentation().CollapseBinaryLabelmaps(False)
+        for segmentId in segmentIds:
+            narray, labelValue, extent = slicer.util.arrayFromSegmentInternalBinaryLabelmapLayer(segmentationNode, segmentId)
+            self.assertEqual(narray.shape, (extent[5] - extent[4] + 1, extent[3] - extent[2] + 1, extent[1] - extent[0] + 1))
+            self.assertEqual(np.count_nonzero(narray == labelValue), 3 * 10 * 10)
+
+        self.delayDisplay("Testing slicer.util.test_arrayFromSegmentBinaryLabelmap passed")
+
     def test_arrayFromModelPoints(self):
         # Test if retrieving point coordinates as a numpy array works
 
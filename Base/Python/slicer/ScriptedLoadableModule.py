@@ -293,6 +293,122 @@ class ScriptedLoadableModuleWidget:
             qt.QDesktopServices.openUrl(qt.QUrl("file:///" + filePath, qt.QUrl.TolerantMode))
 
 
+class _ParameterNodeIndex:
+    """
+    Index of the scripted module nodes of a scene by their ModuleName attribute.
+
+    The index is updated when nodes are added to or removed from the scene, so that looking up the parameter
+    nodes of a module does not require iterating through all the scripted module nodes of the scene.
+    The ModuleName attribute may be set or changed after the node is added to the scene, therefore
+    modifications of the indexed nodes are observed and the node is moved to the new module name.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        # module name -> {node ID: node}, in the order the nodes were added to the scene
+        self._nodesByModuleName = {}
+        # node ID -> ModuleName attribute value when the node was last indexed (None if not set)
+        self._moduleNameByNodeID = {}
+        # node ID -> (node, observer tag, sequence number that defines the order of nodes)
+        self._indexedNodes = {}
+        self._nextSequenceNumber = 0
+        self._rebuild()
+        self._observerTags = [
+            scene.AddObserver(scene.NodeAddedEvent, self._onNodeAdded),
+            scene.AddObserver(scene.NodeRemovedEvent, self._onNodeRemoved),
+            # singleton nodes are kept (and their attributes may be changed) when the scene is closed or imported
+            scene.AddObserver(scene.EndCloseEvent, lambda caller, event: self._rebuild()),
+            scene.AddObserver(scene.EndImportEvent, lambda caller, event: self._rebuild()),
+        ]
+
+    def removeObservers(self):
+        for tag in self._observerTags:
+            self.scene.RemoveObserver(tag)
+        self._observerTags = []
+        self._removeNodeObservers()
+
+    def _removeNodeObservers(self):
+        for node, tag, _sequenceNumber in self._indexedNodes.values():
+            node.RemoveObserver(tag)
+        self._indexedNodes = {}
+
+    def _rebuild(self):
+        self._removeNodeObservers()
+        self._nodesByModuleName = {}
+        self._moduleNameByNodeID = {}
+        for nodeIndex in range(self.scene.GetNumberOfNodesByClass("vtkMRMLScriptedModuleNode")):
+            self._add(self.scene.GetNthNodeByClass(nodeIndex, "vtkMRMLScriptedModuleNode"))
+
+    def _add(self, node):
+        nodeID = node.GetID()
+        if nodeID in self._indexedNodes:
+            return
+        tag = node.AddObserver(vtk.vtkCommand.ModifiedEvent, self._onNodeModified)
+        self._indexedNodes[nodeID] = (node, tag, self._nextSequenceNumber)
+        self._nextSequenceNumber += 1
+        self._assign(nodeID, node, node.GetAttribute("ModuleName"))
+
+    def _remove(self, node):
+        nodeID = node.GetID()
+        self._unassign(nodeID)
+        indexedNode = self._indexedNodes.pop(nodeID, None)
+        if indexedNode is not None:
+            node.RemoveObserver(indexedNode[1])
+
+    def _assign(self, nodeID, node, moduleName):
+        self._moduleNameByNodeID[nodeID] = moduleName
+        if not moduleName:
+            return
+        nodes = self._nodesByModuleName.setdefault(moduleName, {})
+        nodes[nodeID] = node
+        if len(nodes) > 1:
+            lastNodeIDs = list(nodes.keys())[-2:]
+            if self._indexedNodes[lastNodeIDs[0]][2] > self._indexedNodes[lastNodeIDs[1]][2]:
+                # A node that was added to the scene earlier is moved to this module, restore the order
+                self._nodesByModuleName[moduleName] = dict(sorted(nodes.items(), key=lambda item: self._indexedNodes[item[0]][2]))
+
+    def _unassign(self, nodeID):
+        moduleName = self._moduleNameByNodeID.pop(nodeID, None)
+        if moduleName:
+            self._nodesByModuleName[moduleName].pop(nodeID, None)
+
+    @vtk.calldata_type(vtk.VTK_OBJECT)
+    def _onNodeAdded(self, caller, event, node):
+        if isinstance(node, slicer.vtkMRMLScriptedModuleNode):
+            self._add(node)
+
+    @vtk.calldata_type(vtk.VTK_OBJECT)
+    def _onNodeRemoved(self, caller, event, node):
+        if isinstance(node, slicer.vtkMRMLScriptedModuleNode):
+            self._remove(node)
+
+    def _onNodeModified(self, node, event):
+        nodeID = node.GetID()
+        if nodeID not in self._moduleNameByNodeID:
+            return
+        moduleName = node.GetAttribute("ModuleName")
+        if moduleName != self._moduleNameByNodeID[nodeID]:
+            self._unassign(nodeID)
+            self._assign(nodeID, node, moduleName)
+
+    def parameterNodes(self, moduleName):
+        """Return the list of scripted module nodes of the scene that have the ModuleName attribute set to moduleName."""
+        return list(self._nodesByModuleName.get(moduleName, {}).values())
+
+
+_parameterNodeIndex = None
+
+
+def _getParameterNodeIndex():
+    """Return the parameter node index of the application scene, create it if needed."""
+    global _parameterNodeIndex
+    if _parameterNodeIndex is None or _parameterNodeIndex.scene is not slicer.mrmlScene:
+        if _parameterNodeIndex is not None:
+            _parameterNodeIndex.removeObservers()
+        _parameterNodeIndex = _ParameterNodeIndex(slicer.mrmlScene)
+    return _parameterNodeIndex
+
+
 class ScriptedLoadableModuleLogic:
     def __init__(self, parent=None):
         super().__init__()
@@ -320,11 +436,9 @@ class ScriptedLoadableModuleLogic:
                     parameterNode.SetAttribute("ModuleName", self.moduleName)
                 return parameterNode
         else:
-            numberOfScriptedModuleNodes = slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLScriptedModuleNode")
-            for nodeIndex in range(numberOfScriptedModuleNodes):
-                parameterNode = slicer.mrmlScene.GetNthNodeByClass(nodeIndex, "vtkMRMLScriptedModuleNode")
-                if parameterNode.GetAttribute("ModuleName") == self.moduleName:
-                    return parameterNode
+            parameterNodes = _getParameterNodeIndex().parameterNodes(self.moduleName)
+            if parameterNodes:
+                return parameterNodes[0]
         # no parameter node was found for this module, therefore we add a new one now
         parameterNode = slicer.mrmlScene.AddNode(self.createParameterNode())
         return parameterNode
@@ -334,13 +448,7 @@ class ScriptedLoadableModuleLogic:
         Return a list of all parameter nodes for this module
         Multiple parameter nodes are useful for storing multiple parameter sets in a single scene.
         """
-        foundParameterNodes = []
-        numberOfScriptedModuleNodes = slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLScriptedModuleNode")
-        for nodeIndex in range(numberOfScriptedModuleNodes):
-            parameterNode = slicer.mrmlScene.GetNthNodeByClass(nodeIndex, "vtkMRMLScriptedModuleNode")
-            if parameterNode.GetAttribute("ModuleName") == self.moduleName:
-                foundParameterNodes.append(parameterNode)
-        return foundParameterNodes
+        return _getParameterNodeIndex().parameterNodes(self.moduleName)
 
     def createParameterNode(self):
         """
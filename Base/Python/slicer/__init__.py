@@ -175,7 +175,16 @@ For more details, see the generated Slicer API documentation.
 import vtk  # noqa: F401
 
 # -----------------------------------------------------------------------------
-# Load modules: Add VTK and PythonQt python module attributes into slicer namespace
+# Load modules: Make VTK and PythonQt python module attributes available in slicer namespace
+#
+# Attributes of the kits (e.g. slicer.vtkMRMLScalarVolumeNode) are not copied into the slicer
+# namespace at startup but looked up in the kits the first time they are accessed (see __getattr__).
+#
+# VTK-based kits are still imported here: the classes they wrap must be registered before any
+# of their instances is passed to Python, otherwise these objects would be wrapped using the
+# nearest registered base class (e.g. a vtkMRMLScene object would be wrapped as vtkObject).
+# PythonQt kits only provide access to classes that are registered in PythonQt at application
+# startup, therefore they are imported when one of their attributes is first accessed.
 
 try:
     from .kits import available_kits
@@ -187,28 +196,72 @@ import sys
 
 standalone_python = "python" in str.lower(os.path.split(sys.executable)[-1])
 
-for kit in available_kits:
-    # skip PythonQt kits if we are running in a regular python interpreter
-    if standalone_python and "PythonQt" in kit:
-        continue
+# skip PythonQt kits if we are running in a regular python interpreter
+_kitNames = [kit for kit in available_kits if not (standalone_python and "PythonQt" in kit)]
 
-    try:
-        exec("from %s import *" % (kit))
-    except ImportError as detail:
-        print(detail)
+# Kit modules that have been imported, in the order of lookup (last kit has priority,
+# as it was the case when all the kit attributes were imported using "from kit import *")
+_kitModules = {}
+
+
+def _importKit(kit):
+    import importlib
+
+    if kit not in _kitModules:
+        try:
+            _kitModules[kit] = importlib.import_module(kit)
+        except ImportError as detail:
+            print(detail)
+            _kitModules[kit] = None
+    return _kitModules[kit]
+
+
+for _kit in _kitNames:
+    if "PythonQt" not in _kit:
+        _importKit(_kit)
+    del _kit
+
+# Heavy scientific modules that are imported when first accessed as slicer attribute
+_lazyModuleNames = ("numpy", "scipy")
+
+
+def __getattr__(name):
+    """Look up attributes that are not yet set in the slicer namespace in the kits."""
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _lazyModuleNames:
+        import importlib
+
+        return importlib.import_module(name)
+    for kit in reversed(_kitNames):
+        module = _importKit(kit)
+        if module is None or not hasattr(module, name):
+            continue
+        value = getattr(module, name)
+        # Store in the namespace so that next time the attribute is found without a lookup
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    names = set(globals())
+    for kit in _kitNames:
+        module = _importKit(kit)
+        if module is not None:
+            names.update(name for name in dir(module) if not name.startswith("_"))
+    return sorted(names)
 
-    del kit
 
 # -----------------------------------------------------------------------------
 # Import numpy and scipy early, as a workaround for application hang in import
 # of numpy or scipy at application startup on Windows 11 due to output redirection
 # (only needed for embedded Python, not for standalone).
 # See details in https://github.com/Slicer/Slicer/issues/5945
-# While the workaround is only needed for Windows 11, it is performed on
-# all operating systems to minimize differences of the startup process
-# between different platforms.
+# On other operating systems, numpy and scipy are imported when first used,
+# as importing them takes a significant portion of the application startup time.
 
-if not standalone_python:
+if not standalone_python and sys.platform == "win32":
     try:
         import numpy  # noqa: F401
         import scipy  # noqa: F401
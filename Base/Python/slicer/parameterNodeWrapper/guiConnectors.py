@@ -108,6 +108,22 @@ class GuiConnector(abc.ABC):
         """Writes the given value to the widget."""
         raise NotImplementedError("Must implement write")
 
+    def update(self, value) -> int:
+        """
+        Writes the given value to the widget, unless the widget already shows it.
+        Skipping the write avoids triggering widget signals and layout updates needlessly.
+
+        Returns the number of widgets that were written.
+        """
+        try:
+            if self.read() == value:
+                return 0
+        except Exception:
+            # if the widget value cannot be read or compared, just write it
+            pass
+        self.write(value)
+        return 1
+
 
 _registeredGuiConnectors = []
 
@@ -838,3 +854,6 @@ class WidgetChildrenToParameterPackConnector(GuiConnector):
     def write(self, value: str) -> None:
         for name, connector in self._nameToConnectorMap.items():
             connector.write(value.getValue(name))
+
+    def update(self, value) -> int:
+        return sum(connector.update(value.getValue(name)) for name, connector in self._nameToConnectorMap.items())
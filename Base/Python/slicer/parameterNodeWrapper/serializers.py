@@ -4,6 +4,7 @@ import abc
 import collections
 import enum
 import importlib
+import json
 import logging
 import pathlib
 import typing
@@ -492,6 +493,8 @@ class ObservedList(collections.abc.MutableSequence):
     A list-like object that updates its associated parameter node when the container is updated.
     Modification operations are supported (append, +=, __setitem__, etc), but non-modifying list
     operations are not (+, *) as it would be too easy to accidentally make non-observable changes.
+
+    Only the elements affected by a modification are written to the parameter node.
     """
 
     def __init__(self, parameterNode, listSerializer, name, startingValue):
@@ -506,15 +509,27 @@ class ObservedList(collections.abc.MutableSequence):
     def __str__(self):
         return f"ObservedList({str(self._list)})"
 
-    def _saveList(self) -> None:
+    def _saveList(self, start=0, stop=None) -> None:
+        """
+        Writes the list to the parameter node. Elements outside of the [start, stop) range must not have changed
+        since the last save (they may have been removed from the end of the list though).
+        """
+        stop = len(self._list) if stop is None else stop
         try:
-            self._serializer.write(self._parameterNode, self._name, self._list)
-        finally:
-            # resetting the _list here helps if there are nested lists and someone does something like
-            #    m = parameterNode.listOfLists
-            #    m.append([1]) <-- this will seamlessly become an ObservedList so the next line works
-            #    m[0][0] = 2
+            savedElements = self._serializer._writeChanged(self._parameterNode, self._name, self._list, start, stop)
+        except Exception:
+            # the serializer restored the parameter node, get the list back in sync with it
             self._list = self._serializer.read(self._parameterNode, self._name)._list
+            raise
+        # replacing the saved elements with what was written helps if there are nested lists and someone does something like
+        #    m = parameterNode.listOfLists
+        #    m.append([1]) <-- this will seamlessly become an ObservedList so the next line works
+        #    m[0][0] = 2
+        self._list[start:stop] = savedElements
+
+    @staticmethod
+    def _normalizeIndex(index, length):
+        return index + length if index < 0 else index
 
     def __eq__(self, other) -> bool:
         if isinstance(other, ObservedList):
@@ -530,15 +545,23 @@ class ObservedList(collections.abc.MutableSequence):
 
     def __delitem__(self, index):
         self._list.__delitem__(index)
-        self._saveList()
+        if isinstance(index, slice):
+            self._saveList()
+        else:
+            self._saveList(self._normalizeIndex(index, len(self._list) + 1))
 
     def __setitem__(self, index, item):
         self._list.__setitem__(index, item)
-        self._saveList()
+        if isinstance(index, slice):
+            self._saveList()
+        else:
+            index = self._normalizeIndex(index, len(self._list))
+            self._saveList(index, index + 1)
 
     def __iadd__(self, other):
+        oldLen = len(self._list)
         self._list.__iadd__(other)
-        self._saveList()
+        self._saveList(oldLen)
         return self
 
     def __add__(self, other):
@@ -548,8 +571,9 @@ class ObservedList(collections.abc.MutableSequence):
         raise NotImplementedError("Adding an ObservedList is not supported. However, += is supported.")
 
     def __imul__(self, other):
+        oldLen = len(self._list)
         self._list.__imul__(other)
-        self._saveList()
+        self._saveList(min(oldLen, len(self._list)))
         return self
 
     def __mul__(self, other):
@@ -560,23 +584,27 @@ class ObservedList(collections.abc.MutableSequence):
 
     def append(self, item) -> None:
         self._list.append(item)
-        self._saveList()
+        self._saveList(len(self._list) - 1)
 
     def extend(self, other) -> None:
+        oldLen = len(self._list)
         self._list.extend(other)
-        self._saveList()
+        self._saveList(oldLen)
 
     def insert(self, index, item) -> None:
+        oldLen = len(self._list)
         self._list.insert(index, item)
-        self._saveList()
+        self._saveList(max(0, min(oldLen, self._normalizeIndex(index, oldLen))))
 
     def remove(self, item) -> None:
-        self._list.remove(item)
-        self._saveList()
+        index = self._list.index(item)
+        del self._list[index]
+        self._saveList(index)
 
     def pop(self, i=-1):
+        index = self._normalizeIndex(i, len(self._list))
         val = self._list.pop(i)
-        self._saveList()
+        self._saveList(index)
         return val
 
     def clear(self) -> None:
@@ -592,6 +620,49 @@ class ObservedList(collections.abc.MutableSequence):
         self._saveList()
 
 
+def _makeCompactCodec(serializer):
+    """
+    Returns an (encode, decode) pair of functions that convert values of the given serializer to and from
+    values that can be stored in JSON, or None if the serializer's values cannot be stored this way.
+
+    Only primitive types (int, float, str, bool) and tuples of them are supported. encode runs the
+    validators of the serializer.
+    """
+    validators = []
+    if isinstance(serializer, ValidatedSerializer):
+        validators = serializer.validators or []
+        serializer = serializer.serializer
+
+    if type(serializer) is NumberSerializer:
+        convert = decode = serializer.type
+    elif type(serializer) is StringSerializer:
+        convert = decode = str
+    elif type(serializer) is BoolSerializer:
+        convert = decode = bool
+    elif type(serializer) is TupleSerializer:
+        codecs = [_makeCompactCodec(s) for s in serializer._serializers]
+        if any(codec is None for codec in codecs):
+            return None
+
+        def convert(value):
+            value = tuple(value)
+            if len(value) != len(codecs):
+                raise ValueError("Unexpected number of tuple values")
+            return [encodeItem(item) for (encodeItem, _), item in zip(codecs, value)]
+
+        def decode(value):
+            return tuple(decodeItem(item) for (_, decodeItem), item in zip(codecs, value))
+    else:
+        return None
+
+    def encode(value):
+        for validator in validators:
+            validator.validate(value)
+        return convert(value)
+
+    return encode, decode
+
+
 @parameterNodeSerializer
 class ListSerializer(Serializer):
     """Serializer for lists of a type."""
@@ -615,9 +686,13 @@ class ListSerializer(Serializer):
         """
         Constructs a ListSerializer. The elements will be serialized/deserialized with the
         given elementTypeSerializer.
+
+        Lists of primitive types (int, float, str, bool) or tuples of them are stored compactly, as a
+        single JSON-encoded parameter. Other lists store the length and each element as separate parameters.
         """
         self._elementSerializer = elementTypeSerializer
         self._lenSerializer = NumberSerializer(int)
+        self._compactCodec = _makeCompactCodec(elementTypeSerializer)
 
     def default(self):
         return []
@@ -628,8 +703,12 @@ class ListSerializer(Serializer):
     def _paramName(self, name, index):
         return f"{name}.{index}"
 
+    def _isCompactIn(self, parameterNode, name) -> bool:
+        return self._compactCodec is not None and parameterNode.HasParameter(name)
+
     def _len(self, parameterNode, name) -> int:
-        if self.isIn(parameterNode, name):
+        """Number of elements stored as separate parameters."""
+        if self._lenSerializer.isIn(parameterNode, self._lenName(name)):
             return self._lenSerializer.read(parameterNode, self._lenName(name))
         else:
             return 0
@@ -638,51 +717,90 @@ class ListSerializer(Serializer):
         self._lenSerializer.write(parameterNode, self._lenName(name), length)
 
     def isIn(self, parameterNode, name: str) -> bool:
-        return self._lenSerializer.isIn(parameterNode, self._lenName(name))
+        return self._isCompactIn(parameterNode, name) or self._lenSerializer.isIn(parameterNode, self._lenName(name))
+
+    def _removeElements(self, parameterNode, name) -> None:
+        for index in range(self._len(parameterNode, name)):
+            self._elementSerializer.remove(parameterNode, self._paramName(name, index))
+        self._lenSerializer.remove(parameterNode, self._lenName(name))
+
+    def _writeCompact(self, parameterNode, name, values) -> list:
+        encode, decode = self._compactCodec
+        # encode all the values first, so that nothing is written if any of them is invalid
+        encodedValues = [encode(value) for value in values]
+        with slicer.util.NodeModify(parameterNode):
+            # switch from storing elements as separate parameters (e.g. list read from an older scene)
+            self._removeElements(parameterNode, name)
+            parameterNode.SetParameter(name, json.dumps(encodedValues, separators=(",", ":")))
+        return [decode(value) for value in encodedValues]
+
+    def _writeElements(self, parameterNode, name, values, start, stop) -> None:
+        """Writes elements in the [start, stop) range as separate parameters and updates the length."""
 
-    def write(self, parameterNode, name: str, values) -> None:
         def paramName(index):
             return self._paramName(name, index)
 
         with slicer.util.NodeModify(parameterNode):
-            oldValues = self.read(parameterNode, name) if self.isIn(parameterNode, name) else None
             oldLen = self._len(parameterNode, name)
             newLen = len(values)
+            # only the overwritten elements need to be restored on failure
+            oldValues = [self._elementSerializer.read(parameterNode, paramName(index))
+                         for index in range(start, min(stop, oldLen))]
 
             try:
-                for index, value in enumerate(values):
-                    self._elementSerializer.write(parameterNode, paramName(index), value)
-
-                self._setLen(parameterNode, name, newLen)
-                # unset any items that we no longer have indices for
-                for index in range(newLen, oldLen):
-                    self._elementSerializer.remove(parameterNode, paramName(index))
+                for index in range(start, stop):
+                    self._elementSerializer.write(parameterNode, paramName(index), values[index])
             except Exception:
                 # reset our state back to what it was on exception
-                if oldValues is None:
-                    self.remove(parameterNode, name)
-                else:
-                    self.write(parameterNode, name, oldValues)
+                for index in range(start, stop):
+                    if index < oldLen:
+                        self._elementSerializer.write(parameterNode, paramName(index), oldValues[index - start])
+                    else:
+                        self._elementSerializer.remove(parameterNode, paramName(index))
                 raise
 
-    def read(self, parameterNode, name):
-        def paramName(index):
-            return self._paramName(name, index)
+            self._setLen(parameterNode, name, newLen)
+            # unset any items that we no longer have indices for
+            for index in range(newLen, oldLen):
+                self._elementSerializer.remove(parameterNode, paramName(index))
+
+    def _readElements(self, parameterNode, name, start, stop) -> list:
+        return [self._elementSerializer.read(parameterNode, self._paramName(name, index))
+                for index in range(start, stop)]
+
+    def _writeChanged(self, parameterNode, name, values, start, stop) -> list:
+        """
+        Writes a list in which only elements in the [start, stop) range changed since it was last written
+        (elements may also have been removed from the end).
+
+        :return: the elements in the [start, stop) range as they are read back from the parameter node.
+        """
+        if self._compactCodec is not None:
+            return self._writeCompact(parameterNode, name, values)[start:stop]
+        self._writeElements(parameterNode, name, values, start, stop)
+        return self._readElements(parameterNode, name, start, stop)
+
+    def write(self, parameterNode, name: str, values) -> None:
+        values = list(values)
+        if self._compactCodec is not None:
+            self._writeCompact(parameterNode, name, values)
+        else:
+            self._writeElements(parameterNode, name, values, 0, len(values))
 
-        ret = [self._elementSerializer.read(parameterNode, paramName(index))
-               for index in range(self._len(parameterNode, name))]
+    def read(self, parameterNode, name):
+        if self._isCompactIn(parameterNode, name):
+            _, decode = self._compactCodec
+            ret = [decode(value) for value in json.loads(parameterNode.GetParameter(name))]
+        else:
+            ret = self._readElements(parameterNode, name, 0, self._len(parameterNode, name))
         return ObservedList(parameterNode, self, name, ret)
 
     def remove(self, parameterNode, name: str) -> None:
         """Removes this parameter from the node if it exists."""
-
-        def paramName(index):
-            return self._paramName(name, index)
-
         with slicer.util.NodeModify(parameterNode):
-            for index in range(self._len(parameterNode, name)):
-                self._elementSerializer.remove(parameterNode, paramName(index))
-            self._lenSerializer.remove(parameterNode, self._lenName(name))
+            if self._compactCodec is not None:
+                parameterNode.UnsetParameter(name)
+            self._removeElements(parameterNode, name)
 
     def supportsCaching(self) -> bool:
         """
@@ -774,11 +892,27 @@ class ObservedDict(collections.abc.MutableMapping):
     def __str__(self) -> str:
         return f"ObservedDict({str(self._dict)})"
 
-    def _saveDict(self) -> None:
+    def _saveDict(self, start=0, stop=None) -> None:
+        """
+        Writes the dict to the parameter node. Only items in the [start, stop) range (in iteration order)
+        may have changed since the last save (items may also have been removed from the end).
+        """
+        items = list(self._dict.items())
+        stop = len(items) if stop is None else stop
         try:
-            self._serializer.write(self._parameterNode, self._name, self._dict)
-        finally:
-            self._dict = self._serializer.read(self._parameterNode, self._name)
+            savedItems = self._serializer._writeChanged(self._parameterNode, self._name, items, start, stop)
+        except Exception:
+            # the serializer restored the parameter node, get the dict back in sync with it
+            self._dict = self._serializer.read(self._parameterNode, self._name)._dict
+            raise
+        for key, value in savedItems:
+            self._dict[key] = value
+
+    def _keyIndex(self, key) -> int:
+        for index, existingKey in enumerate(self._dict):
+            if existingKey == key:
+                return index
+        raise KeyError(key)
 
     def __eq__(self, other) -> bool:
         if isinstance(other, ObservedDict):
@@ -796,12 +930,14 @@ class ObservedDict(collections.abc.MutableMapping):
         return self._dict[key]
 
     def __delitem__(self, key):
+        index = self._keyIndex(key)
         del self._dict[key]
-        self._saveDict()
+        self._saveDict(index)
 
     def __setitem__(self, key, value):
+        index = self._keyIndex(key) if key in self._dict else len(self._dict)
         self._dict[key] = value
-        self._saveDict()
+        self._saveDict(index, index + 1)
 
     def __contains__(self, key):
         return key in self._dict
@@ -822,19 +958,24 @@ class ObservedDict(collections.abc.MutableMapping):
         return self._dict.get(key)
 
     def pop(self, key):
+        index = self._keyIndex(key)
         ret = self._dict.pop(key)
-        self._saveDict()
+        self._saveDict(index)
         return ret
 
     def popitem(self):
         ret = self._dict.popitem()
-        self._saveDict()
+        self._saveDict(len(self._dict))
         return ret
 
     def clear(self):
         self._dict.clear()
         self._saveDict()
 
+    def update(self, *args, **kwargs):
+        self._dict.update(*args, **kwargs)
+        self._saveDict()
+
 
 @parameterNodeSerializer
 class DictSerializer(Serializer):
@@ -874,6 +1015,9 @@ class DictSerializer(Serializer):
     def write(self, parameterNode, name: str, dictionary) -> None:
         self._serializer.write(parameterNode, name, dictionary.items())
 
+    def _writeChanged(self, parameterNode, name: str, items, start, stop) -> list:
+        return self._serializer._writeChanged(parameterNode, name, items, start, stop)
+
     def read(self, parameterNode, name: str):
         tuples = self._serializer.read(parameterNode, name)
         return ObservedDict(parameterNode, self, name, dict(tuples))
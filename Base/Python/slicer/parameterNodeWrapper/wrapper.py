@@ -81,24 +81,102 @@ class _ParameterWrapper:
         return self.parameter.supportsCaching()
 
 
-class _CachedParameterWrapper(_ParameterWrapper):
-    def __init__(self, parameter: _Parameter, parameterNode):
-        super().__init__(parameter, parameterNode)
-        self._value = self.parameter.read(self.parameterNode)
+class _ParameterCache:
+    """
+    Tracks which parameters of a parameter node wrapper change and keeps the values of the cached parameters
+    in sync with the parameter node.
+
+    A single observer is added to the parameter node. When the node is modified, the modified count of the
+    parameters whose stored strings or node references changed is incremented, and only those parameters
+    are read and deserialized again.
+    """
+
+    ObserverPriority = 100.0
+
+    def __init__(self, parameterNode):
+        self.parameterNode = parameterNode
+        # cached parameter wrapper for each parameter name (None if the parameter is not cached)
+        self._parameters: dict[str, Optional[_CachedParameterWrapper]] = {}
+        # For each parameter, the (key, value, node reference ID) of all the parameter node entries it is stored in
+        self._states: dict[str, tuple] = {}
+        self._modifiedCounts: dict[str, int] = {}
         # Important: We don't want to increase the reference to self here by including it in the AddObserver callback.
         # This would prevent the object from being garbage collected, and the observers from being removed when the object goes out of scope.
         # Instead, we create a weakref to self and use it in a lambda function.
         _selfWeakRef = weakref.ref(self)
-        self._observerTag: int = parameterNode.AddObserver(vtk.vtkCommand.ModifiedEvent,
-                                                           lambda caller, event: _selfWeakRef()._onModified(caller, event))
-        self._currentlyWriting: bool = False
+
+        def onModified(caller, event):
+            cache = _selfWeakRef()
+            if cache is not None:
+                cache._onModified(caller, event)
+
+        # VTK calls observers with the same priority in reverse order of addition. Use a higher priority
+        # so that the cached values are up to date in all other observers (e.g., the GUI update).
+        self._observerTag: int = parameterNode.AddObserver(vtk.vtkCommand.ModifiedEvent, onModified, _ParameterCache.ObserverPriority)
 
     def __del__(self):
         self.parameterNode.RemoveObserver(self._observerTag)
 
+    def add(self, name: str, cachedParameter: Optional["_CachedParameterWrapper"] = None) -> None:
+        self._parameters[name] = cachedParameter
+        self._modifiedCounts[name] = 0
+        self.updateState(name)
+
+    def modifiedCount(self, name: str) -> int:
+        """Returns a number that is incremented each time the value of the parameter changes in the parameter node."""
+        return self._modifiedCounts[name]
+
+    def _parameterNameForKey(self, key: str) -> Optional[str]:
+        # Serializers store values under the parameter name or under names derived from it by appending ".suffix"
+        name = key
+        while name not in self._parameters:
+            if "." not in name:
+                return None
+            name = name.rsplit(".", 1)[0]
+        return name
+
+    def _readStates(self, names=None) -> dict[str, tuple]:
+        states = {name: [] for name in (self._parameters if names is None else names)}
+        for key in self.parameterNode.GetParameterNames():
+            name = self._parameterNameForKey(key)
+            if name not in states:
+                continue
+            value = self.parameterNode.GetParameter(key)
+            # node references are stored using the parameter name as role, with an empty parameter value
+            referenceID = self.parameterNode.GetNodeReferenceID(key) if not value else None
+            states[name].append((key, value, referenceID))
+        return {name: tuple(state) for name, state in states.items()}
+
+    def _setState(self, name: str, state: tuple) -> bool:
+        if state == self._states.get(name):
+            return False
+        self._states[name] = state
+        self._modifiedCounts[name] += 1
+        return True
+
+    def updateState(self, name: str) -> None:
+        """Records the current state of the parameter, so the next modification only refreshes it if it changed."""
+        self._setState(name, self._readStates([name])[name])
+
     def _onModified(self, caller, event):
-        if not self._currentlyWriting:
-            self._value = self.parameter.read(self.parameterNode)
+        for name, state in self._readStates().items():
+            if not self._setState(name, state):
+                continue
+            cachedParameter = self._parameters[name]
+            if cachedParameter is not None and not cachedParameter._currentlyWriting:
+                cachedParameter._value = cachedParameter.parameter.read(self.parameterNode)
+
+
+class _CachedParameterWrapper(_ParameterWrapper):
+    def __init__(self, parameter: _Parameter, parameterNode, cache: _ParameterCache):
+        super().__init__(parameter, parameterNode)
+        self._value = self.parameter.read(self.parameterNode)
+        # The cache refers to this object, so only a weak reference is kept to the cache. Otherwise the
+        # reference cycle would delay deleting the cache (and removing its parameter node observer)
+        # until the next garbage collection.
+        self._cacheRef = weakref.ref(cache)
+        self._currentlyWriting: bool = False
+        cache.add(parameter.name, self)
 
     def write(self, value) -> None:
         self._currentlyWriting = True
@@ -109,6 +187,9 @@ class _CachedParameterWrapper(_ParameterWrapper):
             with slicer.util.NodeModify(self.parameterNode):
                 super().write(value)
                 self._value = self.parameter.read(self.parameterNode)
+                cache = self._cacheRef()
+                if cache is not None:
+                    cache.updateState(self.parameter.name)
         finally:
             self._currentlyWriting = False
 
@@ -130,17 +211,23 @@ def _makeProperty(name: str):
 def _initMethod(self, parameterNode, prefix: Optional[str] = None):
     self.parameterNode = parameterNode
     self._parameterGUIs = dict()
+    # modified count of the parameters when they were last written to the connected GUIs
+    self._parameterGUIModifiedCounts = dict()
     self._nextParameterGUIsTag = 0
     self._updatingGUIFromParameterNode = False
+    self._guiObserverTag = None
+    self._guiUpdateWidgetWriteCount = 0
+    self._parameterCache = _ParameterCache(parameterNode)
     for parameterInfo in self.allParameters.values():
         parameter = _Parameter(parameterInfo, prefix)
         if not parameter.isIn(self.parameterNode):
             parameter.write(self.parameterNode, parameter.default.value)
 
         if parameter.supportsCaching():
-            setattr(self, f"_{parameterInfo.basename}_impl", _CachedParameterWrapper(parameter, parameterNode))
+            setattr(self, f"_{parameterInfo.basename}_impl", _CachedParameterWrapper(parameter, parameterNode, self._parameterCache))
         else:
             setattr(self, f"_{parameterInfo.basename}_impl", _ParameterWrapper(parameter, parameterNode))
+            self._parameterCache.add(parameter.name)
 
 
 def _checkParamName(paramNodeWrapInstanceOrClass, paramName: str):
@@ -169,6 +256,20 @@ def _default(self, paramName: str):
     return getattr(self, f"_{paramName}_impl").parameter.default
 
 
+def _batchModify(self):
+    """
+    Returns a context manager that combines all the parameter changes made within it into a single
+    ModifiedEvent of the parameter node, and therefore a single update of the connected GUIs.
+
+    .. code-block:: python
+
+      with parameterNode.batchModify():
+          parameterNode.threshold = 100
+          parameterNode.iterations = 5
+    """
+    return slicer.util.NodeModify(self.parameterNode)
+
+
 def _makeGuiToParamCallback(self, paramName, connector):
     def callback():
         with slicer.util.NodeModify(self):
@@ -178,19 +279,41 @@ def _makeGuiToParamCallback(self, paramName, connector):
     return callback
 
 
+def _parameterModifiedCount(self, paramName) -> int:
+    topname, _ = splitPossiblyDottedName(paramName)
+    return self._parameterCache.modifiedCount(getattr(self, f"_{topname}_impl").parameter.name)
+
+
 def _updateGUIFromParameterNode(self):
     if self._updatingGUIFromParameterNode:
         return
     try:
         self._updatingGUIFromParameterNode = True
+        widgetWriteCount = 0
         with slicer.util.NodeModify(self):
-            for guiMapping in self._parameterGUIs.values():
+            for tag, guiMapping in self._parameterGUIs.items():
+                guiModifiedCounts = self._parameterGUIModifiedCounts[tag]
                 for paramName, connector in guiMapping.items():
-                    connector.write(self.getValue(paramName))
+                    # only refresh widgets of parameters that changed since the last update
+                    modifiedCount = _parameterModifiedCount(self, paramName)
+                    if guiModifiedCounts.get(paramName) == modifiedCount:
+                        continue
+                    widgetWriteCount += connector.update(self.getValue(paramName))
+                    guiModifiedCounts[paramName] = modifiedCount
+        self._guiUpdateWidgetWriteCount = widgetWriteCount
     finally:
         self._updatingGUIFromParameterNode = False
 
 
+def _guiUpdateWidgetWriteCount(self) -> int:
+    """
+    Returns the number of widgets that were written by the most recent update of the connected GUIs
+    from the parameter node. Widgets of unchanged parameters and widgets already showing the
+    parameter value are not written. Mainly useful for performance testing.
+    """
+    return self._guiUpdateWidgetWriteCount
+
+
 def _connectParametersToGui(self, mapping):
     # error checking up front
     for paramName in mapping.keys():
@@ -204,12 +327,16 @@ def _connectParametersToGui(self, mapping):
     tag = self._nextParameterGUIsTag
     self._nextParameterGUIsTag += 1
     self._parameterGUIs[tag] = mappingToConnector
+    self._parameterGUIModifiedCounts[tag] = dict()
 
     for paramName, connector in mappingToConnector.items():
         connector.write(self.getValue(paramName))
+        self._parameterGUIModifiedCounts[tag][paramName] = _parameterModifiedCount(self, paramName)
         connector.onChanged(_makeGuiToParamCallback(self, paramName, connector))
 
-    self.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: _updateGUIFromParameterNode(self))
+    # a single observer updates all the connected GUIs
+    if self._guiObserverTag is None:
+        self._guiObserverTag = self.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: _updateGUIFromParameterNode(self))
     return tag
 
 
@@ -258,6 +385,7 @@ def _disconnectGui(self, guiTag):
         for _, connector in self._parameterGUIs[guiTag].items():
             connector.onChanged(None)  # remove callback
         del self._parameterGUIs[guiTag]
+        del self._parameterGUIModifiedCounts[guiTag]
 
 
 def _getValue(self, name):
@@ -343,6 +471,8 @@ def _processClass(classtype):
     checkedSetAttr(classtype, "connectGui", _connectGui)
     checkedSetAttr(classtype, "connectParametersToGui", _connectParametersToGui)
     checkedSetAttr(classtype, "disconnectGui", _disconnectGui)
+    checkedSetAttr(classtype, "guiUpdateWidgetWriteCount", _guiUpdateWidgetWriteCount)
+    checkedSetAttr(classtype, "batchModify", _batchModify)
     checkedSetAttr(classtype, "StartModify", lambda self: self.parameterNode.StartModify())
     checkedSetAttr(classtype, "EndModify", lambda self, wasModified: self.parameterNode.EndModify(wasModified))
     checkedSetAttr(classtype, "AddObserver", lambda self, event, callback, priority=0.0: self.parameterNode.AddObserver(event, callback, priority))
@@ -21,3 +21,13 @@ class SlicerEnvironmentTests(unittest.TestCase):
         env = slicer.app.environment()
         assert isinstance(env, qt.QProcessEnvironment)
         assert "Slicer-build" in env.value("PATH")
+
+    def test_slicer_kit_attributes(self):
+        # Kit attributes are looked up when first accessed
+        assert isinstance(slicer.vtkMRMLScalarVolumeNode(), slicer.vtkMRMLNode)
+        assert "vtkMRMLScalarVolumeNode" in dir(slicer)
+        from slicer import vtkMRMLScene
+        assert isinstance(slicer.mrmlScene, vtkMRMLScene)
+        assert issubclass(slicer.qSlicerWidget, qt.QWidget)
+        with self.assertRaises(AttributeError):
+            slicer.nonExistentAttribute
@@ -220,6 +220,53 @@ class TypedParameterNodeTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             param.isCached("notExistentParameter")
 
+    def test_cache_refresh(self):
+        @parameterNodeWrapper
+        class ParameterNodeType:
+            i: int
+            values: list[int]
+            node: vtkMRMLModelNode
+
+        param = ParameterNodeType(newParameterNode())
+        values = param.values
+
+        # changing a parameter does not read the other cached parameters again
+        param.i = 5
+        self.assertIs(param.values, values)
+        modelNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLModelNode")
+        param.node = modelNode
+        self.assertIs(param.values, values)
+
+        # changes made directly in the parameter node are picked up
+        param.parameterNode.SetParameter("i", "7")
+        self.assertEqual(param.i, 7)
+        self.assertIs(param.values, values)
+        param.parameterNode.SetParameter("values", "[1,2]")
+        self.assertEqual(param.values, [1, 2])
+        slicer.mrmlScene.RemoveNode(modelNode)
+        self.assertIsNone(param.node)
+
+        # observers added after the wrapper was created get the refreshed values
+        observedValues = []
+        tag = param.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: observedValues.append((param.i, param.values)))
+        param.parameterNode.SetParameter("i", "8")
+        param.parameterNode.SetParameter("values", "[2,3]")
+        param.RemoveObserver(tag)
+        self.assertEqual(observedValues, [(8, [1, 2]), (8, [2, 3])])
+
+        # batched changes
+        modifiedEvents = []
+        tag = param.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: modifiedEvents.append(event))
+        with param.batchModify():
+            param.i = 1
+            param.values.append(3)
+            param.values = [4, 5]
+            self.assertEqual(param.i, 1)
+            self.assertEqual(param.values, [4, 5])
+        param.RemoveObserver(tag)
+        self.assertEqual(len(modifiedEvents), 1)
+        self.assertEqual(ParameterNodeType(param.parameterNode).values, [4, 5])
+
     def test_custom_validator(self):
         class Is777Or778(Validator):
             @staticmethod
@@ -452,6 +499,34 @@ class TypedParameterNodeTest(unittest.TestCase):
         self.assertEqual(param2.single, "hello")
         self.assertEqual(param2.multi, [4, 5, 6])
 
+    def test_cache_released_without_garbage_collection(self):
+        import gc
+        import weakref
+
+        @parameterNodeWrapper
+        class ParameterNodeType:
+            x: int
+            y: list[int]
+
+        parameterNode = newParameterNode()
+        gcWasEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            param = ParameterNodeType(parameterNode)
+            param.x = 3
+            cacheRef = weakref.ref(param._parameterCache)
+            del param
+            # The cache (and with it the parameter node observer) is removed as soon as the wrapper
+            # is released, it does not have to wait for the cyclic garbage collector
+            self.assertIsNone(cacheRef())
+        finally:
+            if gcWasEnabled:
+                gc.enable()
+
+        # The parameter node can still be modified and wrapped again
+        parameterNode.Modified()
+        self.assertEqual(ParameterNodeType(parameterNode).x, 3)
+
     def test_list_int(self):
         @parameterNodeWrapper
         class ParameterNodeType:
@@ -751,6 +826,61 @@ class TypedParameterNodeTest(unittest.TestCase):
         self.assertEqual(param.a[1], ["c"])
         self.assertEqual(list(param.a.items()), [(0, ["a", "b", "q", "r"]), (1, ["c"])])
 
+    def test_list_dict_compact_storage(self):
+        @parameterNodeWrapper
+        class ParameterNodeType:
+            points: list[tuple[float, float, float]]
+            ids: list[str]
+            counts: dict[str, int]
+            nested: list[list[int]]
+
+        param = ParameterNodeType(newParameterNode())
+        modifiedEvents = []
+        tag = param.AddObserver(vtk.vtkCommand.ModifiedEvent, lambda caller, event: modifiedEvents.append(event))
+
+        # each mutation causes exactly one modified event
+        param.points += [(float(i), 0.0, 1.0) for i in range(1000)]
+        param.points.append((1, 2, 3))
+        param.points[5] = (-1.0, -2.0, -3.0)
+        param.ids.append("a")
+        param.counts["a"] = 1
+        param.counts["b"] = 2
+        del param.counts["a"]
+        param.nested.append([1, 2])
+        param.nested[0].append(3)
+        self.assertEqual(len(modifiedEvents), 9)
+        param.RemoveObserver(tag)
+
+        # lists and dicts of primitive types are stored as a single parameter
+        parameterNames = param.parameterNode.GetParameterNames()
+        self.assertIn("points", parameterNames)
+        self.assertIn("ids", parameterNames)
+        self.assertIn("counts", parameterNames)
+        self.assertNotIn("points.len", parameterNames)
+        self.assertEqual(len([name for name in parameterNames if name.startswith("points")]), 1)
+        self.assertEqual(param.points[1000], (1.0, 2.0, 3.0))
+        self.assertIsInstance(param.points[1000][0], float)
+        self.assertEqual(param.points[5], (-1.0, -2.0, -3.0))
+
+        param2 = ParameterNodeType(param.parameterNode)
+        self.assertEqual(param2.points, param.points)
+        self.assertEqual(param2.ids, ["a"])
+        self.assertEqual(list(param2.counts.items()), [("b", 2)])
+        self.assertEqual(param2.nested, [[1, 2, 3]])
+
+        # lists stored as separate parameters by earlier versions can still be read and are converted on write
+        parameterNode = newParameterNode()
+        parameterNode.SetParameter("ids.len", "2")
+        parameterNode.SetParameter("ids.0", "x")
+        parameterNode.SetParameter("ids.1", "y")
+        param3 = ParameterNodeType(parameterNode)
+        self.assertEqual(param3.ids, ["x", "y"])
+        param3.ids.append("z")
+        self.assertEqual(param3.ids, ["x", "y", "z"])
+        self.assertEqual(parameterNode.GetParameter("ids"), '["x","y","z"]')
+        self.assertFalse(parameterNode.HasParameter("ids.len"))
+        self.assertFalse(parameterNode.HasParameter("ids.0"))
+
     def test_node(self):
         @parameterNodeWrapper
         class ParameterNodeType:
@@ -1172,3 +1172,51 @@ class ParameterNodeWrapperGuiTest(unittest.TestCase):
         param.connectParametersToGui(mapping)
 
         self.impl_parameterPacks_test_connected_parameter_node_wrapper(param, ui)
+
+    def test_update_only_changed_widgets(self):
+        @parameterNodeWrapper
+        class ParameterNodeWrapper:
+            alpha: int
+            bravo: int
+            charlie: str
+            unconnected: int
+
+        widgetAlpha = qt.QSpinBox()
+        widgetAlpha.deleteLater()
+        widgetBravo = qt.QSpinBox()
+        widgetBravo.deleteLater()
+        widgetCharlie = qt.QLineEdit()
+        widgetCharlie.deleteLater()
+        param = ParameterNodeWrapper(newParameterNode())
+        param.connectParametersToGui({
+            "alpha": widgetAlpha,
+            "bravo": widgetBravo,
+            "charlie": widgetCharlie,
+        })
+
+        # only the widget of the changed parameter is written
+        param.alpha = 5
+        self.assertEqual(widgetAlpha.value, 5)
+        self.assertEqual(param.guiUpdateWidgetWriteCount(), 1)
+
+        with param.batchModify():
+            param.bravo = 2
+            param.charlie = "text"
+        self.assertEqual(widgetBravo.value, 2)
+        self.assertEqual(widgetCharlie.text, "text")
+        self.assertEqual(param.guiUpdateWidgetWriteCount(), 2)
+
+        # changing a parameter that is not connected to a widget writes no widget
+        param.unconnected = 3
+        self.assertEqual(param.guiUpdateWidgetWriteCount(), 0)
+
+        # the widget already shows the value it sets in the parameter node
+        widgetAlpha.value = 7
+        self.assertEqual(param.alpha, 7)
+        self.assertEqual(param.guiUpdateWidgetWriteCount(), 0)
+
+        # changes made directly to the parameter node are detected as well
+        param.parameterNode.SetParameter("bravo", "4")
+        self.assertEqual(param.bravo, 4)
+        self.assertEqual(widgetBravo.value, 4)
+        self.assertEqual(param.guiUpdateWidgetWriteCount(), 1)
@@ -0,0 +1,94 @@
+import logging
+import time
+import unittest
+
+import slicer
+from slicer.ScriptedLoadableModule import ScriptedLoadableModuleLogic
+
+
+class ParameterNodeTestLogic(ScriptedLoadableModuleLogic):
+    def __init__(self):
+        ScriptedLoadableModuleLogic.__init__(self)
+        self.isSingletonParameterNode = False
+
+
+class OtherParameterNodeTestLogic(ScriptedLoadableModuleLogic):
+    pass
+
+
+class SlicerScriptedLoadableModuleLogicTest(unittest.TestCase):
+    def setUp(self):
+        slicer.mrmlScene.Clear(0)
+
+    def test_getParameterNode(self):
+        logic = ParameterNodeTestLogic()
+        self.assertEqual(logic.getAllParameterNodes(), [])
+        parameterNode = logic.getParameterNode()
+        self.assertEqual(parameterNode.GetAttribute("ModuleName"), "ParameterNodeTest")
+        self.assertEqual(logic.getParameterNode(), parameterNode)
+
+        otherLogic = OtherParameterNodeTestLogic()
+        otherParameterNode = otherLogic.getParameterNode()
+        self.assertEqual(otherLogic.getParameterNode(), otherParameterNode)
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherParameterNode])
+        self.assertEqual(logic.getAllParameterNodes(), [parameterNode])
+
+        secondParameterNode = slicer.mrmlScene.AddNode(logic.createParameterNode())
+        self.assertEqual(logic.getAllParameterNodes(), [parameterNode, secondParameterNode])
+        self.assertEqual(logic.getParameterNode(), parameterNode)
+
+        slicer.mrmlScene.RemoveNode(parameterNode)
+        self.assertEqual(logic.getAllParameterNodes(), [secondParameterNode])
+        self.assertEqual(logic.getParameterNode(), secondParameterNode)
+
+        slicer.mrmlScene.Clear(0)
+        self.assertEqual(logic.getAllParameterNodes(), [])
+        # singleton parameter nodes are kept when the scene is closed
+        self.assertEqual(otherLogic.getParameterNode(), otherParameterNode)
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherParameterNode])
+
+    def test_getParameterNode_attribute_changed_after_adding(self):
+        logic = ParameterNodeTestLogic()
+        node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScriptedModuleNode")
+        self.assertEqual(logic.getAllParameterNodes(), [])
+        node.SetAttribute("ModuleName", logic.moduleName)
+        self.assertEqual(logic.getAllParameterNodes(), [node])
+        self.assertEqual(logic.getParameterNode(), node)
+        node.SetAttribute("ModuleName", "SomeOtherModule")
+        self.assertEqual(logic.getAllParameterNodes(), [])
+
+    def test_getParameterNode_attribute_changed_query_new_module_first(self):
+        logic = ParameterNodeTestLogic()
+        otherLogic = ParameterNodeTestLogic()
+        otherLogic.moduleName = "SomeOtherModule"
+        otherNode = slicer.mrmlScene.AddNode(otherLogic.createParameterNode())
+        node = slicer.mrmlScene.AddNode(logic.createParameterNode())
+        self.assertEqual(logic.getAllParameterNodes(), [node])
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherNode])
+        # The node is found by the new module name without querying the previous module name first
+        node.SetAttribute("ModuleName", otherLogic.moduleName)
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherNode, node])
+        self.assertEqual(logic.getAllParameterNodes(), [])
+        # Nodes are returned in the order they were added to the scene
+        otherNode.SetAttribute("ModuleName", logic.moduleName)
+        otherNode.SetAttribute("ModuleName", otherLogic.moduleName)
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherNode, node])
+        # Modified removed node does not affect the index
+        slicer.mrmlScene.RemoveNode(node)
+        node.SetAttribute("ModuleName", logic.moduleName)
+        self.assertEqual(logic.getAllParameterNodes(), [])
+        self.assertEqual(otherLogic.getAllParameterNodes(), [otherNode])
+
+    def test_getParameterNode_performance(self):
+        for _ in range(2000):
+            node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScriptedModuleNode")
+            node.SetAttribute("ModuleName", "SomeOtherModule")
+        logic = ParameterNodeTestLogic()
+        parameterNode = logic.getParameterNode()
+
+        numberOfLookups = 1000
+        startTime = time.perf_counter()
+        for _ in range(numberOfLookups):
+            self.assertEqual(logic.getParameterNode(), parameterNode)
+        elapsedTime = time.perf_counter() - startTime
+        logging.info(f"getParameterNode: {elapsedTime / numberOfLookups * 1e6:.1f} us per lookup in a scene with 2000 scripted module nodes")
@@ -1,3 +1,5 @@
+import logging
+import time
 import unittest
 import unittest.mock
 
@@ -240,6 +242,70 @@ class SlicerUtilVTKObservationMixinTests(unittest.TestCase):
         foo.removeObservers(method=callback)
         self.assertEqual(len(foo.Observations), 1)
 
+    def test_observer_after_remove(self):
+        foo = Foo()
+        object = vtk.vtkObject()
+        object2 = vtk.vtkObject()
+        event = vtk.vtkCommand.ModifiedEvent
+        callback = foo.onObjectModified
+
+        foo.addObserver(object, event, callback)
+        foo.addObserver(object2, event, callback)
+        foo.removeObserver(object, event, callback)
+        self.assertEqual(foo.observer(event, callback), object2)
+        foo.removeObservers(method=callback)
+        self.assertEqual(foo.observer(event, callback), None)
+        self.assertFalse(foo.hasObserver(object2, event, callback))
+
+        # observations can be added again after removal
+        foo.addObserver(object, event, callback)
+        self.assertEqual(foo.observer(event, callback), object)
+        object.Modified()
+        self.assertEqual(foo.modifiedEventCount(object), 1)
+
+    def test_performance(self):
+        """Looking up and removing observations must not iterate through unrelated observations."""
+        foo = Foo()
+        event = vtk.vtkCommand.ModifiedEvent
+        callback = foo.onObjectModified
+        callback2 = foo.onObjectModifiedAgain
+        numberOfObjects = 1000
+
+        startTime = time.perf_counter()
+        objects = [vtk.vtkObject() for _ in range(numberOfObjects)]
+        for obj in objects:
+            foo.addObserver(obj, event, callback)
+            foo.addObserver(obj, event, callback2)
+
+        # Lookups and removals use the indexes, the list of all observations is not accessed
+        with unittest.mock.patch.object(Foo, "Observations", new_callable=unittest.mock.PropertyMock) as observationsMock:
+            for obj in objects:
+                self.assertTrue(foo.hasObserver(obj, event, callback))
+                self.assertEqual(foo.observer(event, callback2), objects[0])
+            for obj in objects[: numberOfObjects // 2]:
+                foo.removeObserver(obj, event, callback)
+            foo.removeObservers(method=callback2)
+            observationsMock.assert_not_called()
+
+        # Unrelated observations are kept
+        self.assertEqual(len(foo.Observations), numberOfObjects // 2)
+        self.assertIsNone(foo.observer(event, callback2))
+        self.assertEqual(foo.observer(event, callback), objects[numberOfObjects // 2])
+        for obj in objects:
+            obj.Modified()
+        for obj in objects[: numberOfObjects // 2]:
+            self.assertFalse(foo.hasObserver(obj, event, callback))
+            self.assertEqual(foo.modifiedEventCount(obj), 0)
+        for obj in objects[numberOfObjects // 2:]:
+            self.assertTrue(foo.hasObserver(obj, event, callback))
+            self.assertFalse(foo.hasObserver(obj, event, callback2))
+            self.assertEqual(foo.modifiedEventCount(obj), 1)
+
+        foo.removeObservers()
+        self.assertEqual(len(foo.Observations), 0)
+        elapsedTime = time.perf_counter() - startTime
+        logging.info(f"VTKObservationMixin: {elapsedTime / numberOfObjects * 1e6:.1f} us per object with {numberOfObjects} objects")
+
     def test_moduleWidgetMixin(self):
         class MyModule(ScriptedLoadableModuleWidget, VTKObservationMixin):
             pass
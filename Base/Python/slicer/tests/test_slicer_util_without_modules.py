@@ -1,6 +1,8 @@
+import hashlib
 import os
 import tempfile
 import unittest
+import unittest.mock
 
 import slicer.util
 
@@ -23,13 +25,48 @@ class SlicerUtilWithoutModulesTest(unittest.TestCase):
             self.assertEqual(slicer.util.computeChecksum("SHA256", input_file), "4a57f3207b97f26a6061f86948483c00b03893ddfef9e82b639ebe66e3aba338")
             self.assertEqual(slicer.util.computeChecksum("SHA512", input_file), "5080ee92e951c5f8336053f11d278c23f5d26b5eb78805c952960eac0194f357f98b0e350611ce081d4a1e28dd8ea182d3a276c99b1752e0def2de0f47b8b27b")
 
+            self.assertEqual(slicer.util.computeChecksum("BLAKE2B", input_file), hashlib.blake2b(b"This is a text file!\n").hexdigest())
+            self.assertEqual(slicer.util.computeChecksum("BLAKE2S", input_file), hashlib.blake2s(b"This is a text file!\n").hexdigest())
+
             with self.assertRaises(ValueError):
                 slicer.util.computeChecksum("SHAINVALID", input_file)
 
+    def test_computeChecksum_largeFile(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            input_file = os.path.join(tmpdirname, "compute-checksum.bin")
+            data = os.urandom(3 * 1024 * 1024 + 5)
+            with open(input_file, "wb") as content:
+                content.write(data)
+            self.assertEqual(slicer.util.computeChecksum("SHA256", input_file), hashlib.sha256(data).hexdigest())
+            self.assertEqual(slicer.util.computeChecksum("MD5", input_file), hashlib.md5(data).hexdigest())
+
+    def test_computeChecksum_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            input_file = os.path.join(tmpdirname, "compute-checksum.txt")
+            with open(input_file, "wb") as content:
+                content.write(b"first content")
+            firstDigest = hashlib.sha256(b"first content").hexdigest()
+            self.assertEqual(slicer.util.computeChecksum("SHA256", input_file, useCache=True), firstDigest)
+
+            # Cached checksum is returned without reading the file
+            with unittest.mock.patch("builtins.open") as openMock:
+                self.assertEqual(slicer.util.computeChecksum("SHA256", input_file, useCache=True), firstDigest)
+                openMock.assert_not_called()
+
+            # Checksum is computed again if the file changes
+            with open(input_file, "wb") as content:
+                content.write(b"second content, with different size")
+            self.assertEqual(slicer.util.computeChecksum("SHA256", input_file, useCache=True),
+                             hashlib.sha256(b"second content, with different size").hexdigest())
+
     def test_extractAlgoAndDigest(self):
         with self.assertRaises(ValueError):
             slicer.util.extractAlgoAndDigest("4a57f3207b97f26a6061f86948483c00b03893ddfef9e82b639ebe66e3aba338")
 
+        self.assertEqual(
+            slicer.util.extractAlgoAndDigest("BLAKE2S:" + "0" * 64),
+            ("BLAKE2S", "0" * 64))
+
         with self.assertRaises(ValueError):
             slicer.util.extractAlgoAndDigest("SHAINVALID:4a57f3207b97f26a6061f86948483c00b03893ddfef9e82b639ebe66e3aba338")
 
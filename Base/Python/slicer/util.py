@@ -185,7 +185,8 @@ def importModuleObjects(from_module_name, dest_module_name, type_info):
     dest_module = sys.modules[dest_module_name]
 
     # Skip if module has already been loaded
-    if from_module_name in dir(dest_module):
+    # (not using dir() as it would import all the lazily loaded kits of the slicer module)
+    if from_module_name in vars(dest_module):
         return
 
     # Obtain a reference to the module identified by 'from_module_name'
@@ -2150,6 +2151,50 @@ def arrayFromSegmentInternalBinaryLabelmap(segmentationNode, segmentId):
     return narray
 
 
+def arrayFromSegmentInternalBinaryLabelmapLayer(segmentationNode, segmentId):
+    """Return voxel array of the binary labelmap layer that contains a segment, with the segment's label value and extent.
+
+    Voxels values are not copied. The returned array is a view of the labelmap layer, which may be shared
+    between multiple segments, therefore voxels of the segment are the ones where the array is equal to the label value.
+    This allows processing many segments without creating temporary nodes or copying voxels, for example::
+
+      narray, labelValue, extent = slicer.util.arrayFromSegmentInternalBinaryLabelmapLayer(segmentationNode, segmentId)
+      segmentVoxelCount = np.count_nonzero(narray == labelValue)
+
+    :param segmentationNode: source segmentation node.
+    :param segmentId: ID of the source segment.
+    :return: tuple of (numpy array in KJI order, label value of the segment in the array, IJK extent of the array).
+      Array index ``[k, j, i]`` corresponds to voxel ``(i + extent[0], j + extent[2], k + extent[4])``
+      of the segment's ``vtkOrientedImageData`` (see ``segmentationNode.GetBinaryLabelmapInternalRepresentation``).
+
+    :raises RuntimeError: in case of failure
+
+    .. warning:: Important: memory area of the returned array is managed by VTK,
+      therefore values in the array may be changed, but the array must not be reallocated.
+      See :py:meth:`arrayFromSegmentInternalBinaryLabelmap` for details.
+    """
+    segment = segmentationNode.GetSegmentation().GetSegment(segmentId)
+    vimage = segmentationNode.GetBinaryLabelmapInternalRepresentation(segmentId)
+    if not segment or not vimage or not vimage.GetPointData().GetScalars():
+        raise RuntimeError(f"Binary labelmap representation of segment {segmentId} is not available.")
+    nshape = tuple(reversed(vimage.GetDimensions()))
+    import vtk.util.numpy_support
+
+    narray = vtk.util.numpy_support.vtk_to_numpy(vimage.GetPointData().GetScalars()).reshape(nshape)
+    return narray, segment.GetLabelValue(), vimage.GetExtent()
+
+
+def _getSegmentationReferenceVolumeNode(segmentationNode, referenceVolumeNode):
+    import slicer
+
+    if referenceVolumeNode:
+        return referenceVolumeNode
+    referenceVolumeNode = segmentationNode.GetNodeReference(slicer.vtkMRMLSegmentationNode.GetReferenceImageGeometryReferenceRole())
+    if not referenceVolumeNode:
+        raise RuntimeError("No reference volume is found in the input segmentationNode, therefore a valid referenceVolumeNode input is required.")
+    return referenceVolumeNode
+
+
 def arrayFromSegmentBinaryLabelmap(segmentationNode, segmentId, referenceVolumeNode=None):
     """Return voxel array of a segment's binary labelmap representation as numpy array.
 
@@ -2163,32 +2208,34 @@ def arrayFromSegmentBinaryLabelmap(segmentationNode, segmentId, referenceVolumeN
 
     Voxels values are copied, therefore changing the returned numpy array has no effect on the source segmentation.
     The modified array can be written back to the segmentation by calling :py:meth:`updateSegmentBinaryLabelmapFromArray`.
+    No nodes are added to the scene.
 
-    To get voxels of a segment as a modifiable numpy array, you can use :py:meth:`arrayFromSegmentInternalBinaryLabelmap`.
+    To get voxels of a segment as a modifiable numpy array, you can use :py:meth:`arrayFromSegmentInternalBinaryLabelmap`
+    or :py:meth:`arrayFromSegmentInternalBinaryLabelmapLayer`.
     """
 
     import slicer
     import vtk
+    import vtk.util.numpy_support
 
-    # Get reference volume
-    if not referenceVolumeNode:
-        referenceVolumeNode = segmentationNode.GetNodeReference(slicer.vtkMRMLSegmentationNode.GetReferenceImageGeometryReferenceRole())
-        if not referenceVolumeNode:
-            raise RuntimeError("No reference volume is found in the input segmentationNode, therefore a valid referenceVolumeNode input is required.")
+    referenceVolumeNode = _getSegmentationReferenceVolumeNode(segmentationNode, referenceVolumeNode)
 
-    # Export segment as vtkImageData (via temporary labelmap volume node)
+    # Make sure binary labelmap representation exists in segment
+    if not segmentationNode.GetSegmentation().CreateRepresentation(slicer.vtkSegmentationConverter.GetSegmentationBinaryLabelmapRepresentationName()):
+        raise RuntimeError("Export of segment failed: unable to convert segment to binary labelmap representation.")
+
+    # Export segment as vtkOrientedImageData in the reference geometry (segment voxels are set to 1)
     segmentIds = vtk.vtkStringArray()
     segmentIds.InsertNextValue(segmentId)
-    labelmapVolumeNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLLabelMapVolumeNode", "__temp__")
-    try:
-        if not slicer.modules.segmentations.logic().ExportSegmentsToLabelmapNode(segmentationNode, segmentIds, labelmapVolumeNode, referenceVolumeNode):
-            raise RuntimeError("Export of segment failed.")
-        narray = slicer.util.arrayFromVolume(labelmapVolumeNode)
-    finally:
-        if labelmapVolumeNode.GetDisplayNode():
-            slicer.mrmlScene.RemoveNode(labelmapVolumeNode.GetDisplayNode().GetColorNode())
-        slicer.mrmlScene.RemoveNode(labelmapVolumeNode)
-
+    mergedLabelmap = slicer.vtkOrientedImageData()
+    slicer.vtkSlicerSegmentationsModuleLogic.GenerateMergedLabelmapInReferenceGeometry(
+        segmentationNode, referenceVolumeNode, segmentIds, slicer.vtkSegmentation.EXTENT_UNION_OF_EFFECTIVE_SEGMENTS, mergedLabelmap)
+    if not mergedLabelmap.GetPointData().GetScalars():
+        raise RuntimeError("Export of segment failed.")
+
+    # The labelmap is not referenced anywhere else, so the array can use its memory without copying
+    nshape = tuple(reversed(mergedLabelmap.GetDimensions()))
+    narray = vtk.util.numpy_support.vtk_to_numpy(mergedLabelmap.GetPointData().GetScalars()).reshape(nshape)
     return narray
 
 
@@ -2204,39 +2251,54 @@ def updateSegmentBinaryLabelmapFromArray(narray, segmentationNode, segmentId, re
 
     :raises RuntimeError: in case of failure
 
+    No nodes are added to the scene.
+
     .. warning::
       Voxels values are deep-copied, therefore if the numpy array is modified after calling this method, segmentation node will not change.
     """
 
-    # Export segment as vtkImageData (via temporary labelmap volume node)
+    import numpy as np
     import slicer
     import vtk
+    import vtk.util.numpy_support
 
-    # Get reference volume
-    if not referenceVolumeNode:
-        referenceVolumeNode = segmentationNode.GetNodeReference(slicer.vtkMRMLSegmentationNode.GetReferenceImageGeometryReferenceRole())
-        if not referenceVolumeNode:
-            raise RuntimeError("No reference volume is found in the input segmentationNode, therefore a valid referenceVolumeNode input is required.")
+    referenceVolumeNode = _getSegmentationReferenceVolumeNode(segmentationNode, referenceVolumeNode)
+
+    if len(narray.shape) != 3:
+        raise RuntimeError("Input numpy array must be 3-dimensional.")
+    if narray.dtype == np.bool_:
+        # VTK has no matching scalar type for bool arrays
+        narrayLabel = narray.astype(np.uint8)
+    elif narray.min() >= 0 and narray.max() <= 1:
+        # input array seems to be valid, use it as is (faster)
+        narrayLabel = np.ascontiguousarray(narray)
+    else:
+        # need to normalize the data because the label value must be 1
+        narrayLabel = np.zeros(narray.shape, np.uint8)
+        narrayLabel[narray > 0] = 1
+
+    # Create labelmap image in the reference volume's geometry
+    labelmap = slicer.vtkOrientedImageData()
+    labelmap.SetDimensions(tuple(reversed(narrayLabel.shape)))
+    ijkToRas = vtk.vtkMatrix4x4()
+    referenceVolumeNode.GetIJKToRASMatrix(ijkToRas)
+    labelmap.SetImageToWorldMatrix(ijkToRas)
+    vtype = vtk.util.numpy_support.get_vtk_array_type(narrayLabel.dtype)
+    labelmap.GetPointData().SetScalars(vtk.util.numpy_support.numpy_to_vtk(narrayLabel.ravel(), deep=True, array_type=vtype))
+
+    # Apply transforms if segmentation and reference volume are not in the same coordinate system
+    labelmapToSegmentationTransform = None
+    if referenceVolumeNode.GetParentTransformNode() != segmentationNode.GetParentTransformNode():
+        labelmapToSegmentationTransform = vtk.vtkGeneralTransform()
+        slicer.vtkSlicerSegmentationsModuleLogic.GetTransformBetweenRepresentationAndSegmentation(
+            referenceVolumeNode, segmentationNode, labelmapToSegmentationTransform)
 
     # Update segment in segmentation
-    labelmapVolumeNode = slicer.modules.volumes.logic().CreateAndAddLabelVolume(referenceVolumeNode, "__temp__")
-    try:
-        if narray.min() >= 0 and narray.max() <= 1:
-            # input array seems to be valid, use it as is (faster)
-            updateVolumeFromArray(labelmapVolumeNode, narray)
-        else:
-            # need to normalize the data because the label value must be 1
-            import numpy as np
-
-            narrayNormalized = np.zeros(narray.shape, np.uint8)
-            narrayNormalized[narray > 0] = 1
-            updateVolumeFromArray(labelmapVolumeNode, narrayNormalized)
-        segmentIds = vtk.vtkStringArray()
-        segmentIds.InsertNextValue(segmentId)
-        if not slicer.modules.segmentations.logic().ImportLabelmapToSegmentationNode(labelmapVolumeNode, segmentationNode, segmentIds):
-            raise RuntimeError("Importing of segment failed.")
-    finally:
-        slicer.mrmlScene.RemoveNode(labelmapVolumeNode)
+    segmentIds = vtk.vtkStringArray()
+    segmentIds.InsertNextValue(segmentId)
+    if not slicer.vtkSlicerSegmentationsModuleLogic.ImportLabelmapToSegmentationNode(
+            labelmap, segmentationNode, segmentIds, labelmapToSegmentationTransform):
+        raise RuntimeError("Importing of segment failed.")
 
 
 def arrayFromMarkupsControlPoints(markupsNode, world=False):
@@ -2355,37 +2417,59 @@ def arrayFromMarkupsCurveData(markupsNode, arrayName, world=False):
     return narray
 
 
-def updateVolumeFromArray(volumeNode, narray):
+def updateVolumeFromArray(volumeNode, narray, ijkToRAS=None, shareMemory=False):
     """Sets voxels of a volume node from a numpy array.
 
+    :param volumeNode: volume node to update.
+    :param narray: numpy array containing volume voxels.
+    :param ijkToRAS: optional 4x4 numpy array or vtk.vtkMatrix4x4 that defines mapping from IJK to RAS coordinate system.
+      Geometry and voxels are updated in a single modification of the volume node.
+    :param shareMemory: if True then the volume node uses the memory buffer of the numpy array instead of a copy.
     :raises RuntimeError: in case of failure
 
-    Voxels values are deep-copied, therefore if the numpy array
+    By default voxels values are deep-copied, therefore if the numpy array
     is modified after calling this method, voxel values in the volume node will not change.
     Dimensions and voxel type of the source numpy array does not have to match the current
-    content of the volume node.
+    content of the volume node. If they match then the existing image data buffer is reused.
+
+    If ``shareMemory`` is True then no copy is made: the image data refers to the buffer
+    of the numpy array (a reference to the array is kept as long as the image data uses it).
+    This is the fastest way of updating volumes frequently, for example for showing
+    frames of a time sequence or real-time reconstructions. Modifying the numpy array afterward
+    modifies the voxels of the volume, call :py:meth:`arrayFromVolumeModified` to indicate that.
+    Arrays that are not C-contiguous are copied.
+
+    Example::
+
+      # show 4D frames without copying the voxels
+      for frame in frames:
+          slicer.util.updateVolumeFromArray(volumeNode, frame, shareMemory=True)
+          slicer.app.processEvents()
     """
+    import numpy as np
 
     vshape = tuple(reversed(narray.shape))
     if len(vshape) == 1:
         # Line of pixels
         vcomponents = 1
         # Put the slice into a single-slice 3D volume
-        import numpy as np
-
-        narray3d = np.zeros([1, 1, narray.shape[0]])
-        narray3d[0, 0, :] = narray
-        narray = narray3d
+        if shareMemory:
+            narray = narray.reshape([1, 1, narray.shape[0]])
+        else:
+            narray3d = np.zeros([1, 1, narray.shape[0]])
+            narray3d[0, 0, :] = narray
+            narray = narray3d
         vshape = tuple(reversed(narray.shape))
     elif len(vshape) == 2:
         # Scalar 2D volume
         vcomponents = 1
         # Put the slice into a single-slice 3D volume
-        import numpy as np
-
-        narray3d = np.zeros([1, narray.shape[0], narray.shape[1]])
-        narray3d[0] = narray
-        narray = narray3d
+        if shareMemory:
+            narray = narray.reshape([1, narray.shape[0], narray.shape[1]])
+        else:
+            narray3d = np.zeros([1, narray.shape[0], narray.shape[1]])
+            narray3d[0] = narray
+            narray = narray3d
         vshape = tuple(reversed(narray.shape))
     elif len(vshape) == 3:
         # Scalar volume
@@ -2398,12 +2482,6 @@ def updateVolumeFromArray(volumeNode, narray):
         # TODO: add support for tensor volumes
         raise RuntimeError("Unsupported numpy array shape: " + str(narray.shape))
 
-    vimage = volumeNode.GetImageData()
-    if not vimage:
-        import vtk
-
-        vimage = vtk.vtkImageData()
-        volumeNode.SetAndObserveImageData(vimage)
     import vtk.util.numpy_support
 
     vtype = vtk.util.numpy_support.get_vtk_array_type(narray.dtype)
@@ -2413,32 +2491,67 @@ def updateVolumeFromArray(volumeNode, narray):
     if vtype == vtk.VTK_LONG_LONG:
         raise RuntimeError("Unsupported numpy array type: long long")
 
-    vimage.SetDimensions(vshape)
-    vimage.AllocateScalars(vtype, vcomponents)
+    if ijkToRAS is not None and not isinstance(ijkToRAS, vtk.vtkMatrix4x4):
+        ijkToRAS = vtkMatrixFromArray(ijkToRAS)
 
-    narrayTarget = arrayFromVolume(volumeNode)
-    narrayTarget[:] = narray
+    sharedScalarsName = "ImageScalarsSharedMemory"
 
-    # Notify the application that image data is changed
-    # (same notifications as in vtkMRMLVolumeNode.SetImageDataConnection)
-    import slicer
-
-    volumeNode.StorableModified()
-    volumeNode.Modified()
-    volumeNode.InvokeEvent(slicer.vtkMRMLVolumeNode.ImageDataModifiedEvent, volumeNode)
+    with NodeModify(volumeNode):
+        if ijkToRAS is not None:
+            volumeNode.SetIJKToRASMatrix(ijkToRAS)
 
+        vimage = volumeNode.GetImageData()
+        if not vimage:
+            vimage = vtk.vtkImageData()
+            volumeNode.SetAndObserveImageData(vimage)
 
-def addVolumeFromArray(narray, ijkToRAS=None, name=None, nodeClassName=None):
+        if shareMemory:
+            narray = np.ascontiguousarray(narray)
+            # numpy_to_vtk keeps a reference to the numpy array in the VTK array
+            varray = vtk.util.numpy_support.numpy_to_vtk(narray.reshape(-1, vcomponents), deep=False, array_type=vtype)
+            # The array name marks the buffer as owned by the numpy array
+            varray.SetName(sharedScalarsName)
+            vimage.SetDimensions(vshape)
+            vimage.GetPointData().SetScalars(varray)
+        else:
+            scalars = vimage.GetPointData().GetScalars()
+            # Do not write into the buffer of a numpy array that was set using shareMemory=True
+            sharedScalars = scalars is not None and scalars.GetName() == sharedScalarsName
+            if sharedScalars or not (tuple(vimage.GetDimensions()) == tuple(vshape) and scalars
+                                     and scalars.GetDataType() == vtype and scalars.GetNumberOfComponents() == vcomponents):
+                # Content of the existing image data buffer cannot be reused, allocate a new one
+                if sharedScalars:
+                    # AllocateScalars would reuse the shared buffer if it has the same type
+                    vimage.GetPointData().RemoveArray(sharedScalarsName)
+                vimage.SetDimensions(vshape)
+                vimage.AllocateScalars(vtype, vcomponents)
+            narrayTarget = arrayFromVolume(volumeNode)
+            narrayTarget[:] = narray
+            vimage.GetPointData().GetScalars().Modified()
+        # The volume node observes the image data: this queues an ImageDataModifiedEvent,
+        # which is invoked once, when the modification block ends.
+        vimage.Modified()
+
+        # Notify the application that image data is changed
+        # (same notifications as in vtkMRMLVolumeNode.SetImageDataConnection)
+        volumeNode.StorableModified()
+        volumeNode.Modified()
+
+
+def addVolumeFromArray(narray, ijkToRAS=None, name=None, nodeClassName=None, shareMemory=False):
     """Create a new volume node from content of a numpy array and add it to the scene.
 
-    Voxels values are deep-copied, therefore if the numpy array
+    By default voxels values are deep-copied, therefore if the numpy array
     is modified after calling this method, voxel values in the volume node will not change.
+    If ``shareMemory`` is True then the volume node uses the memory buffer of the numpy array,
+    see :py:meth:`updateVolumeFromArray` for details.
 
     :param narray: numpy array containing volume voxels.
     :param ijkToRAS: 4x4 numpy array or vtk.vtkMatrix4x4 that defines mapping from IJK to RAS coordinate system (specifying origin, spacing, directions)
     :param name: volume node name
     :param nodeClassName: type of created volume, default: ``vtkMRMLScalarVolumeNode``.
       Use ``vtkMRMLLabelMapVolumeNode`` for labelmap volume, ``vtkMRMLVectorVolumeNode`` for vector volume.
+    :param shareMemory: if True then the volume node uses the memory buffer of the numpy array instead of a copy.
     :return: created new volume node
 
     Example::
@@ -2455,7 +2568,6 @@ def addVolumeFromArray(narray, ijkToRAS=None, name=None, nodeClassName=None):
         np.diag([0.2, 0.2, 0.5, 1.0]), nodeClassName="vtkMRMLLabelMapVolumeNode")
     """
     import slicer
-    from vtk import vtkMatrix4x4
 
     if name is None:
         name = ""
@@ -2463,11 +2575,7 @@ def addVolumeFromArray(narray, ijkToRAS=None, name=None, nodeClassName=None):
         nodeClassName = "vtkMRMLScalarVolumeNode"
 
     volumeNode = slicer.mrmlScene.AddNewNodeByClass(nodeClassName, name)
-    if ijkToRAS is not None:
-        if not isinstance(ijkToRAS, vtkMatrix4x4):
-            ijkToRAS = vtkMatrixFromArray(ijkToRAS)
-        volumeNode.SetIJKToRASMatrix(ijkToRAS)
-    updateVolumeFromArray(volumeNode, narray)
+    updateVolumeFromArray(volumeNode, narray, ijkToRAS, shareMemory=shareMemory)
     volumeNode.CreateDefaultDisplayNodes()
 
     return volumeNode
@@ -2528,6 +2636,52 @@ def _vtkArrayFromNumpyArray(narray, deep=False, arrayType=None):
     return vtk.util.numpy_support.numpy_to_vtk(narray, deep=deep, array_type=arrayType)
 
 
+def _updateTableColumnsInPlace(tableNode, ncolumns, columnNames, setBoolAsUchar):
+    """Write column values into the existing columns of a table node, without reallocating the columns.
+
+    :return: ``True`` if all the columns could be updated in place, ``False`` if the table has to be rebuilt.
+    """
+    import numpy as np
+    import vtk.util.numpy_support
+
+    vtable = tableNode.GetTable()
+    if vtable.GetNumberOfColumns() != len(ncolumns):
+        return False
+    numberOfRows = None
+    vcolumns = []
+    for columnIndex, ncolumn in enumerate(ncolumns):
+        if len(ncolumn.shape) != 1 or (numberOfRows is not None and ncolumn.shape[0] != numberOfRows):
+            return False
+        numberOfRows = ncolumn.shape[0]
+        if ncolumn.dtype == np.bool_:
+            if not setBoolAsUchar:
+                # bit arrays cannot be accessed as numpy arrays
+                return False
+            vtype = vtk.VTK_UNSIGNED_CHAR
+        else:
+            vtype = vtk.util.numpy_support.get_vtk_array_type(ncolumn.dtype)
+        vcolumn = vtable.GetColumn(columnIndex)
+        columnName = columnNames[columnIndex] if columnIndex < len(columnNames) else None
+        if (
+            not isinstance(vcolumn, vtk.vtkDataArray)
+            or vcolumn.GetDataType() != vtype
+            or vcolumn.GetNumberOfComponents() != 1
+            or vcolumn.GetName() != columnName
+        ):
+            return False
+        vcolumns.append(vcolumn)
+
+    with NodeModify(tableNode):
+        for ncolumn, vcolumn in zip(ncolumns, vcolumns):
+            if vcolumn.GetNumberOfTuples() != numberOfRows:
+                vcolumn.SetNumberOfTuples(numberOfRows)
+            if numberOfRows > 0:
+                vtk.util.numpy_support.vtk_to_numpy(vcolumn)[:] = ncolumn
+            vcolumn.Modified()
+        vtable.Modified()
+    return True
+
+
 def updateTableFromArray(tableNode, narrays, columnNames=None, setBoolAsUchar=False):
     """Set values in a table node from a NumPy array or an array-like object (list/tuple of NumPy arrays).
 
@@ -2559,8 +2713,12 @@ def updateTableFromArray(tableNode, narrays, columnNames=None, setBoolAsUchar=Fa
     This function automatically detects the data type of each input array using
     ``vtk.util.numpy_support.get_vtk_array_type`` and maps it to the corresponding VTK array type. As a
     result, a broader range of numeric and complex data (e.g., int, float, and complex) is supported
-    without requiring manual conversions. All existing columns in the target table node are removed
-    before adding new columns.
+    without requiring manual conversions.
+
+    If the table node already contains the same number of columns with matching names and data types
+    (for example, when the table is updated repeatedly with new values), then values are written into
+    the existing columns in place and the table node is modified only once. Otherwise, all existing
+    columns in the target table node are removed before adding new columns.
 
     .. warning:: Data in the table node is stored by value (deep copy). Modifying the NumPy array after calling
         this function does not update the table node's data.
@@ -2603,13 +2761,17 @@ def updateTableFromArray(tableNode, narrays, columnNames=None, setBoolAsUchar=Fa
         )
         raise ValueError(msg)
 
-    tableNode.RemoveAllColumns()
     # Convert single string to a single-element string list
     if columnNames is None:
         columnNames = []
     if isinstance(columnNames, str):
         columnNames = [columnNames]
 
+    if _updateTableColumnsInPlace(tableNode, ncolumns, columnNames, setBoolAsUchar):
+        return tableNode
+
+    tableNode.RemoveAllColumns()
+
     # For each extracted column, convert to a VTK array and add to the table.
     for columnIndex, ncolumn in enumerate(ncolumns):
         vtype = None
@@ -2635,11 +2797,18 @@ def updateTableFromArray(tableNode, narrays, columnNames=None, setBoolAsUchar=Fa
 #
 
 
-def dataframeFromTable(tableNode):
+def dataframeFromTable(tableNode, copy=True):
     """Convert table node content to pandas dataframe.
 
-    Table content is copied. Therefore, changes in table node do not affect the dataframe,
-    and dataframe changes do not affect the original table node.
+    :param tableNode: table node to convert.
+    :param copy: if ``True`` (default) then table content is copied. Therefore, changes in table node
+      do not affect the dataframe, and dataframe changes do not affect the original table node.
+      If ``False`` then numeric single-component columns are not copied: the dataframe references the
+      memory of the table columns, which is much faster for large or frequently updated tables.
+
+    .. warning:: If ``copy`` is ``False`` then memory area of the dataframe columns is managed by VTK,
+      therefore the table node must not be modified (e.g., columns added, removed, or resized) while
+      the dataframe is in use. See :py:meth:`arrayFromTableColumn` for details.
     """
     try:
         # Suppress "lzma compression not available" UserWarning when loading pandas
@@ -2650,14 +2819,22 @@ def dataframeFromTable(tableNode):
             import pandas as pd
     except ImportError:
         raise ImportError("Failed to convert to pandas dataframe. Please install pandas by running `slicer.util.pip_install('pandas')`")
-    dataframe = pd.DataFrame()
+    import vtk
+    import vtk.util.numpy_support
+
+    columns = {}
     vtable = tableNode.GetTable()
     for columnIndex in range(vtable.GetNumberOfColumns()):
         vcolumn = vtable.GetColumn(columnIndex)
         column = []
         numberOfComponents = vcolumn.GetNumberOfComponents()
-        if numberOfComponents == 1:
-            # most common, simple case
+        if numberOfComponents == 1 and isinstance(vcolumn, vtk.vtkDataArray) and vcolumn.GetDataType() != vtk.VTK_BIT:
+            # most common case: numeric column, which can be accessed as numpy array
+            column = vtk.util.numpy_support.vtk_to_numpy(vcolumn)
+            if copy:
+                column = column.copy()
+        elif numberOfComponents == 1:
+            # string or bit column
             for rowIndex in range(vcolumn.GetNumberOfValues()):
                 column.append(vcolumn.GetValue(rowIndex))
         else:
@@ -2669,7 +2846,9 @@ def dataframeFromTable(tableNode):
                     item.append(vcolumn.GetValue(valueIndex))
                     valueIndex += 1
                 column.append(item)
-        dataframe[vcolumn.GetName()] = column
+        columns[vcolumn.GetName()] = column
+    # Columns are already copied (if requested), therefore do not let pandas copy them again
+    dataframe = pd.DataFrame(columns, copy=False)
     return dataframe
 
 
@@ -2876,6 +3055,13 @@ class VTKObservationMixin:
         self.__observations = {}
         # {obj: {event: {method: (group, tag, priority)}}}
 
+        # Indexes of the observations, to look up and remove observations without iterating through all of them.
+        # Dicts with None values are used as insertion-ordered sets.
+        self.__objectsByEventMethod = {}
+        # {(event, method): {obj: None}}
+        self.__objectEventsByMethod = {}
+        # {method: {(obj, event): None}}
+
     @property
     def Observations(self):
         return [
@@ -2885,17 +3071,42 @@ class VTKObservationMixin:
             for method, (group, tag, priority) in methods.items()
         ]
 
+    def __removeObservation(self, obj, event, method):
+        """Remove the observation from the observations and the indexes and return its (group, tag, priority).
+
+        :raises KeyError: if there is no such observation.
+        """
+        events = self.__observations[obj]
+        methods = events[event]
+        group, tag, priority = methods.pop(method)
+        if not methods:
+            del events[event]
+            if not events:
+                del self.__observations[obj]
+
+        objects = self.__objectsByEventMethod[(event, method)]
+        del objects[obj]
+        if not objects:
+            del self.__objectsByEventMethod[(event, method)]
+
+        objectEvents = self.__objectEventsByMethod[method]
+        del objectEvents[(obj, event)]
+        if not objectEvents:
+            del self.__objectEventsByMethod[method]
+
+        return group, tag, priority
+
     def removeObservers(self, method=None):
         if method is None:
             for obj, _, _, _, tag, _ in self.Observations:
                 obj.RemoveObserver(tag)
             self.__observations.clear()
+            self.__objectsByEventMethod.clear()
+            self.__objectEventsByMethod.clear()
         else:
-            for obj, events in self.__observations.items():
-                for e, methods in events.items():
-                    if method in methods:
-                        g, t, p = methods.pop(method)
-                        obj.RemoveObserver(t)
+            for obj, event in list(self.__objectEventsByMethod.get(method, ())):
+                g, t, p = self.__removeObservation(obj, event, method)
+                obj.RemoveObserver(t)
 
     def addObserver(self, obj, event, method, group="none", priority=0.0):
         from warnings import warn
@@ -2909,14 +3120,14 @@ class VTKObservationMixin:
 
         tag = obj.AddObserver(event, method, priority)
         methods[method] = group, tag, priority
+        self.__objectsByEventMethod.setdefault((event, method), {})[obj] = None
+        self.__objectEventsByMethod.setdefault(method, {})[(obj, event)] = None
 
     def removeObserver(self, obj, event, method):
         from warnings import warn
 
         try:
-            events = self.__observations[obj]
-            methods = events[event]
-            group, tag, priority = methods.pop(method)
+            group, tag, priority = self.__removeObservation(obj, event, method)
             obj.RemoveObserver(tag)
         except KeyError:
             warn("does not have observer")
@@ -2934,11 +3145,11 @@ class VTKObservationMixin:
         return self.getObserver(obj, event, method) is not None
 
     def observer(self, event, method, default=None):
-        for obj, events in self.__observations.items():
-            if self.hasObserver(obj, event, method):
-                return obj
-
-        return default
+        objects = self.__objectsByEventMethod.get((event, method))
+        if not objects:
+            return default
+        # return the first observed object
+        return next(iter(objects))
 
 
 def toVTKString(text):
@@ -3537,7 +3748,7 @@ def downloadFile(url, targetFilePath, checksum=None, reDownloadIfChecksumInvalid
             return False
         if algo is not None:
             logging.info("Verifying checksum\n  %s" % targetFilePath)
-            current_digest = computeChecksum(algo, targetFilePath)
+            current_digest = computeChecksum(algo, targetFilePath, useCache=True)
             if current_digest != digest:
                 logging.error("Downloaded file does not have expected checksum."
                               "\n   current checksum: %s"
@@ -3547,7 +3758,7 @@ def downloadFile(url, targetFilePath, checksum=None, reDownloadIfChecksumInvalid
                 logging.info("Checksum OK")
     else:
         if algo is not None:
-            current_digest = computeChecksum(algo, targetFilePath)
+            current_digest = computeChecksum(algo, targetFilePath, useCache=True)
             if current_digest != digest:
                 if reDownloadIfChecksumInvalid:
                     logging.info("Requested file has been found but its checksum is different: deleting and re-downloading")
@@ -3601,35 +3812,58 @@ def extractArchive(archiveFilePath, outputDir, expectedNumberOfExtractedFiles=No
     return True
 
 
-def computeChecksum(algo, filePath):
+_checksumDigestLengths = {"SHA256": 64, "SHA512": 128, "MD5": 32, "BLAKE2B": 128, "BLAKE2S": 64}
+
+# Checksums computed with useCache=True: {(filePath, algo): (size, mtime, digest)}
+_checksumCache = {}
+
+
+def computeChecksum(algo, filePath, useCache=False):
     """Compute digest of ``filePath`` using ``algo``.
 
-    Supported hashing algorithms are SHA256, SHA512, and MD5.
+    Supported hashing algorithms are SHA256, SHA512, MD5, BLAKE2B, and BLAKE2S.
+    BLAKE2 algorithms are faster to compute than SHA256 and SHA512.
 
-    It internally reads the file by chunk of 8192 bytes.
+    It internally reads the file by chunk of 1MB into a reused buffer.
 
+    :param useCache: If True then the computed checksum is stored in a cache shared by all callers,
+      and reused as long as the size and modification time of the file remain the same.
     :raises ValueError: if algo is unknown.
     :raises IOError: if filePath does not exist.
     """
     import hashlib
+    import os
 
-    if algo not in ["SHA256", "SHA512", "MD5"]:
+    if algo not in _checksumDigestLengths:
         raise ValueError("unsupported hashing algorithm %s" % algo)
 
+    if useCache:
+        fileStat = os.stat(filePath)
+        cacheKey = (os.path.abspath(filePath), algo)
+        cached = _checksumCache.get(cacheKey)
+        if cached and cached[0] == fileStat.st_size and cached[1] == fileStat.st_mtime_ns:
+            return cached[2]
+
     with open(filePath, "rb") as content:
-        hash = hashlib.new(algo)
+        hash = hashlib.new(algo.lower())
+        buffer = bytearray(1024 * 1024)
+        bufferView = memoryview(buffer)
         while True:
-            chunk = content.read(8192)
-            if not chunk:
+            size = content.readinto(buffer)
+            if not size:
                 break
-            hash.update(chunk)
-        return hash.hexdigest()
+            hash.update(bufferView[:size])
+        digest = hash.hexdigest()
+
+    if useCache:
+        _checksumCache[cacheKey] = (fileStat.st_size, fileStat.st_mtime_ns, digest)
+    return digest
 
 
 def extractAlgoAndDigest(checksum):
     """Given a checksum string formatted as ``<algo>:<digest>`` returns the tuple ``(algo, digest)``.
 
-    ``<algo>`` is expected to be `SHA256`, `SHA512`, or `MD5`.
+    ``<algo>`` is expected to be `SHA256`, `SHA512`, `MD5`, `BLAKE2B`, or `BLAKE2S`.
     ``<digest>`` is expected to be the full length hexadecimal digest.
 
     :raises ValueError: if checksum is incorrectly formatted.
@@ -3639,10 +3873,10 @@ def extractAlgoAndDigest(checksum):
     if len(checksum.split(":")) != 2:
         raise ValueError("invalid checksum '%s'. Expected format is '<algo>:<digest>'." % checksum)
     (algo, digest) = checksum.split(":")
-    expected_algos = ["SHA256", "SHA512", "MD5"]
+    expected_algos = list(_checksumDigestLengths)
     if algo not in expected_algos:
         raise ValueError("invalid algo '{}'. Algo must be one of {}".format(algo, ", ".join(expected_algos)))
-    expected_digest_length = {"SHA256": 64, "SHA512": 128, "MD5": 32}
+    expected_digest_length = _checksumDigestLengths
     if len(digest) != expected_digest_length[algo]:
         raise ValueError("invalid digest length %d. Expected digest length for %s is %d" % (len(digest), algo, expected_digest_length[algo]))
     return algo, digest
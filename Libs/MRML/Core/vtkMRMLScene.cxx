@@ -121,6 +121,8 @@ Version:   $Revision: 1.18 $
 // STD includes
 #include <algorithm>
 #include <numeric>
+#include <unordered_map>
+#include <unordered_set>
 
 //#define MRMLSCENE_VERBOSE
 
@@ -2676,6 +2678,103 @@ void vtkMRMLScene::RemoveReservedIDs()
   this->ReservedIDs.clear();
 }
 
+//------------------------------------------------------------------------------
+namespace
+{
+//------------------------------------------------------------------------------
+// Create a copy of a node that can be stored in an undo/redo state.
+vtkSmartPointer<vtkMRMLNode> CreateNodeCopyForState(vtkMRMLNode* node)
+{
+  vtkSmartPointer<vtkMRMLNode> snode = vtkSmartPointer<vtkMRMLNode>::Take(node->CreateNodeInstance());
+  if (snode != nullptr)
+  {
+    snode->CopyWithScene(node);
+  }
+  return snode;
+}
+
+//------------------------------------------------------------------------------
+// Replace nodes in an undo/redo state by their copies, in a single pass over the state.
+// Items of a vtkCollection cannot be accessed or replaced by index in constant time,
+// therefore the content of the state is rebuilt instead of calling ReplaceItem for each node.
+void ReplaceNodesInState(vtkCollection* state,
+  const std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> >& nodeCopies)
+{
+  if (nodeCopies.empty())
+  {
+    return;
+  }
+  std::vector<vtkSmartPointer<vtkObject> > items;
+  items.reserve(state->GetNumberOfItems());
+  bool replaced = false;
+  vtkObject* item = nullptr;
+  vtkCollectionSimpleIterator it;
+  for (state->InitTraversal(it); (item = state->GetNextItemAsObject(it));)
+  {
+    vtkMRMLNode* node = vtkMRMLNode::SafeDownCast(item);
+    std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> >::const_iterator nodeCopyIt =
+      node ? nodeCopies.find(node) : nodeCopies.end();
+    if (nodeCopyIt != nodeCopies.end() && nodeCopyIt->second != nullptr)
+    {
+      items.emplace_back(nodeCopyIt->second.GetPointer());
+      replaced = true;
+    }
+    else
+    {
+      items.emplace_back(item);
+    }
+  }
+  if (!replaced)
+  {
+    return;
+  }
+  state->RemoveAllItems();
+  for (const vtkSmartPointer<vtkObject>& stateItem : items)
+  {
+    state->AddItem(stateItem);
+  }
+}
+
+//------------------------------------------------------------------------------
+// Replace a node in an undo/redo state by a copy of the node.
+void ReplaceNodeInStateWithCopy(vtkCollection* state, vtkMRMLNode* node)
+{
+  std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> > nodeCopies;
+  nodeCopies[node] = CreateNodeCopyForState(node);
+  ReplaceNodesInState(state, nodeCopies);
+}
+
+//------------------------------------------------------------------------------
+// Replace all the specified nodes in an undo/redo state by their copies, in a single pass.
+void ReplaceNodesInStateWithCopies(vtkCollection* state, const std::unordered_set<vtkMRMLNode*>& nodes)
+{
+  std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> > nodeCopies;
+  for (vtkMRMLNode* node : nodes)
+  {
+    nodeCopies[node] = CreateNodeCopyForState(node);
+  }
+  ReplaceNodesInState(state, nodeCopies);
+}
+
+//------------------------------------------------------------------------------
+// Get undo-enabled nodes of a collection, in a single pass over the collection.
+std::vector<vtkMRMLNode*> GetUndoEnabledNodes(vtkCollection* nodes)
+{
+  std::vector<vtkMRMLNode*> undoEnabledNodes;
+  vtkObject* item = nullptr;
+  vtkCollectionSimpleIterator it;
+  for (nodes->InitTraversal(it); (item = nodes->GetNextItemAsObject(it));)
+  {
+    vtkMRMLNode* node = vtkMRMLNode::SafeDownCast(item);
+    if (node && node->GetUndoEnabled())
+    {
+      undoEnabledNodes.push_back(node);
+    }
+  }
+  return undoEnabledNodes;
+}
+}
+
 //------------------------------------------------------------------------------
 // Pushes the current scene onto the undo stack, and makes a backup copy of the
 // passed node so that changes to the node are undoable; several signatures to handle
@@ -2732,15 +2831,19 @@ void vtkMRMLScene::SaveStateForUndo (std::vector<vtkMRMLNode *> nodes)
   this->ClearRedoStack();
   //this->SetUndoOn();
   this->PushIntoUndoStack();
-  unsigned int n;
-  for (n=0; n<nodes.size(); n++)
+  if (this->UndoStack.empty())
+  {
+    return;
+  }
+  std::unordered_set<vtkMRMLNode*> nodesToCopy;
+  for (vtkMRMLNode* node : nodes)
   {
-    vtkMRMLNode *node = nodes[n];
     if (node && node->GetUndoEnabled())
     {
-      this->CopyNodeInUndoStack(node);
+      nodesToCopy.insert(node);
     }
   }
+  ReplaceNodesInStateWithCopies(this->UndoStack.back(), nodesToCopy);
 }
 
 //------------------------------------------------------------------------------
@@ -2769,17 +2872,14 @@ void vtkMRMLScene::SaveStateForUndo (vtkCollection* nodes)
   this->ClearRedoStack();
   //this->SetUndoOn();
   this->PushIntoUndoStack();
-
-  int nnodes = nodes->GetNumberOfItems();
-
-  for (int n=0; n<nnodes; n++)
+  if (this->UndoStack.empty())
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(nodes->GetItemAsObject(n));
-    if (node && node->GetUndoEnabled())
-    {
-      this->CopyNodeInUndoStack(node);
-    }
+    return;
   }
+
+  std::vector<vtkMRMLNode*> undoEnabledNodes = GetUndoEnabledNodes(nodes);
+  std::unordered_set<vtkMRMLNode*> nodesToCopy(undoEnabledNodes.begin(), undoEnabledNodes.end());
+  ReplaceNodesInStateWithCopies(this->UndoStack.back(), nodesToCopy);
 }
 
 //------------------------------------------------------------------------------
@@ -2811,17 +2911,9 @@ void vtkMRMLScene::PushIntoUndoStack()
 
   vtkCollection* newScene = vtkCollection::New();
 
-  vtkCollection* currentScene = this->Nodes;
-
-  int nnodes = currentScene->GetNumberOfItems();
-
-  for (int n=0; n<nnodes; n++)
+  for (vtkMRMLNode* node : GetUndoEnabledNodes(this->Nodes))
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(currentScene->GetItemAsObject(n));
-    if (node && node->GetUndoEnabled())
-    {
-      newScene->AddItem(node);
-    }
+    newScene->AddItem(node);
   }
 
   this->UndoStack.push_back(newScene);
@@ -2839,17 +2931,9 @@ void vtkMRMLScene::PushIntoRedoStack()
 
   vtkCollection* newScene = vtkCollection::New();
 
-  vtkCollection* currentScene = this->Nodes;
-
-  int nnodes = currentScene->GetNumberOfItems();
-
-  for (int n=0; n<nnodes; n++)
+  for (vtkMRMLNode* node : GetUndoEnabledNodes(this->Nodes))
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(currentScene->GetItemAsObject(n));
-    if (node && node->GetUndoEnabled())
-    {
-      newScene->AddItem(node);
-    }
+    newScene->AddItem(node);
   }
 
   this->RedoStack.push_back(newScene);
@@ -2865,25 +2949,11 @@ void vtkMRMLScene::CopyNodeInUndoStack(vtkMRMLNode *copyNode)
     vtkErrorMacro("CopyNodeInUndoStack: node is null");
     return;
   }
-
-  vtkMRMLNode *snode = copyNode->CreateNodeInstance();
-  if (snode != nullptr)
-  {
-    snode->CopyWithScene(copyNode);
-  }
-
-  vtkCollection* undoScene = this->UndoStack.back();
-  int nnodes = undoScene->GetNumberOfItems();
-  for (int n=0; n<nnodes; n++)
+  if (this->UndoStack.empty())
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(undoScene->GetItemAsObject(n));
-    if (node == copyNode)
-    {
-      undoScene->ReplaceItem (n, snode);
-      break;
-    }
+    return;
   }
-  snode->Delete();
+  ReplaceNodeInStateWithCopy(this->UndoStack.back(), copyNode);
 }
 
 //------------------------------------------------------------------------------
@@ -2896,23 +2966,11 @@ void vtkMRMLScene::CopyNodeInRedoStack(vtkMRMLNode *copyNode)
     vtkErrorMacro("CopyNodeInRedoStack: node is null");
     return;
   }
-  vtkMRMLNode *snode = copyNode->CreateNodeInstance();
-  if (snode != nullptr)
-  {
-    snode->CopyWithScene(copyNode);
-  }
-  vtkCollection* undoScene = this->RedoStack.back();
-  int nnodes = undoScene->GetNumberOfItems();
-  for (int n=0; n<nnodes; n++)
+  if (this->RedoStack.empty())
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(undoScene->GetItemAsObject(n));
-    if (node == copyNode)
-    {
-      undoScene->ReplaceItem (n, snode);
-      break;
-    }
+    return;
   }
-  snode->Delete();
+  ReplaceNodeInStateWithCopy(this->RedoStack.back(), copyNode);
 }
 
 //------------------------------------------------------------------------------
@@ -2933,82 +2991,66 @@ void vtkMRMLScene::Undo()
   this->StartState(vtkMRMLScene::UndoState);
   this->RemoveUnusedNodeReferences();
 
-  int nnodes;
-  int n;
   unsigned int nn;
 
   this->PushIntoRedoStack();
 
-  vtkCollection* currentScene = this->Nodes;
-  // We use 2 vectors instead of a map in order to keep the ordering of the
-  // nodes.
-  std::vector<std::string> currentIDs;
-  std::vector<vtkMRMLNode*> currentNodes;
-  nnodes = currentScene->GetNumberOfItems();
-  for (n=0; n<nnodes; n++)
+  // Nodes are stored in vectors to keep their ordering, and hash maps are used
+  // to find nodes by ID in constant time. Each collection is traversed only once.
+  std::vector<vtkMRMLNode*> currentNodes = GetUndoEnabledNodes(this->Nodes);
+  std::unordered_map<std::string, vtkMRMLNode*> currentNodeByID;
+  for (vtkMRMLNode* node : currentNodes)
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(currentScene->GetItemAsObject(n));
-    if (node && node->GetUndoEnabled())
-    {
-      currentIDs.emplace_back(node->GetID());
-      currentNodes.push_back(node);
-    }
+    currentNodeByID.emplace(node->GetID(), node);
   }
 
   vtkCollection* undoScene = nullptr;
-  std::vector<std::string> undoIDs;
   std::vector<vtkMRMLNode*> undoNodes;
+  std::unordered_set<std::string> undoIDs;
 
   if (!this->UndoStack.empty())
   {
     undoScene = this->UndoStack.back();
-    nnodes = undoScene->GetNumberOfItems();
-    for (n=0; n<nnodes; n++)
+    undoNodes = GetUndoEnabledNodes(undoScene);
+    for (vtkMRMLNode* node : undoNodes)
     {
-      vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(undoScene->GetItemAsObject(n));
-      if (node && node->GetUndoEnabled())
-      {
-        undoIDs.emplace_back(node->GetID());
-        undoNodes.push_back(node);
-      }
+      undoIDs.insert(node->GetID());
     }
   }
 
-  std::vector<std::string>::iterator iterID;
-  std::vector<vtkMRMLNode*>::iterator iterNode;
-  std::vector<std::string>::iterator curIterID;
-  std::vector<vtkMRMLNode*>::iterator curIterNode;
-
   // copy back changes and add deleted nodes to the current scene
   std::vector<vtkMRMLNode*> addNodes;
+  // copies of the current nodes that replace them in the redo state
+  std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> > redoNodeCopies;
 
-  for(iterID=undoIDs.begin(), iterNode = undoNodes.begin(); iterID != undoIDs.end(); iterID++, iterNode++)
+  for (vtkMRMLNode* undoNode : undoNodes)
   {
-    curIterID = std::find(currentIDs.begin(), currentIDs.end(), *iterID);
-    curIterNode = currentNodes.begin() + std::distance(currentIDs.begin(), curIterID);
-    if ( curIterID == currentIDs.end() )
+    std::unordered_map<std::string, vtkMRMLNode*>::iterator currentNodeIt = currentNodeByID.find(undoNode->GetID());
+    if (currentNodeIt == currentNodeByID.end())
     {
       // the node was deleted, add Node back to the current scene
-      addNodes.push_back(*iterNode);
+      addNodes.push_back(undoNode);
+      continue;
     }
-    else if (*iterNode != *curIterNode)
+    vtkMRMLNode* currentNode = currentNodeIt->second;
+    if (undoNode != currentNode)
     {
       // nodes differ, copy from undo to current scene
       // but before create a copy in redo stack from current
-      this->CopyNodeInRedoStack(*curIterNode);
-      (*curIterNode)->CopyWithScene(*iterNode);
+      redoNodeCopies[currentNode] = CreateNodeCopyForState(currentNode);
+      currentNode->CopyWithScene(undoNode);
     }
   }
+  ReplaceNodesInState(this->RedoStack.back(), redoNodeCopies);
 
   // remove new nodes created before Undo
   std::vector<vtkMRMLNode*> removeNodes;
-  for(curIterID=currentIDs.begin(), curIterNode = currentNodes.begin(); curIterID != currentIDs.end(); curIterID++, curIterNode++)
+  for (vtkMRMLNode* currentNode : currentNodes)
   {
-    iterID = std::find(undoIDs.begin(),undoIDs.end(), *curIterID);
     // Remove only if the node is not present in the previous state.
-    if ( iterID == undoIDs.end() )
+    if (undoIDs.find(currentNode->GetID()) == undoIDs.end())
     {
-      removeNodes.push_back(*curIterNode);
+      removeNodes.push_back(currentNode);
     }
   }
 
@@ -3060,8 +3102,6 @@ void vtkMRMLScene::Redo()
     return;
   }
 
-  int nnodes;
-  int n;
   unsigned int nn;
 
   this->StartState(vtkMRMLScene::RedoState);
@@ -3070,84 +3110,79 @@ void vtkMRMLScene::Redo()
 
   this->PushIntoUndoStack();
 
-
-  vtkCollection* currentScene = this->Nodes;
-  //std::hash_map<std::string, vtkMRMLNode*> currentMap;
-  std::map<std::string, vtkWeakPointer<vtkMRMLNode> > currentMap;
-  nnodes = currentScene->GetNumberOfItems();
-  for (n=0; n<nnodes; n++)
+  // Nodes are stored in vectors to keep their ordering, and hash maps are used
+  // to find nodes by ID in constant time. Each collection is traversed only once.
+  std::vector<vtkWeakPointer<vtkMRMLNode> > currentNodes;
+  std::unordered_map<std::string, size_t> currentNodeIndexByID;
+  for (vtkMRMLNode* node : GetUndoEnabledNodes(this->Nodes))
   {
-    vtkMRMLNode *node  = vtkMRMLNode::SafeDownCast(currentScene->GetItemAsObject(n));
-    if (node && node->GetUndoEnabled())
-    {
-      currentMap[node->GetID()] = node;
-    }
+    currentNodeIndexByID.emplace(node->GetID(), currentNodes.size());
+    currentNodes.emplace_back(node);
   }
 
-  //std::hash_map<std::string, vtkMRMLNode*> undoMap;
-  std::map<std::string, vtkWeakPointer<vtkMRMLNode> > undoMap;
-
   vtkCollection* undoScene = nullptr;
+  std::vector<vtkWeakPointer<vtkMRMLNode> > redoNodes;
+  std::unordered_set<std::string> redoIDs;
 
   if (!this->RedoStack.empty())
   {
     undoScene = this->RedoStack.back();
     if (undoScene)
     {
-      nnodes = undoScene->GetNumberOfItems();
-      for (n=0; n<nnodes; n++)
+      for (vtkMRMLNode* node : GetUndoEnabledNodes(undoScene))
       {
-        vtkMRMLNode *node = vtkMRMLNode::SafeDownCast(undoScene->GetItemAsObject(n));
-        if (node && node->GetUndoEnabled())
-        {
-          undoMap[node->GetID()] = node;
-        }
+        redoIDs.insert(node->GetID());
+        redoNodes.emplace_back(node);
       }
     }
   }
 
-  std::map<std::string, vtkWeakPointer<vtkMRMLNode> >::iterator iter;
-  std::map<std::string, vtkWeakPointer<vtkMRMLNode> >::iterator curIter;
-
   // copy back changes and add deleted nodes to the current scene
   std::vector<vtkWeakPointer<vtkMRMLNode> > addNodes;
-  for(iter=undoMap.begin(); iter != undoMap.end(); iter++)
+  // copies of the current nodes that replace them in the undo state
+  std::unordered_map<vtkMRMLNode*, vtkSmartPointer<vtkMRMLNode> > undoNodeCopies;
+  for (vtkMRMLNode* redoNode : redoNodes)
   {
-    curIter = currentMap.find(iter->first);
-    if ( curIter == currentMap.end() )
+    if (!redoNode)
+    {
+      continue;
+    }
+    std::unordered_map<std::string, size_t>::iterator currentNodeIndexIt = currentNodeIndexByID.find(redoNode->GetID());
+    if (currentNodeIndexIt == currentNodeIndexByID.end())
     {
       // the node was deleted, add Node back to the current scene
-      addNodes.push_back(iter->second);
+      addNodes.emplace_back(redoNode);
+      continue;
     }
-    else if (!curIter->second || !iter->second)
+    vtkMRMLNode* currentNode = currentNodes[currentNodeIndexIt->second];
+    if (!currentNode)
     {
       continue;
     }
-    else if (iter->second != curIter->second)
+    if (redoNode != currentNode)
     {
       // nodes differ, copy from redo to current scene
       // but before create a copy in undo stack from current
-      this->CopyNodeInUndoStack(curIter->second);
-      curIter->second->CopyWithScene(iter->second);
+      undoNodeCopies[currentNode] = CreateNodeCopyForState(currentNode);
+      currentNode->CopyWithScene(redoNode);
     }
   }
 
   // remove new nodes created before Undo
   std::vector<vtkWeakPointer<vtkMRMLNode> > removeNodes;
-  for(curIter=currentMap.begin(); curIter != currentMap.end(); curIter++)
+  for (vtkMRMLNode* currentNode : currentNodes)
   {
-    if (!curIter->second)
+    if (!currentNode)
     {
       continue;
     }
-
-    iter = undoMap.find(curIter->first);
-    if ( iter == undoMap.end() )
+    if (redoIDs.find(currentNode->GetID()) == redoIDs.end())
     {
-      this->CopyNodeInUndoStack(curIter->second);
-      removeNodes.push_back(curIter->second);
+      undoNodeCopies[currentNode] = CreateNodeCopyForState(currentNode);
+      removeNodes.emplace_back(currentNode);
     }
   }
+  ReplaceNodesInState(this->UndoStack.back(), undoNodeCopies);
 
   for (nn=0; nn<addNodes.size(); nn++)
   {
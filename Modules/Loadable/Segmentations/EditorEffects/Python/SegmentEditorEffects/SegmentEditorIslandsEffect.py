@@ -194,61 +194,90 @@ about each operation, hover the mouse over the option and wait for the tooltip t
             self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, selectedSegmentID, emptyLabelmap,
                                                         slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeSet)
 
-            for i in range(labelValues.GetNumberOfTuples()):
-                if maxNumberOfSegments > 0 and i >= maxNumberOfSegments:
-                    # We only care about the segments up to maxNumberOfSegments.
-                    # If we do not want to split segments, we only care about the first.
-                    break
-
-                labelValue = int(labelValues.GetTuple1(i))
-                segment = selectedSegment
-                segmentID = selectedSegmentID
-                if i != 0 and split:
-                    segment = slicer.vtkSegment()
-                    name = baseSegmentName + "_" + str(i + 1)
-                    segment.SetName(name)
-                    segment.AddRepresentation(
-                        slicer.vtkSegmentationConverter.GetSegmentationBinaryLabelmapRepresentationName(),
-                        selectedSegment.GetRepresentation(slicer.vtkSegmentationConverter.GetSegmentationBinaryLabelmapRepresentationName()))
-                    segmentation.AddSegment(segment)
-                    segmentID = segmentation.GetSegmentIdBySegment(segment)
-                    segment.SetLabelValue(segmentation.GetUniqueLabelValueForSharedLabelmap(selectedSegmentID))
-
+            if not split and maxNumberOfSegments <= 0:
+                # no need to split segments and no limit on number of segments, so we can lump all islands into one segment
                 threshold = vtk.vtkImageThreshold()
                 threshold.SetInputData(islandMath.GetOutput())
-                if not split and maxNumberOfSegments <= 0:
-                    # no need to split segments and no limit on number of segments, so we can lump all islands into one segment
-                    threshold.ThresholdByLower(0)
-                    threshold.SetInValue(0)
-                    threshold.SetOutValue(1)
-                else:
-                    # copy only selected islands; or copy islands into different segments
-                    threshold.ThresholdBetween(labelValue, labelValue)
-                    threshold.SetInValue(1)
-                    threshold.SetOutValue(0)
+                threshold.ThresholdByLower(0)
+                threshold.SetInValue(0)
+                threshold.SetOutValue(1)
                 threshold.Update()
-
-                modificationMode = slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeAdd
-                if i == 0:
-                    modificationMode = slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeSet
-
-                # Create oriented image data from output
                 modifierImage = slicer.vtkOrientedImageData()
-                modifierImage.DeepCopy(threshold.GetOutput())
-                selectedSegmentLabelmapImageToWorldMatrix = vtk.vtkMatrix4x4()
-                selectedSegmentLabelmap.GetImageToWorldMatrix(selectedSegmentLabelmapImageToWorldMatrix)
+                modifierImage.ShallowCopy(threshold.GetOutput())
                 modifierImage.SetGeometryFromImageToWorldMatrix(selectedSegmentLabelmapImageToWorldMatrix)
-                # We could use a single slicer.vtkSlicerSegmentationsModuleLogic.ImportLabelmapToSegmentationNode
-                # method call to import all the resulting segments at once but that would put all the imported segments
-                # in a new layer. By using modifySegmentByLabelmap, the number of layers will not increase.
-                self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, segmentID, modifierImage, modificationMode)
-
-                if not split and maxNumberOfSegments <= 0:
-                    # all islands lumped into one segment, so we are done
-                    break
+                self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, selectedSegmentID, modifierImage,
+                                                            slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeSet)
+            else:
+                self._addIslandsToSegments(islandImage, labelValues, segmentation, selectedSegment, selectedSegmentID,
+                                           baseSegmentName, maxNumberOfSegments, split)
 
         qt.QApplication.restoreOverrideCursor()
 
+    def _addIslandsToSegments(self, islandImage, labelValues, segmentation, selectedSegment, selectedSegmentID,
+                              baseSegmentName, maxNumberOfSegments, split):
+        """Copy each island of the labeled island image into the selected or a new segment.
+
+        Bounding box of all islands is computed in a single pass over the island image and each island
+        is extracted only within its bounding box, so that the computation time is proportional to the
+        volume size plus the total size of the islands (instead of number of islands times volume size).
+        """
+        import numpy as np
+        import scipy.ndimage
+        import vtk.util.numpy_support
+
+        islandExtent = islandImage.GetExtent()
+        islandArray = vtk.util.numpy_support.vtk_to_numpy(islandImage.GetPointData().GetScalars()).reshape(
+            tuple(reversed(islandImage.GetDimensions())))
+        # Bounding box of all islands, the item at index N-1 contains the bounding box of label N
+        islandSlices = scipy.ndimage.find_objects(islandArray)
+
+        imageToWorldMatrix = vtk.vtkMatrix4x4()
+        islandImage.GetImageToWorldMatrix(imageToWorldMatrix)
+        segmentationNode = self.scriptedEffect.parameterSetNode().GetSegmentationNode()
+        binaryLabelmapRepresentationName = slicer.vtkSegmentationConverter.GetSegmentationBinaryLabelmapRepresentationName()
+
+        for i in range(labelValues.GetNumberOfTuples()):
+            if maxNumberOfSegments > 0 and i >= maxNumberOfSegments:
+                # We only care about the segments up to maxNumberOfSegments.
+                # If we do not want to split segments, we only care about the first.
+                break
+
+            labelValue = int(labelValues.GetTuple1(i))
+            if labelValue < 1 or labelValue > len(islandSlices) or islandSlices[labelValue - 1] is None:
+                continue
+            islandSlice = islandSlices[labelValue - 1]
+
+            segmentID = selectedSegmentID
+            if i != 0 and split:
+                segment = slicer.vtkSegment()
+                segment.SetName(baseSegmentName + "_" + str(i + 1))
+                # Add the segment to the same shared labelmap layer as the selected segment
+                segment.AddRepresentation(binaryLabelmapRepresentationName,
+                                          selectedSegment.GetRepresentation(binaryLabelmapRepresentationName))
+                segmentation.AddSegment(segment)
+                segmentID = segmentation.GetSegmentIdBySegment(segment)
+                segment.SetLabelValue(segmentation.GetUniqueLabelValueForSharedLabelmap(selectedSegmentID))
+
+            # Create modifier labelmap that only covers the bounding box of the island
+            modifierImage = slicer.vtkOrientedImageData()
+            modifierImage.SetExtent(
+                islandExtent[0] + islandSlice[2].start, islandExtent[0] + islandSlice[2].stop - 1,
+                islandExtent[2] + islandSlice[1].start, islandExtent[2] + islandSlice[1].stop - 1,
+                islandExtent[4] + islandSlice[0].start, islandExtent[4] + islandSlice[0].stop - 1)
+            modifierImage.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
+            modifierArray = vtk.util.numpy_support.vtk_to_numpy(modifierImage.GetPointData().GetScalars()).reshape(
+                tuple(reversed(modifierImage.GetDimensions())))
+            np.equal(islandArray[islandSlice], labelValue, out=modifierArray, casting="unsafe")
+            modifierImage.GetPointData().GetScalars().Modified()
+            modifierImage.SetGeometryFromImageToWorldMatrix(imageToWorldMatrix)
+
+            # We could use a single slicer.vtkSlicerSegmentationsModuleLogic.ImportLabelmapToSegmentationNode
+            # method call to import all the resulting segments at once but that would put all the imported segments
+            # in a new layer. By using modifySegmentByLabelmap, the number of layers will not increase.
+            # The segment has been erased already, therefore each island can be added.
+            self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, segmentID, modifierImage,
+                                                        slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeAdd)
+
     def processInteractionEvents(self, callerInteractor, eventId, viewWidget):
         import vtkSegmentationCorePython as vtkSegmentationCore
 
@@ -342,37 +342,45 @@ Fill inside and outside operation creates a binary labelmap volume as output, wi
         maskExtent: optional output to return computed mask extent (expected input is a 6-element list)
         fillValues: list containing one or two fill values. If fill mode is inside or outside then only one value is specified in the list.
           If fill mode is inside&outside then the list must contain two values: first is the inside fill, second is the outside fill value.
+
+        No temporary nodes are added to the scene. Peak memory usage (in addition to the input volume) is one output volume,
+        one 8-bit mask of the input volume size, and for soft edge a few float32 slabs of the region that is within
+        the edge margin of the segment's bounding box.
         """
 
         import vtk  # without this we get the error: UnboundLocalError: local variable 'vtk' referenced before assignment
+        import vtkSegmentationCorePython as vtkSegmentationCore
 
         segmentIDs = vtk.vtkStringArray()
         segmentIDs.InsertNextValue(segmentID)
-        maskVolumeNode = slicer.modules.volumes.logic().CreateAndAddLabelVolume(inputVolumeNode, "TemporaryVolumeMask")
-        if not maskVolumeNode:
-            logging.error("maskVolumeWithSegment failed: invalid maskVolumeNode")
+        if not segmentationNode.GetSegmentation().CreateRepresentation(
+                vtkSegmentationCore.vtkSegmentationConverter.GetSegmentationBinaryLabelmapRepresentationName()):
+            logging.error("maskVolumeWithSegment failed: unable to convert segment to binary labelmap representation")
             return False
 
-        if not slicer.vtkSlicerSegmentationsModuleLogic.ExportSegmentsToLabelmapNode(segmentationNode, segmentIDs, maskVolumeNode, inputVolumeNode):
-            logging.error("maskVolumeWithSegment failed: ExportSegmentsToLabelmapNode error")
-            slicer.mrmlScene.RemoveNode(maskVolumeNode.GetDisplayNode().GetColorNode())
-            slicer.mrmlScene.RemoveNode(maskVolumeNode.GetDisplayNode())
-            slicer.mrmlScene.RemoveNode(maskVolumeNode)
+        # Segment labelmap resampled to the geometry of the input volume
+        segmentLabelmap = slicer.vtkOrientedImageData()
+        slicer.vtkSlicerSegmentationsModuleLogic.GenerateMergedLabelmapInReferenceGeometry(
+            segmentationNode, inputVolumeNode, segmentIDs, vtkSegmentationCore.vtkSegmentation.EXTENT_REFERENCE_GEOMETRY, segmentLabelmap)
+        if segmentLabelmap.GetPointData().GetScalars() is None:
+            logging.error("maskVolumeWithSegment failed: cannot generate segment labelmap")
             return False
 
-        if maskExtent:
-            img = slicer.modules.segmentations.logic().CreateOrientedImageDataFromVolumeNode(maskVolumeNode)
-            img.UnRegister(None)
-
-            import vtkSegmentationCorePython as vtkSegmentationCore
+        # Use the mask in IJK coordinate system (same as the input volume's image data)
+        maskImage = vtk.vtkImageData()
+        maskImage.SetExtent(segmentLabelmap.GetExtent())
+        maskImage.GetPointData().SetScalars(segmentLabelmap.GetPointData().GetScalars())
 
-            vtkSegmentationCore.vtkOrientedImageDataResample.CalculateEffectiveExtent(img, maskExtent, 0)
+        effectiveExtent = [0, -1, 0, -1, 0, -1]
+        vtkSegmentationCore.vtkOrientedImageDataResample.CalculateEffectiveExtent(segmentLabelmap, effectiveExtent, 0)
+        if maskExtent:
+            maskExtent[:] = effectiveExtent
 
         if softEdgeMm == 0:
             # Hard edge
             maskToStencil = vtk.vtkImageToImageStencil()
             maskToStencil.ThresholdByLower(0)
-            maskToStencil.SetInputData(maskVolumeNode.GetImageData())
+            maskToStencil.SetInputData(maskImage)
 
             stencil = vtk.vtkImageStencil()
 
@@ -396,62 +404,117 @@ Fill inside and outside operation creates a binary labelmap volume as output, wi
             outputVolumeNode.SetAndObserveImageData(stencil.GetOutput())
         else:
             # Soft edge
+            resultArray = SegmentEditorMaskVolumeEffect._softEdgeMaskArray(
+                maskImage, effectiveExtent, operationMode, fillValues, inputVolumeNode, softEdgeMm)
+            slicer.util.updateVolumeFromArray(outputVolumeNode, resultArray)
 
-            thresh = vtk.vtkImageThreshold()
-            maskMin = 0
-            maskMax = 255
-            thresh.SetOutputScalarTypeToUnsignedChar()
-            thresh.SetInputData(maskVolumeNode.GetImageData())
-            thresh.ThresholdByLower(0)
-            thresh.SetInValue(maskMin)
-            thresh.SetOutValue(maskMax)
-            thresh.Update()
-
-            gaussianFilter = vtk.vtkImageGaussianSmooth()
-            spacing = maskVolumeNode.GetSpacing()
-            standardDeviationPixel = [1.0, 1.0, 1.0]
-            for idx in range(3):
-                standardDeviationPixel[idx] = softEdgeMm / spacing[idx]
-            gaussianFilter.SetInputConnection(thresh.GetOutputPort())
-            gaussianFilter.SetStandardDeviations(*standardDeviationPixel)
-            # Do not truncate the Gaussian kernel at the default 1.5 sigma,
-            # because it would result in edge artifacts.
-            # Larger value results in less edge artifact but increased computation time,
-            # so 3.0 is a good tradeoff.
-            gaussianFilter.SetRadiusFactor(3.0)
-            gaussianFilter.Update()
-
-            import vtk.util.numpy_support
-
-            maskImage = gaussianFilter.GetOutput()
-            nshape = tuple(reversed(maskImage.GetDimensions()))
-            maskArray = vtk.util.numpy_support.vtk_to_numpy(maskImage.GetPointData().GetScalars()).reshape(nshape)
-            # Normalize mask with the actual min/max values.
-            # Gaussian output is not always exactly the original minimum and maximum, so we get the actual min/max values.
-            maskMin = maskArray.min()
-            maskMax = maskArray.max()
-            mask = (maskArray.astype(float) - maskMin) / float(maskMax - maskMin)
-
-            inputArray = slicer.util.arrayFromVolume(inputVolumeNode)
+        # Set the same geometry and parent transform as the input volume
+        ijkToRas = vtk.vtkMatrix4x4()
+        inputVolumeNode.GetIJKToRASMatrix(ijkToRas)
+        outputVolumeNode.SetIJKToRASMatrix(ijkToRas)
+        inputVolumeNode.SetAndObserveTransformNodeID(inputVolumeNode.GetTransformNodeID())
+
+        return True
+
+    @staticmethod
+    def _normalizeSoftEdgeMask(mask, maskMin, maskMax):
+        """Scale smoothed mask values to the 0..1 range, in place.
+
+        Values are divided by the range instead of multiplied by its reciprocal, because in float32
+        the latter may map the maximum to slightly less than 1.0, which would change voxels fully inside
+        the segment (for example 1000 to 999 after truncation to integer output type).
+        """
+        mask -= maskMin
+        mask /= float(maskMax - maskMin) if maskMax > maskMin else 255.0
+        return mask
 
+    @staticmethod
+    def _softEdgeMaskArray(maskImage, effectiveExtent, operationMode, fillValues, inputVolumeNode, softEdgeMm, maxSlabVoxelCount=16 * 1024 * 1024):
+        """Compute output voxel array for soft-edge masking.
+
+        Gaussian smoothing and blending is only computed within the bounding box of the segment
+        (effectiveExtent) plus the Gaussian kernel radius, because voxels farther from the segment
+        are not affected by the soft edge. Blending is computed in slabs of at most maxSlabVoxelCount
+        voxels, using float32 (or float64 for input types that float32 cannot represent accurately).
+        """
+        import math
+        import numpy as np
+        import vtk.util.numpy_support
+
+        inputArray = slicer.util.arrayFromVolume(inputVolumeNode)
+
+        # Voxels far from the segment: outside value of the blending
+        if operationMode == "FILL_INSIDE":
+            resultArray = inputArray.copy()
+        else:
+            resultArray = np.full(inputArray.shape, fillValues[0], dtype=inputArray.dtype)
+
+        if effectiveExtent[0] > effectiveExtent[1] or effectiveExtent[2] > effectiveExtent[3] or effectiveExtent[4] > effectiveExtent[5]:
+            # Empty segment
+            return resultArray
+
+        spacing = inputVolumeNode.GetSpacing()
+        standardDeviationPixel = [1.0, 1.0, 1.0]
+        for idx in range(3):
+            standardDeviationPixel[idx] = softEdgeMm / spacing[idx]
+        # Do not truncate the Gaussian kernel at the default 1.5 sigma,
+        # because it would result in edge artifacts.
+        # Larger value results in less edge artifact but increased computation time,
+        # so 3.0 is a good tradeoff.
+        radiusFactor = 3.0
+
+        wholeExtent = maskImage.GetExtent()
+        cropExtent = [0, -1, 0, -1, 0, -1]
+        for axis in range(3):
+            margin = math.ceil(standardDeviationPixel[axis] * radiusFactor) + 1
+            cropExtent[axis * 2] = max(wholeExtent[axis * 2], effectiveExtent[axis * 2] - margin)
+            cropExtent[axis * 2 + 1] = min(wholeExtent[axis * 2 + 1], effectiveExtent[axis * 2 + 1] + margin)
+
+        clip = vtk.vtkImageClip()
+        clip.SetInputData(maskImage)
+        clip.SetOutputWholeExtent(cropExtent)
+        clip.ClipDataOn()
+
+        thresh = vtk.vtkImageThreshold()
+        thresh.SetOutputScalarTypeToUnsignedChar()
+        thresh.SetInputConnection(clip.GetOutputPort())
+        thresh.ThresholdByLower(0)
+        thresh.SetInValue(0)
+        thresh.SetOutValue(255)
+
+        gaussianFilter = vtk.vtkImageGaussianSmooth()
+        gaussianFilter.SetInputConnection(thresh.GetOutputPort())
+        gaussianFilter.SetStandardDeviations(*standardDeviationPixel)
+        gaussianFilter.SetRadiusFactor(radiusFactor)
+        gaussianFilter.Update()
+
+        smoothedMaskImage = gaussianFilter.GetOutput()
+        smoothedMaskArray = vtk.util.numpy_support.vtk_to_numpy(smoothedMaskImage.GetPointData().GetScalars()).reshape(
+            tuple(reversed(smoothedMaskImage.GetDimensions())))
+
+        # Normalize mask with the actual min/max values.
+        # Gaussian output is not always exactly the original minimum and maximum, so we get the actual min/max values.
+        # Voxels outside the cropped region are all 0.
+        maskMin = smoothedMaskArray.min() if list(cropExtent) == list(wholeExtent) else 0
+        maskMax = smoothedMaskArray.max()
+
+        computeType = np.result_type(inputArray.dtype, np.float32)
+        cropSlices = tuple(slice(cropExtent[axis * 2] - wholeExtent[axis * 2], cropExtent[axis * 2 + 1] - wholeExtent[axis * 2] + 1)
+                           for axis in reversed(range(3)))
+        inputCropArray = inputArray[cropSlices]
+        resultCropArray = resultArray[cropSlices]
+        sliceVoxelCount = smoothedMaskArray.shape[1] * smoothedMaskArray.shape[2]
+        slabSliceCount = max(1, maxSlabVoxelCount // sliceVoxelCount)
+        for slabStart in range(0, smoothedMaskArray.shape[0], slabSliceCount):
+            slab = slice(slabStart, slabStart + slabSliceCount)
+            mask = SegmentEditorMaskVolumeEffect._normalizeSoftEdgeMask(smoothedMaskArray[slab].astype(computeType), maskMin, maskMax)
             if operationMode == "FILL_INSIDE_AND_OUTSIDE":
                 # Rescale the smoothed mask
-                resultArray = fillValues[0] + (fillValues[1] - fillValues[0]) * mask[:]
+                resultCropArray[slab] = fillValues[0] + (fillValues[1] - fillValues[0]) * mask
             else:
                 # Compute weighted average between blanked out and input volume
                 if operationMode == "FILL_INSIDE":
                     mask = 1.0 - mask
-                resultArray = inputArray[:] * mask[:] + float(fillValues[0]) * (1.0 - mask[:])
-
-            slicer.util.updateVolumeFromArray(outputVolumeNode, resultArray.astype(inputArray.dtype))
+                resultCropArray[slab] = inputCropArray[slab] * mask + float(fillValues[0]) * (1.0 - mask)
 
-        # Set the same geometry and parent transform as the input volume
-        ijkToRas = vtk.vtkMatrix4x4()
-        inputVolumeNode.GetIJKToRASMatrix(ijkToRas)
-        outputVolumeNode.SetIJKToRASMatrix(ijkToRas)
-        inputVolumeNode.SetAndObserveTransformNodeID(inputVolumeNode.GetTransformNodeID())
-
-        slicer.mrmlScene.RemoveNode(maskVolumeNode.GetDisplayNode().GetColorNode())
-        slicer.mrmlScene.RemoveNode(maskVolumeNode.GetDisplayNode())
-        slicer.mrmlScene.RemoveNode(maskVolumeNode)
-        return True
+        return resultArray
@@ -436,39 +436,68 @@ If segments overlap, segment higher in the segments table will have priority. <b
         polyDataToImageStencil.SetInputConnection(geometryFilter.GetOutputPort())
         polyDataToImageStencil.SetOutputSpacing(1, 1, 1)
         polyDataToImageStencil.SetOutputOrigin(0, 0, 0)
-        polyDataToImageStencil.SetOutputWholeExtent(mergedImage.GetExtent())
 
         # Convert stencil to image
         stencil = vtk.vtkImageStencil()
-        emptyBinaryLabelMap = vtk.vtkImageData()
-        emptyBinaryLabelMap.SetExtent(mergedImage.GetExtent())
-        emptyBinaryLabelMap.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
-        vtkSegmentationCore.vtkOrientedImageDataResample.FillImage(emptyBinaryLabelMap, 0)
-        stencil.SetInputData(emptyBinaryLabelMap)
         stencil.SetStencilConnection(polyDataToImageStencil.GetOutputPort())
         stencil.ReverseStencilOn()
         stencil.SetBackgroundValue(1)  # General foreground value is 1 (background value because of reverse stencil)
 
         imageToWorldMatrix = vtk.vtkMatrix4x4()
         mergedImage.GetImageToWorldMatrix(imageToWorldMatrix)
+        mergedExtent = mergedImage.GetExtent()
 
         # TODO: Temporarily setting the overwrite mode to OverwriteVisibleSegments is an approach that should be change once additional
         # layer control options have been implemented. Users may wish to keep segments on separate layers, and not allow them to be
         # separated/merged automatically. This effect could leverage those options once they have been implemented.
         oldOverwriteMode = self.scriptedEffect.parameterSetNode().GetOverwriteMode()
         self.scriptedEffect.parameterSetNode().SetOverwriteMode(slicer.vtkMRMLSegmentEditorNode.OverwriteVisibleSegments)
-        for segmentId, labelValue in segmentLabelValues:
-            threshold.SetLowerThreshold(labelValue)
-            threshold.SetUpperThreshold(labelValue)
-            threshold.SetThresholdFunction(vtk.vtkThreshold.THRESHOLD_BETWEEN)
-            stencil.Update()
-            smoothedBinaryLabelMap = slicer.vtkOrientedImageData()
-            smoothedBinaryLabelMap.ShallowCopy(stencil.GetOutput())
-            smoothedBinaryLabelMap.SetImageToWorldMatrix(imageToWorldMatrix)
-            self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, segmentId, smoothedBinaryLabelMap,
-                                                        slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeSet, False)
+        # Marching cubes and smoothing are computed only once for all segments (the pipeline is not modified
+        # when the threshold changes). Writing results is batched so that the segmentation is modified only once.
+        with slicer.util.NodeModify(segmentationNode):
+            for segmentId, labelValue in segmentLabelValues:
+                threshold.SetLowerThreshold(labelValue)
+                threshold.SetUpperThreshold(labelValue)
+                threshold.SetThresholdFunction(vtk.vtkThreshold.THRESHOLD_BETWEEN)
+                geometryFilter.Update()
+
+                # Rasterize the smoothed surface only within its bounding box (in voxel coordinates)
+                # instead of the entire merged labelmap extent.
+                segmentExtent = self.getPolyDataVoxelExtent(geometryFilter.GetOutput(), mergedExtent)
+                emptyBinaryLabelMap = vtk.vtkImageData()
+                emptyBinaryLabelMap.SetExtent(segmentExtent)
+                emptyBinaryLabelMap.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
+                vtkSegmentationCore.vtkOrientedImageDataResample.FillImage(emptyBinaryLabelMap, 0)
+                polyDataToImageStencil.SetOutputWholeExtent(segmentExtent)
+                stencil.SetInputData(emptyBinaryLabelMap)
+                stencil.Update()
+
+                smoothedBinaryLabelMap = slicer.vtkOrientedImageData()
+                smoothedBinaryLabelMap.ShallowCopy(stencil.GetOutput())
+                smoothedBinaryLabelMap.SetImageToWorldMatrix(imageToWorldMatrix)
+                self.scriptedEffect.modifySegmentByLabelmap(segmentationNode, segmentId, smoothedBinaryLabelMap,
+                                                            slicer.qSlicerSegmentEditorAbstractEffect.ModificationModeSet, False)
         self.scriptedEffect.parameterSetNode().SetOverwriteMode(oldOverwriteMode)
 
+    @staticmethod
+    def getPolyDataVoxelExtent(polyData, wholeExtent, margin=1):
+        """Get extent of voxels covered by the polydata (with points in voxel coordinates),
+        padded by margin and clipped to the whole extent.
+        If the polydata is empty then a single-voxel extent is returned.
+        """
+        import math
+
+        if polyData.GetNumberOfPoints() == 0:
+            return [wholeExtent[0], wholeExtent[0], wholeExtent[2], wholeExtent[2], wholeExtent[4], wholeExtent[4]]
+        bounds = polyData.GetBounds()
+        extent = [0, -1, 0, -1, 0, -1]
+        for axis in range(3):
+            extent[axis * 2] = max(wholeExtent[axis * 2], math.floor(bounds[axis * 2]) - margin)
+            extent[axis * 2 + 1] = min(wholeExtent[axis * 2 + 1], math.ceil(bounds[axis * 2 + 1]) + margin)
+            # Surface may be outside of the whole extent
+            extent[axis * 2 + 1] = max(extent[axis * 2 + 1], extent[axis * 2])
+        return extent
+
     def paintApply(self, viewWidget):
         # Current limitation: smoothing brush is not implemented for joint smoothing
         smoothingMethod = self.scriptedEffect.parameter("SmoothingMethod")
@@ -4,6 +4,7 @@ import weakref
 
 import ctk
 import vtk
+import vtk.util.numpy_support
 import qt
 
 import slicer
@@ -59,6 +60,11 @@ class SegmentEditorThresholdEffect(AbstractScriptedSegmentEditorEffect):
         self.imageAccumulate.SetInputConnection(0, self.reslice.GetOutputPort())
         self.imageAccumulate.SetInputConnection(1, self.stencil.GetOutputPort())
 
+        # Inputs and results of the last histogram computation, to avoid recomputing
+        # the histogram when only the selection or threshold setting mode changes
+        self.histogramCacheKey = None
+        self.histogramCacheStatistics = None
+
         self.selectionStartPosition = None
         self.selectionEndPosition = None
 
@@ -824,6 +830,7 @@ class SegmentEditorThresholdEffect(AbstractScriptedSegmentEditorEffect):
         masterImageData = self.scriptedEffect.sourceVolumeImageData()
         if masterImageData is None or self.histogramPipeline is None:
             self.histogramFunction.RemoveAllPoints()
+            self.histogramCacheKey = None
             return
 
         # Ensure that the brush is in the correct location
@@ -840,16 +847,13 @@ class SegmentEditorThresholdEffect(AbstractScriptedSegmentEditorEffect):
             brushExtent[2 * i + 1] = vtk.vtkMath.Ceil(brushBounds[2 * i + 1])
         if brushExtent[0] > brushExtent[1] or brushExtent[2] > brushExtent[3] or brushExtent[4] > brushExtent[5]:
             self.histogramFunction.RemoveAllPoints()
+            self.histogramCacheKey = None
             return
 
         layerLogic = self.getSourceVolumeLayerLogic(self.histogramPipeline.sliceWidget)
-        self.reslice.SetInputConnection(layerLogic.GetReslice().GetInputConnection(0, 0))
-        self.reslice.SetResliceTransform(layerLogic.GetReslice().GetResliceTransform())
-        self.reslice.SetInterpolationMode(layerLogic.GetReslice().GetInterpolationMode())
-        self.reslice.SetOutputExtent(brushExtent)
+        sourceReslice = layerLogic.GetReslice()
 
         maxNumberOfBins = 1000
-        masterImageData = self.scriptedEffect.sourceVolumeImageData()
         scalarRange = masterImageData.GetScalarRange()
         scalarType = masterImageData.GetScalarType()
         if scalarType == vtk.VTK_FLOAT or scalarType == vtk.VTK_DOUBLE:
@@ -859,22 +863,43 @@ class SegmentEditorThresholdEffect(AbstractScriptedSegmentEditorEffect):
         numberOfBins = min(numberOfBins, maxNumberOfBins)
         binSpacing = (scalarRange[1] - scalarRange[0] + 1) / numberOfBins
 
-        self.imageAccumulate.SetComponentExtent(0, numberOfBins - 1, 0, 0, 0, 0)
-        self.imageAccumulate.SetComponentSpacing(binSpacing, binSpacing, binSpacing)
-        self.imageAccumulate.SetComponentOrigin(scalarRange[0], scalarRange[0], scalarRange[0])
-
-        self.imageAccumulate.Update()
-
-        self.histogramFunction.RemoveAllPoints()
-        tableSize = self.imageAccumulate.GetOutput().GetPointData().GetScalars().GetNumberOfTuples()
-        for i in range(tableSize):
-            value = self.imageAccumulate.GetOutput().GetPointData().GetScalars().GetTuple1(i)
-            self.histogramFunction.AddPoint(binSpacing * i + scalarRange[0], value)
-        self.histogramFunction.AdjustRange(scalarRange)
-
-        lower = self.imageAccumulate.GetMin()[0]
-        average = self.imageAccumulate.GetMean()[0]
-        upper = self.imageAccumulate.GetMax()[0]
+        # Only recompute the histogram if the volume, slice position, or brush region changed
+        import numpy as np
+
+        brushPoints = brushPolydata.GetPoints()
+        brushPointsHash = hash(vtk.util.numpy_support.vtk_to_numpy(brushPoints.GetData()).tobytes()) if brushPoints else 0
+        resliceTransform = sourceReslice.GetResliceTransform()
+        histogramCacheKey = (
+            masterImageData, masterImageData.GetMTime(),
+            resliceTransform, resliceTransform.GetMTime() if resliceTransform else 0,
+            sourceReslice.GetInterpolationMode(),
+            tuple(brushExtent), brushPointsHash, numberOfBins)
+
+        if histogramCacheKey != self.histogramCacheKey:
+            self.reslice.SetInputConnection(sourceReslice.GetInputConnection(0, 0))
+            self.reslice.SetResliceTransform(resliceTransform)
+            self.reslice.SetInterpolationMode(sourceReslice.GetInterpolationMode())
+            self.reslice.SetOutputExtent(brushExtent)
+
+            self.imageAccumulate.SetComponentExtent(0, numberOfBins - 1, 0, 0, 0, 0)
+            self.imageAccumulate.SetComponentSpacing(binSpacing, binSpacing, binSpacing)
+            self.imageAccumulate.SetComponentOrigin(scalarRange[0], scalarRange[0], scalarRange[0])
+
+            self.imageAccumulate.Update()
+
+            # Set all histogram points at once (x0, y0, x1, y1, ...) instead of adding them one by one
+            binValues = vtk.util.numpy_support.vtk_to_numpy(self.imageAccumulate.GetOutput().GetPointData().GetScalars())
+            histogramPoints = np.empty((len(binValues), 2))
+            histogramPoints[:, 0] = binSpacing * np.arange(len(binValues)) + scalarRange[0]
+            histogramPoints[:, 1] = binValues
+            self.histogramFunction.FillFromDataPointer(len(binValues), histogramPoints.ravel())
+            self.histogramFunction.AdjustRange(scalarRange)
+
+            self.histogramCacheKey = histogramCacheKey
+            self.histogramCacheStatistics = (
+                self.imageAccumulate.GetMin()[0], self.imageAccumulate.GetMean()[0], self.imageAccumulate.GetMax()[0])
+
+        lower, average, upper = self.histogramCacheStatistics
 
         # If there is a selection, then set the threshold based on that
         if self.selectionStartPosition is not None and self.selectionEndPosition is not None:
@@ -40,7 +40,10 @@ class SegmentationsModuleTest2(unittest.TestCase):
         self.TestSection_SetupScene()
         self.TestSection_SharedLabelmapMultipleLayerEditing()
         self.TestSection_IslandEffects()
+        self.TestSection_IslandEffectsSplitManyIslands()
         self.TestSection_MarginEffects()
+        self.TestSection_JointSmoothingEffect()
+        self.TestSection_MaskVolumeSoftEdge()
         self.TestSection_MaskingSettings()
         self.TestSection_GrowFromSeedsEffect()
         logging.info("Test finished")
@@ -91,6 +94,7 @@ class SegmentationsModuleTest2(unittest.TestCase):
         self.eraseEffect = slicer.modules.segmenteditor.widgetRepresentation().self().editor.effectByName("Erase")
         self.islandEffect = slicer.modules.segmenteditor.widgetRepresentation().self().editor.effectByName("Islands")
         self.thresholdEffect = slicer.modules.segmenteditor.widgetRepresentation().self().editor.effectByName("Threshold")
+        self.smoothingEffect = slicer.modules.segmenteditor.widgetRepresentation().self().editor.effectByName("Smoothing")
 
         self.segmentEditorNode = slicer.util.getNode("SegmentEditor")
         self.assertIsNotNone(self.segmentEditorNode)
@@ -192,6 +196,41 @@ class SegmentationsModuleTest2(unittest.TestCase):
                 continue
             self.checkSegmentVoxelCount(i, size)
 
+    # ------------------------------------------------------------------------------
+    def TestSection_IslandEffectsSplitManyIslands(self):
+        import time
+
+        logging.info("Running test on splitting many islands")
+
+        # Grid of 10x10x5 single-voxel islands, separated by background voxels
+        self.segmentation.RemoveAllSegments()
+        islandsLabelmap = vtkSegmentationCore.vtkOrientedImageData()
+        islandsLabelmap.SetImageToWorldMatrix(self.ijkToRas)
+        self.setupIslandLabelmap(islandsLabelmap, [0, 99, 0, 99, 0, 49], 0)
+        numberOfIslands = 0
+        for k in range(0, 50, 10):
+            for j in range(0, 100, 10):
+                for i in range(0, 100, 10):
+                    islandsLabelmap.SetScalarComponentFromFloat(i, j, k, 0, 1)
+                    numberOfIslands += 1
+
+        segment = slicer.vtkSegment()
+        segment.SetName("Segment_1")
+        segment.AddRepresentation(self.binaryLabelmapReprName, islandsLabelmap)
+        self.segmentation.AddSegment(segment)
+        self.segmentEditorNode.SetSelectedSegmentID(self.segmentation.GetSegmentIdBySegment(segment))
+
+        self.islandEffect.setParameter("MinimumSize", 0)
+        self.islandEffect.setParameter("Operation", "SPLIT_ISLANDS_TO_SEGMENTS")
+        startTime = time.time()
+        self.islandEffect.self().onApply()
+        logging.info(f"Split {numberOfIslands} islands into segments in {time.time() - startTime:.2f}s")
+
+        self.assertEqual(self.segmentation.GetNumberOfSegments(), numberOfIslands)
+        self.assertEqual(self.segmentation.GetNumberOfLayers(), 1)
+        for segmentIndex in [0, numberOfIslands // 2, numberOfIslands - 1]:
+            self.checkSegmentVoxelCount(segmentIndex, 1)
+
     # ------------------------------------------------------------------------------
     def resetIslandSegments(self, islandSizes):
         self.segmentation.RemoveAllSegments()
@@ -253,6 +292,89 @@ class SegmentationsModuleTest2(unittest.TestCase):
         labelmap.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
         labelmap.GetPointData().GetScalars().Fill(value)
 
+    # ------------------------------------------------------------------------------
+    def TestSection_JointSmoothingEffect(self):
+        logging.info("Running test on joint smoothing effect")
+
+        self.segmentation.RemoveAllSegments()
+        self.segmentationNode.CreateDefaultDisplayNodes()
+        segmentIds = []
+        for segmentIndex in range(3):
+            segmentId = self.segmentation.AddEmptySegment(f"Segment_{segmentIndex + 1}")
+            segmentIds.append(segmentId)
+            # Adjacent boxes along the first axis
+            boxLabelmap = vtkSegmentationCore.vtkOrientedImageData()
+            boxLabelmap.SetImageToWorldMatrix(self.ijkToRas)
+            self.setupIslandLabelmap(boxLabelmap, [segmentIndex * 6, segmentIndex * 6 + 5, 0, 5, 0, 5])
+            self.segmentEditorNode.SetSelectedSegmentID(segmentId)
+            self.paintEffect.modifySelectedSegmentByLabelmap(boxLabelmap, self.paintEffect.ModificationModeSet)
+
+        self.smoothingEffect.setParameter("SmoothingMethod", "JOINT_TAUBIN")
+        self.smoothingEffect.self().onApply()
+
+        self.assertEqual(self.segmentation.GetNumberOfLayers(), 1)
+        for segmentIndex in range(len(segmentIds)):
+            labelmap = slicer.vtkOrientedImageData()
+            self.segmentationNode.GetBinaryLabelmapRepresentation(segmentIds[segmentIndex], labelmap)
+            imageStat = vtk.vtkImageAccumulate()
+            imageStat.SetInputData(labelmap)
+            imageStat.IgnoreZeroOn()
+            imageStat.Update()
+            self.assertGreater(imageStat.GetVoxelCount(), 0)
+
+    # ------------------------------------------------------------------------------
+    def TestSection_MaskVolumeSoftEdge(self):
+        import tracemalloc
+        from SegmentEditorEffects import SegmentEditorMaskVolumeEffect
+
+        logging.info("Running test on soft-edge volume masking")
+
+        self.segmentation.RemoveAllSegments()
+        segmentId = self.segmentation.AddEmptySegment("Segment_1")
+        self.segmentEditorNode.SetSelectedSegmentID(segmentId)
+        boxLabelmap = vtkSegmentationCore.vtkOrientedImageData()
+        boxLabelmap.SetImageToWorldMatrix(self.ijkToRas)
+        self.setupIslandLabelmap(boxLabelmap, [2, 8, 2, 8, 2, 6])
+        self.paintEffect.modifySelectedSegmentByLabelmap(boxLabelmap, self.paintEffect.ModificationModeSet)
+
+        outputVolumeNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLScalarVolumeNode")
+        numberOfNodes = slicer.mrmlScene.GetNumberOfNodes()
+        inputArray = slicer.util.arrayFromVolume(self.sourceVolumeNode)
+        maskExtent = [0] * 6
+
+        tracemalloc.start()
+        success = SegmentEditorMaskVolumeEffect.maskVolumeWithSegment(
+            self.segmentationNode, segmentId, "FILL_OUTSIDE", [-1000], self.sourceVolumeNode, outputVolumeNode,
+            maskExtent=maskExtent, softEdgeMm=1.0)
+        _, peakMemoryBytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertTrue(success)
+        # No temporary nodes are left in the scene
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodes(), numberOfNodes)
+        self.assertEqual(maskExtent, [2, 8, 2, 8, 2, 6])
+        # Peak memory of numpy arrays is one output array plus float slabs within the edge margin of the segment
+        # (full-volume float64 arrays would require at least 4x the input array size for a 16-bit input volume).
+        logging.info(f"Soft-edge masking peak memory: {peakMemoryBytes} bytes, input volume size: {inputArray.nbytes} bytes")
+        self.assertLess(peakMemoryBytes, 1.5 * inputArray.nbytes + 1024 * 1024)
+
+        outputArray = slicer.util.arrayFromVolume(outputVolumeNode)
+        self.assertEqual(outputArray.shape, inputArray.shape)
+        self.assertEqual(outputArray.dtype, inputArray.dtype)
+        # Far from the segment the fill value is used, inside the segment the input is preserved
+        self.assertEqual(outputArray[-1, -1, -1], -1000)
+        self.assertEqual(outputArray[4, 5, 5], inputArray[4, 5, 5])
+
+        # Voxels fully inside the segment keep their value for any smoothed mask maximum
+        # (multiplying by the reciprocal of the range in float32 would map some maxima, such as 41, to 0.99999994)
+        import numpy as np
+        for maskMax in range(1, 256):
+            mask = SegmentEditorMaskVolumeEffect._normalizeSoftEdgeMask(np.array([0, maskMax], dtype=np.float32), 0, maskMax)
+            self.assertEqual(mask[1], 1.0)
+            blendedArray = np.zeros(2, dtype=np.int16)
+            blendedArray[:] = np.array([1000, 1000], dtype=np.int16) * mask + float(-1000) * (1.0 - mask)
+            self.assertEqual(blendedArray[1], 1000)
+
     # ------------------------------------------------------------------------------
     def TestSection_MarginEffects(self):
         logging.info("Running test on margin effect")
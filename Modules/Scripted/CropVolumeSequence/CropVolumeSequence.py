@@ -152,8 +152,11 @@ class CropVolumeSequenceWidget(ScriptedLoadableModuleWidget):
         slicer.app.openNodeModule(self.cropParametersSelector.currentNode())
 
     def onApplyButton(self):
+        import os
+
         logic = CropVolumeSequenceLogic()
-        logic.run(self.inputSelector.currentNode(), self.outputSelector.currentNode(), self.cropParametersSelector.currentNode())
+        logic.runBatch(self.inputSelector.currentNode(), self.outputSelector.currentNode(), self.cropParametersSelector.currentNode(),
+                       maximumNumberOfWorkers=os.cpu_count() or 1)
 
 
 #
@@ -206,12 +209,7 @@ class CropVolumeSequenceLogic(ScriptedLoadableModuleLogic):
         if outputVolSeq:
             # Get original parent transform, if any (before erasing all the proxy nodes)
             outputVolTransformNodeID = self.transformForSequence(outputVolSeq)
-
-            # Initialize output sequence
-            outputVolSeq.RemoveAllDataNodes()
-            outputVolSeq.SetIndexType(inputVolSeq.GetIndexType())
-            outputVolSeq.SetIndexName(inputVolSeq.GetIndexName())
-            outputVolSeq.SetIndexUnit(inputVolSeq.GetIndexUnit())
+            self.initializeOutputSequence(inputVolSeq, outputVolSeq)
             outputVolume = slicer.mrmlScene.AddNewNodeByClass(inputVolume.GetClassName())
             outputVolume.SetAndObserveTransformNodeID(outputVolTransformNodeID)
             cropParameters.SetOutputVolumeNodeID(outputVolume.GetID())
@@ -219,17 +217,7 @@ class CropVolumeSequenceLogic(ScriptedLoadableModuleLogic):
             outputVolume = None
             cropParameters.SetOutputVolumeNodeID(inputVolume.GetID())
 
-        # Make sure we can record data into the output sequence is not overwritten by any browser nodes
-        browserNodesForOutputSequence = vtk.vtkCollection()
-        playSuspendedForBrowserNodes = []
-        slicer.modules.sequences.logic().GetBrowserNodesForSequenceNode(outputVolSeq, browserNodesForOutputSequence)
-        for i in range(browserNodesForOutputSequence.GetNumberOfItems()):
-            browserNodeForOutputSequence = browserNodesForOutputSequence.GetItemAsObject(i)
-            if browserNodeForOutputSequence == seqBrowser:
-                continue
-            if browserNodeForOutputSequence.GetPlayback(outputVolSeq):
-                browserNodeForOutputSequence.SetPlayback(outputVolSeq, False)
-                playSuspendedForBrowserNodes.append(browserNodeForOutputSequence)
+        playSuspendedForBrowserNodes = self.suspendPlayback(outputVolSeq, seqBrowser)
 
         try:
             qt.QApplication.setOverrideCursor(qt.Qt.WaitCursor)
@@ -254,37 +242,257 @@ class CropVolumeSequenceLogic(ScriptedLoadableModuleLogic):
             # Temporary input volume proxy node
             slicer.mrmlScene.RemoveNode(inputVolume)
 
-            # Move output sequence node in the same browser node as the input volume sequence
-            # if not in a sequence browser node already.
+            self.finalizeOutputSequence(inputVolSeq, outputVolSeq, outputVolTransformNodeID, playSuspendedForBrowserNodes)
+
+        logging.info("Processing completed")
+
+    def runBatch(self, inputVolSeq, outputVolSeq, cropParameters, maximumNumberOfWorkers=1):
+        """Crop all the volumes of a sequence, without going through a sequence browser proxy node.
+
+        Data nodes are read directly from the input sequence and the application does not process
+        events or render between frames, which makes this much faster than :py:meth:`run` for
+        long sequences. Voxel-based cropping is computed in ``maximumNumberOfWorkers`` parallel
+        threads if it is larger than 1. Interpolated cropping uses the resampling CLI module
+        and is always performed one frame at a time.
+
+        :param inputVolSeq: sequence node of volumes to crop.
+        :param outputVolSeq: sequence node where cropped volumes are stored. If ``None`` or same as
+          ``inputVolSeq`` then the input sequence is overwritten.
+        :param cropParameters: crop volume parameters node, specifying the ROI and cropping options.
+          Input and output volume node IDs of the parameters node are not modified.
+        :param maximumNumberOfWorkers: maximum number of threads used for voxel-based cropping.
+        :return: number of processed frames per second.
+        :raises RuntimeError: in case of failure
+        """
+        import time
+
+        logging.info("Batch processing started")
+        startTime = time.time()
+
+        inputVolTransformNodeID = self.transformForSequence(inputVolSeq)
+        if outputVolSeq == inputVolSeq:
+            outputVolSeq = None
+        outputVolTransformNodeID = self.transformForSequence(outputVolSeq) if outputVolSeq else None
+
+        numberOfDataNodes = inputVolSeq.GetNumberOfDataNodes()
+        if numberOfDataNodes == 0:
+            raise RuntimeError(_("Input volume sequence is empty"))
+        roiNode = slicer.mrmlScene.GetNodeByID(cropParameters.GetROINodeID())
+        if not roiNode:
+            raise RuntimeError(_("Cropping region is not specified"))
+
+        # Values of the data nodes are stored in the output sequence after all frames are processed,
+        # so that the input sequence can be overwritten.
+        indexValues = [inputVolSeq.GetNthIndexValue(seqItemNumber) for seqItemNumber in range(numberOfDataNodes)]
+
+        # Temporary nodes that refer to the image data of the currently processed frame.
+        # They are needed because the cropping geometry is computed from the ROI node and volume nodes in the main scene.
+        inputVolume = slicer.mrmlScene.AddNewNodeByClass(inputVolSeq.GetNthDataNode(0).GetClassName())
+        inputVolume.SetAndObserveTransformNodeID(inputVolTransformNodeID)
+        outputVolume = slicer.mrmlScene.AddNewNodeByClass(inputVolume.GetClassName())
+        outputVolume.SetAndObserveTransformNodeID(outputVolTransformNodeID)
+
+        originalInputVolumeNodeID = cropParameters.GetInputVolumeNodeID()
+        originalOutputVolumeNodeID = cropParameters.GetOutputVolumeNodeID()
+        playSuspendedForBrowserNodes = []
+
+        try:
+            qt.QApplication.setOverrideCursor(qt.Qt.WaitCursor)
+            if cropParameters.GetVoxelBased() and maximumNumberOfWorkers > 1:
+                outputImages = self._cropVoxelBasedParallel(
+                    inputVolSeq, inputVolume, roiNode, cropParameters.GetFillValue(), maximumNumberOfWorkers)
+            else:
+                outputImages = self._cropSequential(inputVolSeq, inputVolume, outputVolume, cropParameters)
+
             if outputVolSeq:
-                if slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(outputVolSeq) is None:
-                    # Add output sequence to a sequence browser
-                    seqBrowser = slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(inputVolSeq)
-                    if seqBrowser:
-                        seqBrowser.AddSynchronizedSequenceNode(outputVolSeq)
-                    else:
-                        seqBrowser = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSequenceBrowserNode")
-                        seqBrowser.SetAndObserveMasterSequenceNodeID(outputVolSeq.GetID())
-                    seqBrowser.SetOverwriteProxyName(outputVolSeq, True)
-
-                    # Show output in slice views
-                    slicer.modules.sequences.logic().UpdateAllProxyNodes()
-                    slicer.app.processEvents()
-                    outputVolume = seqBrowser.GetProxyNode(outputVolSeq)
-                    outputVolume.SetAndObserveTransformNodeID(outputVolTransformNodeID)
-                    slicer.util.setSliceViewerLayers(background=outputVolume)
+                self.initializeOutputSequence(inputVolSeq, outputVolSeq)
+                playSuspendedForBrowserNodes = self.suspendPlayback(outputVolSeq)
+            else:
+                outputVolSeq = inputVolSeq
+            for indexValue, (outputImage, outputIJKToRAS) in zip(indexValues, outputImages):
+                wasModified = outputVolume.StartModify()
+                outputVolume.SetAndObserveImageData(outputImage)
+                outputVolume.SetIJKToRASMatrix(outputIJKToRAS)
+                outputVolume.EndModify(wasModified)
+                outputVolSeq.SetDataNodeAtValue(outputVolume, indexValue)
+            if outputVolSeq == inputVolSeq:
+                outputVolSeq = None
+
+        finally:
+            qt.QApplication.restoreOverrideCursor()
 
+            cropParameters.SetInputVolumeNodeID(originalInputVolumeNodeID)
+            cropParameters.SetOutputVolumeNodeID(originalOutputVolumeNodeID)
+            slicer.mrmlScene.RemoveNode(inputVolume)
+            slicer.mrmlScene.RemoveNode(outputVolume)
+
+            self.finalizeOutputSequence(inputVolSeq, outputVolSeq, outputVolTransformNodeID, playSuspendedForBrowserNodes)
+
+        elapsedTimeSec = time.time() - startTime
+        framesPerSecond = numberOfDataNodes / elapsedTimeSec if elapsedTimeSec > 0 else float("inf")
+        logging.info(f"Batch processing completed: {numberOfDataNodes} frames in {elapsedTimeSec:.2f}s ({framesPerSecond:.1f} fps)")
+        return framesPerSecond
+
+    @staticmethod
+    def _setVolumeFromDataNode(volumeNode, dataNode):
+        """Make the volume node refer to the image data and geometry of a sequence data node (without copying voxels)."""
+        ijkToRAS = vtk.vtkMatrix4x4()
+        dataNode.GetIJKToRASMatrix(ijkToRAS)
+        wasModified = volumeNode.StartModify()
+        volumeNode.SetIJKToRASMatrix(ijkToRAS)
+        volumeNode.SetAndObserveImageData(dataNode.GetImageData())
+        volumeNode.EndModify(wasModified)
+
+    def _cropSequential(self, inputVolSeq, inputVolume, outputVolume, cropParameters):
+        """Crop each frame using the Crop Volume module logic.
+
+        :return: list of (image data, IJK to RAS matrix) for each frame.
+        """
+        cropParameters.SetInputVolumeNodeID(inputVolume.GetID())
+        cropParameters.SetOutputVolumeNodeID(outputVolume.GetID())
+        cropVolumeLogic = slicer.modules.cropvolume.logic()
+        outputImages = []
+        for seqItemNumber in range(inputVolSeq.GetNumberOfDataNodes()):
+            self._setVolumeFromDataNode(inputVolume, inputVolSeq.GetNthDataNode(seqItemNumber))
+            if cropVolumeLogic.Apply(cropParameters) != 0:
+                raise RuntimeError(_("Failed to crop item {itemNumber} of the volume sequence").format(itemNumber=seqItemNumber))
+            outputImage = vtk.vtkImageData()
+            outputImage.DeepCopy(outputVolume.GetImageData())
+            outputIJKToRAS = vtk.vtkMatrix4x4()
+            outputVolume.GetIJKToRASMatrix(outputIJKToRAS)
+            outputImages.append((outputImage, outputIJKToRAS))
+        return outputImages
+
+    def _cropVoxelBasedParallel(self, inputVolSeq, inputVolume, roiNode, fillValue, maximumNumberOfWorkers):
+        """Crop each frame without interpolation, copying voxels of multiple frames in parallel.
+
+        Output extent is computed the same way as in the Crop Volume module logic (not limited to the
+        input extent, voxels outside the input are set to ``fillValue``). Voxels are copied using numpy,
+        which does not hold the Python global interpreter lock while copying.
+
+        :return: list of (image data, IJK to RAS matrix) for each frame.
+        """
+        import concurrent.futures
+
+        import numpy as np
+        from vtk.util import numpy_support
+
+        def cropArray(inputArray, inputExtent, outputExtent):
+            outputShape = tuple(outputExtent[axis * 2 + 1] - outputExtent[axis * 2] + 1 for axis in (2, 1, 0))
+            outputArray = np.full(outputShape + inputArray.shape[3:], fillValue, dtype=inputArray.dtype)
+            inputSlices = []
+            outputSlices = []
+            for axis in (2, 1, 0):
+                first = max(inputExtent[axis * 2], outputExtent[axis * 2])
+                last = min(inputExtent[axis * 2 + 1], outputExtent[axis * 2 + 1])
+                if first > last:
+                    # No overlap between input and output, all voxels are filled
+                    return outputArray
+                inputSlices.append(slice(first - inputExtent[axis * 2], last - inputExtent[axis * 2] + 1))
+                outputSlices.append(slice(first - outputExtent[axis * 2], last - outputExtent[axis * 2] + 1))
+            outputArray[tuple(outputSlices)] = inputArray[tuple(inputSlices)]
+            return outputArray
+
+        cropVolumeLogic = slicer.modules.cropvolume.logic()
+        futures = []
+        geometries = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=maximumNumberOfWorkers) as executor:
+            for seqItemNumber in range(inputVolSeq.GetNumberOfDataNodes()):
+                # Output geometry depends on the ROI and input volume node transforms,
+                # therefore it is computed using the temporary input volume node in the main scene.
+                dataNode = inputVolSeq.GetNthDataNode(seqItemNumber)
+                self._setVolumeFromDataNode(inputVolume, dataNode)
+                outputExtent = [0, -1, 0, -1, 0, -1]
+                if not cropVolumeLogic.GetVoxelBasedCropOutputExtent(roiNode, inputVolume, outputExtent, False):
+                    raise RuntimeError(_("Failed to crop item {itemNumber} of the volume sequence").format(itemNumber=seqItemNumber))
+                imageData = dataNode.GetImageData()
+                inputScalars = imageData.GetPointData().GetScalars()
+                inputShape = tuple(reversed(imageData.GetDimensions())) + (inputScalars.GetNumberOfComponents(),)
+                inputArray = numpy_support.vtk_to_numpy(inputScalars).reshape(inputShape)
+                futures.append(executor.submit(cropArray, inputArray, imageData.GetExtent(), outputExtent))
+                geometries.append((outputExtent, inputScalars.GetDataType(), inputScalars.GetName()))
+
+            outputImages = []
+            ijkToRAS = vtk.vtkMatrix4x4()
+            for seqItemNumber, (future, (outputExtent, dataType, scalarsName)) in enumerate(zip(futures, geometries)):
+                outputArray = future.result()
+                outputScalars = numpy_support.numpy_to_vtk(
+                    outputArray.reshape(-1, outputArray.shape[-1]), deep=True, array_type=dataType)
+                outputScalars.SetName(scalarsName)
+                outputImage = vtk.vtkImageData()
+                outputImage.SetExtent(outputExtent)
+                outputImage.GetPointData().SetScalars(outputScalars)
+                # Same as vtkMRMLVolumeNode::ShiftImageDataExtentToZeroStart: move the origin to the first voxel
+                inputVolSeq.GetNthDataNode(seqItemNumber).GetIJKToRASMatrix(ijkToRAS)
+                outputIJKToRAS = vtk.vtkMatrix4x4()
+                outputIJKToRAS.DeepCopy(ijkToRAS)
+                for row in range(3):
+                    outputIJKToRAS.SetElement(row, 3, ijkToRAS.MultiplyPoint(
+                        [outputExtent[0], outputExtent[2], outputExtent[4], 1.0])[row])
+                outputImage.SetExtent(0, outputExtent[1] - outputExtent[0],
+                                      0, outputExtent[3] - outputExtent[2],
+                                      0, outputExtent[5] - outputExtent[4])
+                outputImages.append((outputImage, outputIJKToRAS))
+        return outputImages
+
+    def initializeOutputSequence(self, inputVolSeq, outputVolSeq):
+        """Remove all data nodes from the output sequence and set its indexing to match the input sequence."""
+        outputVolSeq.RemoveAllDataNodes()
+        outputVolSeq.SetIndexType(inputVolSeq.GetIndexType())
+        outputVolSeq.SetIndexName(inputVolSeq.GetIndexName())
+        outputVolSeq.SetIndexUnit(inputVolSeq.GetIndexUnit())
+
+    def suspendPlayback(self, outputVolSeq, excludedBrowserNode=None):
+        """Make sure data recorded into the output sequence is not overwritten by any browser nodes.
+
+        :return: list of browser nodes where playback of the output sequence has been disabled.
+        """
+        browserNodesForOutputSequence = vtk.vtkCollection()
+        playSuspendedForBrowserNodes = []
+        slicer.modules.sequences.logic().GetBrowserNodesForSequenceNode(outputVolSeq, browserNodesForOutputSequence)
+        for i in range(browserNodesForOutputSequence.GetNumberOfItems()):
+            browserNodeForOutputSequence = browserNodesForOutputSequence.GetItemAsObject(i)
+            if browserNodeForOutputSequence == excludedBrowserNode:
+                continue
+            if browserNodeForOutputSequence.GetPlayback(outputVolSeq):
+                browserNodeForOutputSequence.SetPlayback(outputVolSeq, False)
+                playSuspendedForBrowserNodes.append(browserNodeForOutputSequence)
+        return playSuspendedForBrowserNodes
+
+    def finalizeOutputSequence(self, inputVolSeq, outputVolSeq, outputVolTransformNodeID, playSuspendedForBrowserNodes):
+        """Show the output sequence in a sequence browser and restore playback states.
+
+        :param outputVolSeq: output sequence node. ``None`` if the input sequence was overwritten.
+        """
+        # Move output sequence node in the same browser node as the input volume sequence
+        # if not in a sequence browser node already.
+        if outputVolSeq:
+            if slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(outputVolSeq) is None:
+                # Add output sequence to a sequence browser
+                seqBrowser = slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(inputVolSeq)
+                if seqBrowser:
+                    seqBrowser.AddSynchronizedSequenceNode(outputVolSeq)
                 else:
-                    # Restore play enabled states
-                    for playSuspendedForBrowserNode in playSuspendedForBrowserNodes:
-                        playSuspendedForBrowserNode.SetPlayback(outputVolSeq, True)
+                    seqBrowser = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSequenceBrowserNode")
+                    seqBrowser.SetAndObserveMasterSequenceNodeID(outputVolSeq.GetID())
+                seqBrowser.SetOverwriteProxyName(outputVolSeq, True)
+
+                # Show output in slice views
+                slicer.modules.sequences.logic().UpdateAllProxyNodes()
+                slicer.app.processEvents()
+                outputVolume = seqBrowser.GetProxyNode(outputVolSeq)
+                outputVolume.SetAndObserveTransformNodeID(outputVolTransformNodeID)
+                slicer.util.setSliceViewerLayers(background=outputVolume)
 
             else:
-                # Refresh proxy node
-                seqBrowser = slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(inputVolSeq)
-                slicer.modules.sequences.logic().UpdateProxyNodesFromSequences(seqBrowser)
+                # Restore play enabled states
+                for playSuspendedForBrowserNode in playSuspendedForBrowserNodes:
+                    playSuspendedForBrowserNode.SetPlayback(outputVolSeq, True)
 
-        logging.info("Processing completed")
+        else:
+            # Refresh proxy node
+            seqBrowser = slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(inputVolSeq)
+            slicer.modules.sequences.logic().UpdateProxyNodesFromSequences(seqBrowser)
 
 
 class CropVolumeSequenceTest(ScriptedLoadableModuleTest):
@@ -302,6 +510,8 @@ class CropVolumeSequenceTest(ScriptedLoadableModuleTest):
         """Run as few or as many tests as needed here."""
         self.setUp()
         self.test_CropVolumeSequence1()
+        self.setUp()
+        self.test_CropVolumeSequenceBatch()
 
     def test_CropVolumeSequence1(self):
         self.delayDisplay("Starting the test")
@@ -342,3 +552,64 @@ class CropVolumeSequenceTest(ScriptedLoadableModuleTest):
         self.assertEqual(cropVolumeNode.GetImageData().GetExtent(), (0, 41, 0, 33, 0, 40))
 
         self.delayDisplay("Test passed!")
+
+    def test_CropVolumeSequenceBatch(self):
+        """Compare batch processing results to proxy node based processing and report processing speed."""
+        self.delayDisplay("Starting the test")
+
+        import time
+
+        import SampleData
+
+        sequenceNode = SampleData.downloadSample("CTCardioSeq")
+        sequenceBrowserNode = slicer.modules.sequences.logic().GetFirstBrowserNodeForSequenceNode(sequenceNode)
+        volumeNode = sequenceBrowserNode.GetProxyNode(sequenceNode)
+        numberOfDataNodes = sequenceNode.GetNumberOfDataNodes()
+
+        roiNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLMarkupsROINode")
+        cropVolumeNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLCropVolumeParametersNode")
+        cropVolumeNode.SetROINodeID(roiNode.GetID())
+        cropVolumeNode.SetInputVolumeNodeID(volumeNode.GetID())
+        slicer.modules.cropvolume.logic().FitROIToInputVolume(cropVolumeNode)
+        # Crop the central part of the volume
+        roiSize = roiNode.GetSize()
+        roiNode.SetSize(roiSize[0] * 0.5, roiSize[1] * 0.5, roiSize[2] * 0.7)
+
+        logic = CropVolumeSequenceLogic()
+
+        for voxelBased in [True, False]:
+            cropVolumeNode.SetVoxelBased(voxelBased)
+            cropVolumeNode.SetIsotropicResampling(True)
+            cropVolumeNode.SetSpacingScalingConst(2.0)
+
+            referenceSequenceNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSequenceNode")
+            startTime = time.time()
+            logic.run(sequenceNode, referenceSequenceNode, cropVolumeNode)
+            referenceFps = numberOfDataNodes / (time.time() - startTime)
+
+            maximumNumberOfWorkers = 4 if voxelBased else 1
+            batchSequenceNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSequenceNode")
+            batchFps = logic.runBatch(sequenceNode, batchSequenceNode, cropVolumeNode, maximumNumberOfWorkers=maximumNumberOfWorkers)
+
+            logging.info(f"Crop volume sequence (voxelBased={voxelBased}, {numberOfDataNodes} frames):"
+                         f" proxy node based: {referenceFps:.1f} fps, batch ({maximumNumberOfWorkers} workers): {batchFps:.1f} fps")
+
+            # Batch processing results must be the same as proxy node based processing results
+            self.assertEqual(batchSequenceNode.GetNumberOfDataNodes(), numberOfDataNodes)
+            for seqItemNumber in range(numberOfDataNodes):
+                self.assertEqual(batchSequenceNode.GetNthIndexValue(seqItemNumber), referenceSequenceNode.GetNthIndexValue(seqItemNumber))
+                referenceVolume = referenceSequenceNode.GetNthDataNode(seqItemNumber)
+                batchVolume = batchSequenceNode.GetNthDataNode(seqItemNumber)
+                self.assertEqual(batchVolume.GetImageData().GetExtent(), referenceVolume.GetImageData().GetExtent())
+                for point in [[0, 0, 0], [5, 5, 5]]:
+                    self.assertEqual(batchVolume.GetImageData().GetScalarComponentAsDouble(*point, 0),
+                                     referenceVolume.GetImageData().GetScalarComponentAsDouble(*point, 0))
+                referenceIJKToRAS = vtk.vtkMatrix4x4()
+                referenceVolume.GetIJKToRASMatrix(referenceIJKToRAS)
+                batchIJKToRAS = vtk.vtkMatrix4x4()
+                batchVolume.GetIJKToRASMatrix(batchIJKToRAS)
+                for row in range(3):
+                    for column in range(4):
+                        self.assertAlmostEqual(batchIJKToRAS.GetElement(row, column), referenceIJKToRAS.GetElement(row, column))
+
+        self.delayDisplay("Test passed!")
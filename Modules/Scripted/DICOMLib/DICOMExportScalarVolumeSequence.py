@@ -0,0 +1,206 @@
+import logging
+import os
+
+import slicer
+
+#########################################################
+#
+#
+comment = """
+
+DICOMExportScalarVolumeSequence provides the feature of exporting all
+frames of a slicer scalar volume sequence as a DICOM series into local folder.
+
+This code is slicer-specific and relies on the slicer python module
+for elements like slicer.dicomDatatabase and slicer.mrmlScene
+
+"""
+#
+#########################################################
+
+
+class DICOMExportScalarVolumeSequence:
+    """Code to export a scalar volume sequence as a DICOM series.
+
+    All frames are written by pydicom, in the application process, using a
+    single header template that contains the attributes that are the same in all
+    instances. Files are named and filled the same way as if each frame was
+    exported by :py:class:`DICOMExportScalarVolume` using the CreateDICOMSeries
+    CLI module (with default CLI options), but without starting a process and
+    writing a temporary volume file for each frame.
+    """
+
+    # SOP class UID and image type for each modality (same as in CreateDICOMSeries CLI module)
+    sopClassUIDAndImageTypeForModality = {
+        "MR": ("1.2.840.10008.5.1.4.1.1.4", "ORIGINAL\\PRIMARY\\MPR"),
+        "CR": ("1.2.840.10008.5.1.4.1.1.1", "ORIGINAL\\PRIMARY\\SINGLE PLANE"),
+        "NM": ("1.2.840.10008.5.1.4.1.1.20", "ORIGINAL\\PRIMARY\\STATIC"),
+        "US": ("1.2.840.10008.5.1.4.1.1.6.1", ""),
+        "SC": ("1.2.840.10008.5.1.4.1.1.7", "ORIGINAL\\PRIMARY\\"),
+        "CT": ("1.2.840.10008.5.1.4.1.1.2", "ORIGINAL\\PRIMARY\\AXIAL"),
+    }
+
+    def __init__(self, volumeNodes, tags, directory, frameTags=None, displayNode=None):
+        """
+        :param volumeNodes: list of scalar volume nodes, one for each frame (typically data nodes of a sequence node).
+        :param tags: dictionary of tags that are the same for all frames (same keys as in :py:class:`DICOMExportScalarVolume`).
+        :param directory: output directory. Files are named ``IMG_<frame>_<slice>.dcm``.
+        :param frameTags: optional list of dictionaries, one for each frame, containing tags that
+          are different in each frame (``Content Date`` and ``Content Time``).
+        :param displayNode: optional volume display node, its window/level is written to all instances.
+          If not specified then window is set to the voxel value range of each slice.
+        """
+        self.volumeNodes = volumeNodes
+        self.tags = tags
+        self.directory = directory
+        self.frameTags = frameTags
+        self.displayNode = displayNode
+
+    def progress(self, string):
+        logging.debug(string)
+
+    @staticmethod
+    def _decimalString(value):
+        """Format a number so that it fits in a DICOM decimal string (maximum 16 characters)."""
+        return f"{value:.10g}"
+
+    def createHeaderTemplate(self):
+        """Return a dataset that contains all the attributes that are the same for all instances."""
+        import pydicom
+
+        tags = self.tags
+        modality = tags["Modality"]
+        if modality not in self.sopClassUIDAndImageTypeForModality:
+            logging.warning(f"Unknown modality: {modality}. Using CT Image Storage SOP class UID.")
+        sopClassUID, imageType = self.sopClassUIDAndImageTypeForModality.get(modality, self.sopClassUIDAndImageTypeForModality["CT"])
+
+        ds = pydicom.dataset.Dataset()
+        # All strings are UTF8-encoded, set the SpecificCharacterSet accordingly.
+        ds.SpecificCharacterSet = "ISO_IR 192"
+        ds.SOPClassUID = sopClassUID
+        ds.ImageType = imageType
+        # Patient
+        ds.PatientName = tags["Patient Name"]
+        ds.PatientID = tags["Patient ID"]
+        ds.PatientBirthDate = tags["Patient Birth Date"]
+        # Patient's sex is required, empty if unknown
+        ds.PatientSex = tags["Patient Sex"] if tags["Patient Sex"] in ["M", "F", "O"] else ""
+        if tags["Patient Comments"]:
+            ds.PatientComments = tags["Patient Comments"]
+        # Study
+        ds.StudyInstanceUID = tags["Study Instance UID"]
+        ds.StudyID = tags["Study ID"]
+        ds.StudyDate = tags["Study Date"]
+        ds.StudyTime = tags["Study Time"]
+        if tags["Study Description"]:
+            ds.StudyDescription = tags["Study Description"]
+        ds.AccessionNumber = ""
+        ds.ReferringPhysicianName = ""
+        # Equipment
+        if tags["Manufacturer"]:
+            ds.Manufacturer = tags["Manufacturer"]
+        if tags["Model"]:
+            ds.ManufacturerModelName = tags["Model"]
+        # Series
+        ds.SeriesInstanceUID = tags["Series Instance UID"]
+        ds.Modality = modality
+        ds.SeriesNumber = tags["Series Number"]
+        if tags["Series Description"]:
+            ds.SeriesDescription = tags["Series Description"]
+        if tags["Series Date"]:
+            ds.SeriesDate = tags["Series Date"]
+        if tags["Series Time"]:
+            ds.SeriesTime = tags["Series Time"]
+        ds.PatientPosition = "HFS"
+        # Frame of reference
+        ds.FrameOfReferenceUID = tags["Frame of Reference UID"]
+        ds.PositionReferenceIndicator = ""
+        # Image pixel
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.BitsAllocated = 16
+        ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.PixelRepresentation = 1
+        if sopClassUID == self.sopClassUIDAndImageTypeForModality["CT"][0]:
+            ds.RescaleIntercept = "0"
+            ds.RescaleSlope = "1"
+            ds.RescaleType = "HU"
+        if self.displayNode:
+            if self.displayNode.IsA("vtkMRMLScalarVolumeDisplayNode"):
+                ds.WindowCenter = self._decimalString(self.displayNode.GetLevel())
+                ds.WindowWidth = self._decimalString(self.displayNode.GetWindow())
+            else:
+                # labelmap volume
+                scalarRange = self.displayNode.GetScalarRange()
+                ds.WindowCenter = self._decimalString((scalarRange[0] + scalarRange[1]) / 2.0)
+                ds.WindowWidth = self._decimalString(scalarRange[1] - scalarRange[0])
+        return ds
+
+    def export(self):
+        """Export all frames of the volume sequence.
+
+        :return: True on success.
+        """
+        import numpy as np
+        import pydicom
+        import vtk
+
+        numberOfFrames = len(self.volumeNodes)
+        template = self.createHeaderTemplate()
+        pixelValueRange = np.iinfo(np.int16)
+
+        for frameIndex, volumeNode in enumerate(self.volumeNodes):
+            if not volumeNode or not volumeNode.IsA("vtkMRMLScalarVolumeNode") or not volumeNode.GetImageData():
+                logging.error(f"Failed to export item {frameIndex} of volume sequence: not a scalar volume")
+                return False
+            self.progress(f"Exporting frame {frameIndex + 1} of {numberOfFrames}")
+            frameTags = self.frameTags[frameIndex] if self.frameTags else {}
+
+            # Voxels are stored as signed short, same as the default output type of CreateDICOMSeries CLI module
+            voxels = slicer.util.arrayFromVolume(volumeNode)
+            if voxels.dtype != np.int16:
+                voxels = np.clip(voxels, pixelValueRange.min, pixelValueRange.max).astype(np.int16)
+
+            # Geometry in LPS coordinate system
+            ijkToRAS = vtk.vtkMatrix4x4()
+            volumeNode.GetIJKToRASMatrix(ijkToRAS)
+            ijkToLPS = np.array([[ijkToRAS.GetElement(row, column) for column in range(4)] for row in range(4)])
+            ijkToLPS[0:2, :] *= -1
+            spacing = np.linalg.norm(ijkToLPS[0:3, 0:3], axis=0)
+            directions = ijkToLPS[0:3, 0:3] / spacing
+            imageOrientation = [self._decimalString(value) for value in list(directions[:, 0]) + list(directions[:, 1])]
+
+            for sliceIndex in range(voxels.shape[0]):
+                sliceVoxels = voxels[sliceIndex]
+                ds = pydicom.dataset.Dataset()
+                ds.update(template)
+                ds.SOPInstanceUID = pydicom.uid.generate_uid()
+                ds.InstanceNumber = str(sliceIndex + 1)
+                if "Content Date" in frameTags:
+                    ds.ContentDate = frameTags["Content Date"]
+                    ds.ContentTime = frameTags["Content Time"]
+                ds.ImagePositionPatient = [self._decimalString(value) for value in ijkToLPS[0:3, :].dot([0, 0, sliceIndex, 1])]
+                ds.ImageOrientationPatient = imageOrientation
+                ds.SliceThickness = self._decimalString(spacing[2])
+                ds.PixelSpacing = [self._decimalString(spacing[1]), self._decimalString(spacing[0])]
+                ds.Rows, ds.Columns = sliceVoxels.shape
+                if not self.displayNode:
+                    minValue = float(sliceVoxels.min())
+                    maxValue = float(sliceVoxels.max())
+                    ds.WindowCenter = self._decimalString((minValue + maxValue) / 2.0)
+                    ds.WindowWidth = self._decimalString(maxValue - minValue)
+                ds.PixelData = np.ascontiguousarray(sliceVoxels).tobytes()
+
+                ds.file_meta = pydicom.dataset.FileMetaDataset()
+                ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+                ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+                ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+                ds.file_meta.ImplementationClassUID = pydicom.uid.PYDICOM_IMPLEMENTATION_UID
+                ds.is_little_endian = True
+                ds.is_implicit_VR = False
+
+                filePath = os.path.join(self.directory, f"IMG_{frameIndex:04d}_{sliceIndex + 1:04d}.dcm")
+                pydicom.dcmwrite(filePath, ds, write_like_original=False)
+
+        return True
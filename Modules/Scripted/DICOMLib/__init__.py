@@ -1,5 +1,6 @@
 from .DICOMProcesses import *
 from .DICOMExportScalarVolume import *
+from .DICOMExportScalarVolumeSequence import *
 from .DICOMExportScene import *
 from .DICOMBrowser import *
 from .DICOMPlugin import *
@@ -328,27 +328,33 @@ class DICOMImageSequencePluginClass(DICOMPlugin):
             outputSequenceNode.SetIndexUnit("s")
             playbackRateFps = 1.0 / frameTime
 
-        # Add frames to the sequence
-        numberOfFrames = imageData.GetDimensions()[2]
+        # Add frames to the sequence.
+        # Image data of each frame refers to a section of the multi-frame voxel array, so that
+        # frames of long cine loops are not copied (the array is kept in memory by the frames).
+        from vtk.util import numpy_support
+
         extent = imageData.GetExtent()
         numberOfFrames = extent[5] - extent[4] + 1
+        multiFrameScalars = imageData.GetPointData().GetScalars()
+        multiFrameArray = numpy_support.vtk_to_numpy(multiFrameScalars).reshape(
+            numberOfFrames, -1, multiFrameScalars.GetNumberOfComponents())
+        # Only node properties are copied into the sequence, frame image data is set afterward
+        tempFrameVolume.SetAndObserveImageData(None)
         for frame in range(numberOfFrames):
             # get current frame from multiframe
-            crop = vtk.vtkImageClip()
-            crop.SetInputData(imageData)
-            crop.SetOutputWholeExtent(extent[0], extent[1], extent[2], extent[3], extent[4] + frame, extent[4] + frame)
-            crop.ClipDataOn()
-            crop.Update()
-            croppedOutput = crop.GetOutput()
-            croppedOutput.SetExtent(extent[0], extent[1], extent[2], extent[3], 0, 0)
-            croppedOutput.SetOrigin(0.0, 0.0, 0.0)
-            tempFrameVolume.SetAndObserveImageData(croppedOutput)
+            frameScalars = numpy_support.numpy_to_vtk(
+                multiFrameArray[frame], deep=False, array_type=multiFrameScalars.GetDataType())
+            frameScalars.SetName(multiFrameScalars.GetName())
+            frameImageData = vtk.vtkImageData()
+            frameImageData.SetExtent(extent[0], extent[1], extent[2], extent[3], 0, 0)
+            frameImageData.GetPointData().SetScalars(frameScalars)
             # get timestamp
             if type(frameTime) == int:
                 timeStampSec = str(frame * frameTime)
             else:
                 timeStampSec = f"{frame * frameTime:.3f}"
-            outputSequenceNode.SetDataNodeAtValue(tempFrameVolume, timeStampSec)
+            frameVolume = outputSequenceNode.SetDataNodeAtValue(tempFrameVolume, timeStampSec)
+            frameVolume.SetAndObserveImageData(frameImageData)
 
         # Create storage node that allows saving node as nrrd
         outputSequenceStorageNode = slicer.vtkMRMLVolumeSequenceStorageNode()
@@ -7,7 +7,7 @@ import slicer
 from slicer.i18n import tr as _
 
 from DICOMLib import DICOMPlugin
-from DICOMLib import DICOMExportScalarVolume
+from DICOMLib import DICOMExportScalarVolumeSequence
 
 
 #
@@ -217,9 +217,7 @@ class DICOMVolumeSequencePluginClass(DICOMPlugin):
                 return error
             # TODO: more tag checks
 
-            sequenceItemCount = sequenceBrowserNode.GetMasterSequenceNode().GetNumberOfDataNodes()
-            originalSelectedSequenceItemNumber = sequenceBrowserNode.GetSelectedItemNumber()
-            masterVolumeNode = sequenceBrowserNode.GetMasterSequenceNode()
+            sequenceItemCount = volumeSequenceNode.GetNumberOfDataNodes()
 
             # initialize content datetime from series datetime
             contentStartDate = exportable.tag("SeriesDate")
@@ -244,20 +242,28 @@ class DICOMVolumeSequencePluginClass(DICOMPlugin):
             directory = directoryDir.absolutePath()
             logging.info("Export scalar volume '" + volumeNode.GetName() + "' to directory " + directory)
 
+            # Frames are read directly from the volume sequence (without selecting them in the browser node).
+            # The volume sequence is not necessarily the master sequence of the browser, therefore its own
+            # items and index values are used.
+            frameVolumeNodes = []
+            frameTags = []
             for sequenceItemIndex in range(sequenceItemCount):
-                # Switch to next item in the series
-                sequenceBrowserNode.SetSelectedItemNumber(sequenceItemIndex)
-                slicer.app.processEvents()
+                frameVolumeNodes.append(volumeSequenceNode.GetNthDataNode(sequenceItemIndex))
                 # Compute content date&time
                 # TODO: verify that unit in sequence node is "second" (and convert to seconds if not)
-                timeOffsetSec = float(masterVolumeNode.GetNthIndexValue(sequenceItemIndex)) - float(masterVolumeNode.GetNthIndexValue(0))
+                timeOffsetSec = float(volumeSequenceNode.GetNthIndexValue(sequenceItemIndex)) - float(volumeSequenceNode.GetNthIndexValue(0))
                 contentDatetime = contentStartDatetime + datetime.timedelta(seconds=timeOffsetSec)
-                tags["Content Date"] = contentDatetime.strftime("%Y%m%d")
-                tags["Content Time"] = contentDatetime.strftime("%H%M%S.%f")
-                # Perform export
-                filenamePrefix = f"IMG_{sequenceItemIndex:04d}_"
-                exporter = DICOMExportScalarVolume(tags["Study ID"], volumeNode, tags, directory, filenamePrefix)
-                exporter.export()
+                frameTags.append({
+                    "Content Date": contentDatetime.strftime("%Y%m%d"),
+                    "Content Time": contentDatetime.strftime("%H%M%S.%f"),
+                })
+
+            # Perform export of all frames at once
+            exporter = DICOMExportScalarVolumeSequence(frameVolumeNodes, tags, directory, frameTags, volumeNode.GetDisplayNode())
+            if not exporter.export():
+                error = _("Failed to export volume sequence '{volumeName}'").format(volumeName=volumeNode.GetName())
+                logging.error(error)
+                return error
 
         # Success
         return ""
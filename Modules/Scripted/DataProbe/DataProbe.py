@@ -95,8 +95,22 @@ class DataProbeInfoWidget:
         self.painter = qt.QPainter()
         self.pen = qt.QPen()
 
+        # Key of the last magnified image, used for skipping recomputation if nothing has changed
+        self.magnifiedPixmapKey = None
+
+        # Key of the last displayed information for each layer, used for skipping update of
+        # the layer readouts if the probed voxel and volume have not changed
+        self.layerInfoKeys = {}
+
         self._createSmall()
 
+        # Cursor position modified events are compressed: the readouts are updated once,
+        # when the application gets back to the event loop, no matter how many events were received.
+        self.updateTimer = qt.QTimer()
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(0)
+        self.updateTimer.connect("timeout()", self.updateInfo)
+
         # Helper class to calculate and display tensor scalars
         self.calculateTensorScalars = CalculateTensorScalars()
 
@@ -122,6 +136,7 @@ class DataProbeInfoWidget:
         if self.CrosshairNode and self.CrosshairNodeObserverTag:
             self.CrosshairNode.RemoveObserver(self.CrosshairNodeObserverTag)
         self.CrosshairNodeObserverTag = None
+        self.updateTimer.stop()
 
     def getPixelString(self, volumeNode, ijk):
         """Given a volume node, create a human readable
@@ -192,7 +207,18 @@ class DataProbeInfoWidget:
         return pixel[:-2]
 
     def processEvent(self, observee, event):
-        # TODO: use a timer to delay calculation and compress events
+        """Schedule update of the readouts.
+
+        Mouse move events may arrive at a much higher rate than the displayed information
+        can be refreshed, therefore the update is deferred until the application gets back to
+        the event loop. Further events received until then are merged into that single update.
+        """
+        if not self.updateTimer.isActive():
+            self.updateTimer.start()
+
+    def updateInfo(self):
+        """Update the readouts based on the current cursor position."""
+        self.updateTimer.stop()
         insideView = False
         ras = [0.0, 0.0, 0.0]
         xyz = [0.0, 0.0, 0.0]
@@ -216,6 +242,8 @@ class DataProbeInfoWidget:
                 self.layerNames[layer].setText("")
                 self.layerIJKs[layer].setText("")
                 self.layerValues[layer].setText("")
+            self.layerInfoKeys = {}
+            self.magnifiedPixmapKey = None
             self.imageLabel.hide()
             self.viewerColor.hide()
             self.viewInfo.hide()
@@ -251,11 +279,21 @@ class DataProbeInfoWidget:
             layerLogic = logicCall()
             volumeNode = layerLogic.GetVolumeNode()
             ijk = [0, 0, 0]
+            layerInfoKey = None
             if volumeNode:
                 hasVolume = True
                 xyToIJK = layerLogic.GetXYToIJKTransform()
                 ijkFloat = xyToIJK.TransformDoublePoint(xyz)
                 ijk = [_roundInt(value) for value in ijkFloat]
+                imageData = volumeNode.GetImageData()
+                displayNode = volumeNode.GetDisplayNode()
+                layerInfoKey = (volumeNode.GetID(), tuple(ijk), volumeNode.GetMTime(),
+                                imageData.GetMTime() if imageData else 0,
+                                displayNode.GetMTime() if displayNode else 0)
+            if layerInfoKey is not None and self.layerInfoKeys.get(layer) == layerInfoKey:
+                # Same voxel of the same (unmodified) volume, the displayed information is still valid
+                continue
+            self.layerInfoKeys[layer] = layerInfoKey
             self.layerNames[layer].setText(self.generateLayerName(layerLogic))
             self.layerIJKs[layer].setText(self.generateIJKPixelDescription(ijk, layerLogic))
             self.layerValues[layer].setText(self.generateIJKPixelValueDescription(ijk, layerLogic))
@@ -281,12 +319,21 @@ class DataProbeInfoWidget:
             self.displayableManagerInfo.hide()
 
         # set image
-        if (not slicer.mrmlScene.IsBatchProcessing()) and sliceLogic and hasVolume and self.showImage:
-            pixmap = self._createMagnifiedPixmap(
-                xyz, sliceLogic.GetBlend().GetOutputPort(), self.imageLabel.size, color)
-            if pixmap:
-                self.imageLabel.setPixmap(pixmap)
-                self.onShowImage(self.showImage)
+        # The magnified image is only computed if it is requested and the data probe is visible
+        # (not in a collapsed panel) and only if the displayed pixel or the slice image has changed.
+        if (not slicer.mrmlScene.IsBatchProcessing()) and sliceLogic and hasVolume and self.showImage and self.frame.isVisible():
+            blendOutputPort = sliceLogic.GetBlend().GetOutputPort()
+            blendOutput = blendOutputPort.GetProducer().GetOutputDataObject(0)
+            imageSize = self.imageLabel.size
+            magnifiedPixmapKey = (sliceNode.GetID(), tuple(_roundInt(value) for value in xyz),
+                                  blendOutput.GetMTime() if blendOutput else 0,
+                                  imageSize.width(), imageSize.height(), tuple(rgbColor))
+            if magnifiedPixmapKey != self.magnifiedPixmapKey:
+                pixmap = self._createMagnifiedPixmap(xyz, blendOutputPort, imageSize, color)
+                if pixmap:
+                    self.imageLabel.setPixmap(pixmap)
+                    self.magnifiedPixmapKey = magnifiedPixmapKey
+            self.onShowImage(self.showImage)
 
         if hasattr(self.frame.parent(), "text"):
             sceneName = slicer.mrmlScene.GetURL()
@@ -515,6 +562,7 @@ class DataProbeInfoWidget:
             self.imageLabel.hide()
             pixmap = qt.QPixmap()
             self.imageLabel.setPixmap(pixmap)
+            self.magnifiedPixmapKey = None
 
 
 #
@@ -630,4 +678,13 @@ class DataProbeTest(ScriptedLoadableModuleTest):
         self.widget = DataProbeInfoWidget()
         self.widget.frame.show()
 
+        # Multiple cursor position changes result in a single deferred update
+        for i in range(10):
+            self.widget.processEvent(None, None)
+        self.assertTrue(self.widget.updateTimer.isActive())
+        slicer.app.processEvents()
+        self.assertFalse(self.widget.updateTimer.isActive())
+
+        self.widget.removeObservers()
+
         self.delayDisplay("Test passed!")
@@ -526,8 +526,9 @@ class EndoscopyLogic:
 
     At any point along the resampled curve, the orientation is pre-computed in
     :func:`interpolateOrientationsForControlPoints` by interpolating all relative orientations. The result is
-    converted to a world orientation using :func:`relativeOrientationToWorld`, computed based on a plane normal
-    derived from the set of input control points using :func:`planeFit`.
+    converted to a world orientation (same as :func:`relativeOrientationToWorld`, but for all control points at
+    once), computed based on a plane normal derived from the set of input control points using :func:`planeFit`.
+    World orientations are stored as orientation matrices of the resampled curve control points.
 
     Convention:
 
@@ -536,7 +537,7 @@ class EndoscopyLogic:
 
     * Internally, scalar-first quaternions `(wxyz)` are used for interpolation. These are defined as
       `(cos(angle/2), *axis * sin(angle/2))` and applied in :func:`interpolateOrientationsForControlPoints` using
-      `vtk.vtkQuaternionInterpolator`.
+      spherical linear interpolation (:func:`slerpQuaternions`).
 
     * Conversion functions (:func:`orientationToQuaternion` and :func:`quaternionToOrientation`) convert
       between camera orientations and quaternions.
@@ -599,6 +600,11 @@ class EndoscopyLogic:
         self.resampledCurve = slicer.vtkMRMLMarkupsCurveNode()
         self.cameraOrientationResampledCurveIndices = []
 
+        # Inputs and results of the last update, used for skipping update of unchanged points
+        self.resampledCurveInputState = None
+        self.resampledCurvePoints = None
+        self.resampledCurveOrientationMatrices = None
+
         self.updatingControlPoints = False
 
     def getNumberOfControlPoints(self):
@@ -636,8 +642,51 @@ class EndoscopyLogic:
             )
 
         self.updatingControlPoints = True
-        self.inputCurve = inputCurve
-
+        try:
+            self.inputCurve = inputCurve
+            resampledPoints = self.resampleInputCurve()
+            points = vtk.util.numpy_support.vtk_to_numpy(resampledPoints.GetData()).reshape(-1, 3)
+
+            # Control point modified events are also invoked when the curve shape does not change
+            # (e.g., when a control point is selected or locked), skip the update in this case.
+            inputState = (
+                inputCurve,
+                inputCurve.GetName(),
+                inputCurve.GetCurveType(),
+                inputCurve.GetCurveClosed(),
+                inputCurve.GetAttribute(EndoscopyLogic.NODE_PATH_CAMERA_ORIENTATIONS_ATTRIBUTE_NAME),
+            )
+            if (
+                inputState == self.resampledCurveInputState
+                and self.resampledCurvePoints is not None
+                and np.array_equal(points, self.resampledCurvePoints)
+            ):
+                return
+            self.resampledCurveInputState = inputState
+            self.resampledCurvePoints = np.array(points, dtype=float)
+
+            # Make a curve from these resampledPoints. We want all associated information from inputCurve, except its name
+            # and control points.
+            with slicer.util.NodeModify(self.resampledCurve):
+                self.resampledCurve.Copy(self.inputCurve)
+                self.resampledCurve.SetName(f"Resampled-{inputCurve.GetName()}")
+                self.resampledCurve.SetControlPointPositionsWorld(resampledPoints)
+            # Orientations of all control points have been reset
+            self.resampledCurveOrientationMatrices = None
+
+            # Find a plane that approximately includes the points of the resampled curve,
+            # so that we can use its normal to define the "up" direction. This is somewhat
+            # nonsensical if self.resampledCurve.GetNumberOfControlPoints() < 3, but proceed anyway.
+            _, self.planeNormal = EndoscopyLogic.planeFit(self.resampledCurvePoints.T)
+
+            cameraOrientations = EndoscopyLogic.getCameraOrientationsFromInputCurve(inputCurve)
+
+            self.interpolateOrientationsForControlPoints(cameraOrientations)
+        finally:
+            self.updatingControlPoints = False
+
+    def resampleInputCurve(self):
+        """Return equidistant points along the input curve (with self.dl spacing)."""
         resampledPoints = vtk.vtkPoints()
 
         if self.inputCurve.GetNumberOfControlPoints() > 1:
@@ -660,91 +709,90 @@ class EndoscopyLogic:
                 self.inputCurve.GetCurvePointsWorld(),
                 resampledPoints,
                 self.dl,
-                inputCurve.GetCurveClosed(),
+                self.inputCurve.GetCurveClosed(),
             )
 
             # Restore original number of pointsPerSegment
             if originalPointsPerSegment < pointsPerSegment:
                 self.inputCurve.SetNumberOfPointsPerInterpolatingSegment(originalPointsPerSegment)
 
-        # Make a curve from these resampledPoints. We want all associated information from inputCurve, except its name
-        # and control points.
-
-        with slicer.util.NodeModify(self.resampledCurve):
-            self.resampledCurve.Copy(self.inputCurve)
-            self.resampledCurve.SetName(f"Resampled-{inputCurve.GetName()}")
-
-            self.resampledCurve.RemoveAllControlPoints()
-            points = np.zeros((resampledPoints.GetNumberOfPoints(), 3))
-
-            for resampledCurvePointIndex in range(resampledPoints.GetNumberOfPoints()):
-                resampledPoints.GetPoint(resampledCurvePointIndex, points[resampledCurvePointIndex])
-                self.resampledCurve.AddControlPointWorld(*points[resampledCurvePointIndex])
-
-        # Find a plane that approximately includes the points of the resampled curve,
-        # so that we can use its normal to define the "up" direction. This is somewhat
-        # nonsensical if self.resampledCurve.GetNumberOfControlPoints() < 3, but proceed anyway.
-        _, self.planeNormal = EndoscopyLogic.planeFit(points.T)
-
-        cameraOrientations = EndoscopyLogic.getCameraOrientationsFromInputCurve(inputCurve)
-
-        self.interpolateOrientationsForControlPoints(cameraOrientations)
-
-        self.updatingControlPoints = False
+        return resampledPoints
 
     def interpolateOrientationsForControlPoints(self, cameraOrientations):
         """Interpolate the user-supplied orientations to compute (and assign) an orientation to every control point of
         the resampledCurve.
-        """
-
-        # Configure a vtkQuaternionInterpolator using the user's supplied orientations.
-        # Note that all distances are as measured along resampledCurve rather than along inputCurve.
 
-        quaternionInterpolator = vtk.vtkQuaternionInterpolator()
-        quaternionInterpolator.SetSearchMethod(0)  # binary search
+        Orientations of all the control points are computed at once, using numpy array operations.
+        Only orientations that are different from the previously computed ones are set in the resampledCurve.
+        """
+        numberOfControlPoints = self.resampledCurve.GetNumberOfControlPoints()
+        self.cameraOrientationResampledCurveIndices = []
+        if numberOfControlPoints < 2:
+            # Default orientation cannot be computed
+            return
 
-        # Use the "linear spherical interpolation" rather than the "cubic spline interpolation" (using a modified
-        # Kochanek basis) because the latter seems to use the supplied quaternions as guide points, but doesn't
-        # necessarily take a path through them.
-        quaternionInterpolator.SetInterpolationTypeToLinear()
+        controlPoints = slicer.util.arrayFromMarkupsControlPoints(self.resampledCurve, world=True)
+        defaultMatrices = EndoscopyLogic.defaultOrientationMatrices3x3(
+            controlPoints, self.resampledCurve.GetCurveClosed(), self.planeNormal,
+        )
 
+        # Relative orientation of the user's supplied orientations (keyframes).
+        # Note that all distances are as measured along resampledCurve rather than along inputCurve.
         resampledCurveLength = self.resampledCurve.GetCurveLengthWorld()
-        distances = sorted({0.0} | set(cameraOrientations.keys()) | {resampledCurveLength})
-
-        self.cameraOrientationResampledCurveIndices = []
-        for distanceAlongResampledCurve in distances:
+        keyframeDistances = sorted({0.0} | set(cameraOrientations.keys()) | {resampledCurveLength})
+        keyframeQuaternions = np.zeros((len(keyframeDistances), 4))
+        for keyframeIndex, distanceAlongResampledCurve in enumerate(keyframeDistances):
             if distanceAlongResampledCurve in cameraOrientations.keys():
                 resampledCurvePointIndex = EndoscopyLogic.indexOfControlPointForDistanceAlongCurve(
                     self.resampledCurve, distanceAlongResampledCurve,
                 )
                 self.cameraOrientationResampledCurveIndices.append(resampledCurvePointIndex)
-                worldOrientation = cameraOrientations[distanceAlongResampledCurve]
-                relativeOrientation = EndoscopyLogic.worldOrientationToRelative(
-                    self.resampledCurve, resampledCurvePointIndex, worldOrientation, self.planeNormal,
+                worldMatrix3x3 = EndoscopyLogic.orientationToMatrix3x3(cameraOrientations[distanceAlongResampledCurve])
+                # Relative orientation is the world orientation multiplied by the inverse of the default orientation
+                relativeMatrix3x3 = np.matmul(worldMatrix3x3, defaultMatrices[resampledCurvePointIndex].T)
+                keyframeQuaternions[keyframeIndex] = EndoscopyLogic.orientationToQuaternion(
+                    EndoscopyLogic.matrix3x3ToOrientation(relativeMatrix3x3),
                 )
-                quaternion = EndoscopyLogic.orientationToQuaternion(relativeOrientation)
             else:
                 # If not overridden by the user, the default relativeOrientation at the first and last is the identity.
-                quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+                keyframeQuaternions[keyframeIndex] = [1.0, 0.0, 0.0, 0.0]
+
+        # Linear spherical interpolation between keyframes, based on the distance of each control point along the curve.
+        # (The "cubic spline interpolation" is not used because it uses the supplied quaternions as guide points,
+        # but doesn't necessarily take a path through them.)
+        distances = EndoscopyLogic.distancesAlongCurveOfControlPoints(self.resampledCurve)
+        keyframeDistances = np.array(keyframeDistances)
+        if len(keyframeDistances) > 1:
+            intervalIndices = np.clip(
+                np.searchsorted(keyframeDistances, distances, side="right") - 1, 0, len(keyframeDistances) - 2,
+            )
+            intervalStartDistances = keyframeDistances[intervalIndices]
+            intervalLengths = keyframeDistances[intervalIndices + 1] - intervalStartDistances
+            weights = np.clip(
+                (distances - intervalStartDistances) / np.where(intervalLengths > 0.0, intervalLengths, 1.0), 0.0, 1.0,
+            )
+            relativeQuaternions = EndoscopyLogic.slerpQuaternions(
+                keyframeQuaternions[intervalIndices], keyframeQuaternions[intervalIndices + 1], weights,
+            )
+        else:
+            relativeQuaternions = np.tile(keyframeQuaternions[0], (numberOfControlPoints, 1))
 
-            quaternionInterpolator.AddQuaternion(distanceAlongResampledCurve, quaternion)
+        worldMatrices = np.matmul(EndoscopyLogic.quaternionsToMatrices3x3(relativeQuaternions), defaultMatrices)
 
-        # Use the configured vtkQuaternionInterpolator to pre-compute orientations for the resampledCurve.
+        # Only update orientations that have changed
+        if self.resampledCurveOrientationMatrices is None or self.resampledCurveOrientationMatrices.shape != worldMatrices.shape:
+            modifiedControlPointIndices = range(numberOfControlPoints)
+        else:
+            modifiedControlPointIndices = np.flatnonzero(
+                np.any(worldMatrices != self.resampledCurveOrientationMatrices, axis=(1, 2)),
+            )
         with slicer.util.NodeModify(self.resampledCurve):
-            for resampledCurvePointIndex in range(self.resampledCurve.GetNumberOfControlPoints()):
-                distanceAlongResampledCurve = EndoscopyLogic.distanceAlongCurveOfNthControlPoint(
-                    self.resampledCurve, resampledCurvePointIndex,
-                )
-                quaternion = np.zeros((4,))
-                quaternionInterpolator.InterpolateQuaternion(distanceAlongResampledCurve, quaternion)
-
-                relativeOrientation = EndoscopyLogic.quaternionToOrientation(quaternion)
-
-                worldOrientation = EndoscopyLogic.relativeOrientationToWorld(
-                    self.resampledCurve, resampledCurvePointIndex, relativeOrientation, self.planeNormal,
+            for resampledCurvePointIndex in modifiedControlPointIndices:
+                # Orientation matrix is stored in row-major order, columns are the axes
+                self.resampledCurve.SetNthControlPointOrientationMatrix(
+                    int(resampledCurvePointIndex), worldMatrices[resampledCurvePointIndex].flatten(),
                 )
-
-                self.resampledCurve.SetNthControlPointOrientation(resampledCurvePointIndex, worldOrientation)
+        self.resampledCurveOrientationMatrices = worldMatrices
 
     def saveOrientationAtIndex(self, resampledCurvePointIndex):
         inputCurve = self.inputCurve
@@ -816,10 +864,7 @@ class EndoscopyLogic:
         focalPoint = np.zeros((3,))
         resampledCurve.GetNthControlPointPositionWorld(resampledCurvePointIndex + 1, focalPoint)
 
-        worldOrientation = np.zeros((4,))
-        resampledCurve.GetNthControlPointOrientation(resampledCurvePointIndex, worldOrientation)
-
-        worldMatrix3x3 = EndoscopyLogic.orientationToMatrix3x3(worldOrientation)
+        worldMatrix3x3 = np.array(resampledCurve.GetNthControlPointOrientationMatrix(resampledCurvePointIndex)).reshape(3, 3)
         worldMatrix4x4 = EndoscopyLogic.buildCameraMatrix4x4(cameraPosition, worldMatrix3x3)
 
         adjustedFocalPoint = cameraPosition + worldMatrix3x3[:, 2] * (
@@ -984,6 +1029,86 @@ class EndoscopyLogic:
         )
         return indexOfControlPoint
 
+    @staticmethod
+    def distancesAlongCurveOfControlPoints(curve):
+        """Return the distance along the curve of each control point (see :func:`distanceAlongCurveOfNthControlPoint`)."""
+        numberOfControlPoints = curve.GetNumberOfControlPoints()
+        curvePoints = slicer.util.arrayFromMarkupsCurvePoints(curve, world=True)
+        # Interpolating curves go through the control points, with a fixed number of curve points in each segment
+        curvePointIndices = np.arange(numberOfControlPoints) * curve.GetNumberOfPointsPerInterpolatingSegment()
+        if (
+            numberOfControlPoints > 0
+            and curvePointIndices[-1] < len(curvePoints)
+            and np.allclose(curvePoints[curvePointIndices], slicer.util.arrayFromMarkupsControlPoints(curve, world=True))
+        ):
+            segmentLengths = np.linalg.norm(np.diff(curvePoints, axis=0), axis=1)
+            distancesAlongCurve = np.concatenate(([0.0], np.cumsum(segmentLengths)))
+            return distancesAlongCurve[curvePointIndices]
+        # Control points are not at the expected curve points, search the closest curve point for each
+        return np.array([
+            EndoscopyLogic.distanceAlongCurveOfNthControlPoint(curve, controlPointIndex)
+            for controlPointIndex in range(numberOfControlPoints)
+        ])
+
+    @staticmethod
+    def defaultOrientationMatrices3x3(controlPoints, curveClosed, planeNormal):
+        """Compute the orientation matrix of :func:`getDefaultOrientation` for all control points.
+
+        :param controlPoints: control point positions as a numpy array of shape (N, 3), N > 1.
+        :return: numpy array of shape (N, 3, 3).
+        """
+        # Camera looks at the next control point
+        forwardDirections = np.roll(controlPoints, -1, axis=0) - controlPoints
+        if not curveClosed:
+            # Last control point has the same orientation as its previous control point
+            forwardDirections[-1] = forwardDirections[-2]
+        return EndoscopyLogic.buildCameraMatrices3x3(forwardDirections, planeNormal)
+
+    @staticmethod
+    def buildCameraMatrices3x3(forwardDirections, viewUp):
+        """Compute the matrix of :func:`buildCameraMatrix3x3` for each row of forwardDirections (focal point - camera position)."""
+        # Camera forward
+        zAxes = forwardDirections / np.linalg.norm(forwardDirections, axis=1)[:, np.newaxis]
+        # Camera left
+        xAxes = np.cross(np.array(viewUp), zAxes)
+        xAxes /= np.linalg.norm(xAxes, axis=1)[:, np.newaxis]
+        # Camera up.  (No need to normalize because it is already normalized.)
+        yAxes = np.cross(zAxes, xAxes)
+        return np.stack((xAxes, yAxes, zAxes), axis=2)
+
+    @staticmethod
+    def quaternionsToMatrices3x3(quaternions):
+        """Convert scalar-first unit quaternions (array of shape (N, 4)) to rotation matrices (array of shape (N, 3, 3))."""
+        w, x, y, z = quaternions.T
+        return np.stack(
+            (
+                np.stack((1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y)), axis=-1),
+                np.stack((2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)), axis=-1),
+                np.stack((2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)), axis=-1),
+            ),
+            axis=1,
+        )
+
+    @staticmethod
+    def slerpQuaternions(startQuaternions, endQuaternions, weights):
+        """Spherical linear interpolation between rows of startQuaternions and endQuaternions (arrays of shape (N, 4)).
+
+        :param weights: interpolation weight for each row, 0.0 corresponds to the start and 1.0 to the end quaternion.
+        :return: unit quaternions as a numpy array of shape (N, 4).
+        """
+        dot = np.sum(startQuaternions * endQuaternions, axis=1)
+        # Interpolate along the shortest path (q and -q represent the same rotation)
+        endQuaternions = np.where(dot[:, np.newaxis] < 0.0, -endQuaternions, endQuaternions)
+        theta = np.arccos(np.clip(np.abs(dot), 0.0, 1.0))
+        sinTheta = np.sin(theta)
+        # Use linear interpolation if the quaternions are nearly the same (to avoid division by zero)
+        nearlySame = sinTheta < 1e-6
+        sinTheta = np.where(nearlySame, 1.0, sinTheta)
+        startWeights = np.where(nearlySame, 1.0 - weights, np.sin((1.0 - weights) * theta) / sinTheta)
+        endWeights = np.where(nearlySame, weights, np.sin(weights * theta) / sinTheta)
+        quaternions = startWeights[:, np.newaxis] * startQuaternions + endWeights[:, np.newaxis] * endQuaternions
+        return quaternions / np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+
     @staticmethod
     def matrix3x3ToOrientation(matrix3x3):
         orientation = np.zeros((4,))
@@ -1141,9 +1266,6 @@ class EndoscopyPathModel:
 
         lines = vtk.vtkCellArray()
         polyData.SetLines(lines)
-        linesIDArray = lines.GetData()
-        linesIDArray.Reset()
-        linesIDArray.InsertNextTuple1(0)
 
         polygons = vtk.vtkCellArray()
         polyData.SetPolys(polygons)
@@ -1151,13 +1273,13 @@ class EndoscopyPathModel:
         idArray.Reset()
         idArray.InsertNextTuple1(0)
 
-        for resampledCurvePointIndex in range(resampledCurve.GetNumberOfControlPoints()):
-            point = np.zeros((3,))
-            resampledCurve.GetNthControlPointPositionWorld(resampledCurvePointIndex, point)
-            pointIndex = points.InsertNextPoint(*point)
-            linesIDArray.InsertNextTuple1(pointIndex)
-            linesIDArray.SetTuple1(0, linesIDArray.GetNumberOfTuples() - 1)
-            lines.SetNumberOfCells(1)
+        # Add all points and a single polyline at once
+        pathPoints = slicer.util.arrayFromMarkupsControlPoints(resampledCurve, world=True)
+        if len(pathPoints) > 0:
+            points.SetData(vtk.util.numpy_support.numpy_to_vtk(pathPoints, deep=True))
+            # Legacy cell array format: number of points followed by the point IDs
+            lineIDs = np.concatenate(([len(pathPoints)], np.arange(len(pathPoints)))).astype(vtk.util.numpy_support.ID_TYPE_CODE)
+            lines.ImportLegacyFormat(vtk.util.numpy_support.numpy_to_vtkIdTypeArray(lineIDs, deep=True))
 
         # Create model node
         model = outputPathNode
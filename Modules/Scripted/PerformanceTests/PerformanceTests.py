@@ -37,6 +37,7 @@ class PerformanceTestsWidget(ScriptedLoadableModuleWidget):
             ("Get Sample Data", self.downloadMRHead),
             ("Reslicing", self.reslicing),
             ("Crosshair Jump", self.crosshairJump),
+            ("Data Probe", self.dataProbe),
             ("Memory Check", self.memoryCheck),
         )
 
@@ -160,6 +161,38 @@ class PerformanceTestsWidget(ScriptedLoadableModuleWidget):
         self.log.ensureCursorVisible()
         self.log.repaint()
 
+    def dataProbe(self, iters=15, steps=50):
+        """go into a loop that stresses data probe update by moving the mouse over a slice view"""
+        import time
+
+        sliceNode = slicer.util.getNode("vtkMRMLSliceNodeRed")
+        dims = sliceNode.GetDimensions()
+        layoutManager = slicer.app.layoutManager()
+        sliceWidget = layoutManager.sliceWidget("Red")
+        elapsedTime = 0
+        startPoint = (int(dims[0] * 0.3), int(dims[1] * 0.3))
+        endPoint = (int(dims[0] * 0.6), int(dims[1] * 0.6))
+        for i in range(iters):
+            startTime = time.time()
+            for start, end in [(startPoint, endPoint), (endPoint, startPoint)]:
+                for step in range(steps):
+                    frac = float(step) / (steps - 1)
+                    position = (int(start[0] + frac * (end[0] - start[0])), int(start[1] + frac * (end[1] - start[1])))
+                    slicer.util.clickAndDrag(sliceWidget, button=None, start=position, end=position, steps=1)
+                    # Data probe compresses cursor position changes until the application returns to the
+                    # event loop, process events after each mouse move so that each move updates the readouts
+                    slicer.app.processEvents()
+            endTime = time.time()
+            elapsedTime += endTime - startTime
+        numberOfMouseMoves = iters * 2 * steps
+        result = "mouse moves per second = %g (%g ms per mouse move)" % (
+            numberOfMouseMoves / elapsedTime, 1000.0 * elapsedTime / numberOfMouseMoves)
+        print(result)
+        self.log.insertHtml("<i>%s</i>" % result)
+        self.log.insertPlainText("\n")
+        self.log.ensureCursorVisible()
+        self.log.repaint()
+
     def memoryCallback(self):
         if self.sysInfoWindow.visible:
             self.sysInfo.RunMemoryCheck()
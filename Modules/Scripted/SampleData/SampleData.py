@@ -61,6 +61,13 @@ def downloadSamples(sampleName):
     return SampleDataLogic().downloadSamples(sampleName)
 
 
+def prefetchSamples(sampleNames, maximumNumberOfWorkers=4, progressCallback=None):
+    """Download the files of the given samples into the cache concurrently, without loading them.
+    See :py:meth:`SampleDataLogic.prefetchSources` for details.
+    """
+    return SampleDataLogic().prefetchSamples(sampleNames, maximumNumberOfWorkers, progressCallback)
+
+
 #
 # SampleData
 #
@@ -546,6 +553,12 @@ class SampleDataLogic:
         if slicer.app.testingEnabled():
             self.registerTestingDataSources()
         self.downloadPercent = 0
+        # HTTP downloads of files larger than minimumParallelDownloadSize (in bytes) are split into byte ranges
+        # that are downloaded using multiple connections at the same time.
+        # Set numberOfDownloadConnections to 1 to download all files using a single connection.
+        self.numberOfDownloadConnections = 4
+        self.minimumParallelDownloadSize = 8 * 1024 * 1024
+        self.downloadTimeoutSec = 60
 
     def registerBuiltInSampleDataSources(self):
         """Fills in the pre-define sample data sources"""
@@ -653,10 +666,8 @@ class SampleDataLogic:
         """Register sample data sources used by SampleData self-test to test module functionalities."""
         self.registerCustomSampleDataSource(**SampleDataTest.CustomDownloaderDataSource)
 
-    def downloadFileIntoCache(self, uri, name, checksum=None):
-        """Given a uri and and a filename, download the data into
-        a file of the given name in the scene's cache
-        """
+    def getCacheDirectory(self):
+        """Return the scene's cache folder, create it if it does not exist yet."""
         destFolderPath = slicer.mrmlScene.GetCacheManager().GetRemoteCacheDirectory()
 
         if not os.access(destFolderPath, os.W_OK):
@@ -666,7 +677,13 @@ class SampleDataLogic:
                 self.logMessage(_("Failed to create cache folder {path}").format(path=destFolderPath), logging.ERROR)
             if not os.access(destFolderPath, os.W_OK):
                 self.logMessage(_("Cache folder {path} is not writable").format(path=destFolderPath), logging.ERROR)
-        return self.downloadFile(uri, destFolderPath, name, checksum)
+        return destFolderPath
+
+    def downloadFileIntoCache(self, uri, name, checksum=None):
+        """Given a uri and and a filename, download the data into
+        a file of the given name in the scene's cache
+        """
+        return self.downloadFile(uri, self.getCacheDirectory(), name, checksum)
 
     def downloadSourceIntoCache(self, source):
         """Download all files for the given source and return a
@@ -677,6 +694,110 @@ class SampleDataLogic:
             filePaths.append(self.downloadFileIntoCache(uri, fileName, checksum))
         return filePaths
 
+    def prefetchSamples(self, sampleNames, maximumNumberOfWorkers=4, progressCallback=None):
+        """Download the files of the samples into the cache concurrently, without loading them.
+        See :py:meth:`prefetchSources` for details.
+
+        :param sampleNames: Sample name or list of sample names.
+        :raises ValueError: if a sample name is not found.
+        """
+        if isinstance(sampleNames, str):
+            sampleNames = [sampleNames]
+        sources = []
+        for sampleName in sampleNames:
+            source = self.sourceForSampleName(sampleName)
+            if source is None:
+                raise ValueError(f"Sample data source not found: {sampleName}")
+            sources.append(source)
+        return self.prefetchSources(sources, maximumNumberOfWorkers, progressCallback)
+
+    def prefetchSources(self, sources, maximumNumberOfWorkers=4, progressCallback=None, maximumAttemptsCount=3):
+        """Download all files of the given SampleDataSources into the cache concurrently, without loading them.
+
+        This allows downloading all the data that is needed (for example, for a test suite or a training session)
+        in advance. Files that are already in the cache are not downloaded again, therefore subsequent
+        :py:meth:`downloadFromSource` calls just load the files from the cache.
+
+        Files of sources that use a custom downloader or that do not specify file names are skipped,
+        as they could not be found in the cache later.
+
+        :param sources: list of SampleDataSource instances.
+        :param maximumNumberOfWorkers: Maximum number of files downloaded at the same time.
+        :param progressCallback: Function called as ``progressCallback(fileName, percent)`` when the download
+          progress of a file changes. Called from the main thread. ``percent`` is None if the size of the file is unknown.
+        :param maximumAttemptsCount: Maximum number of attempts to download each file.
+        :return: Dictionary that maps file names to downloaded file paths (None if the download failed).
+        """
+        import concurrent.futures
+        import copy
+        import queue
+
+        filesToDownload = {}
+        for source in sources:
+            if source.customDownloader:
+                self.logMessage(_("Skip prefetching {sampleName}: data is downloaded by a custom downloader").format(
+                    sampleName=source.sampleName), logging.WARNING)
+                continue
+            for uri, fileName, checksum in zip(source.uris, source.fileNames, source.checksums):
+                if fileName is None:
+                    self.logMessage(_("Skip prefetching {uri}: file name is not specified").format(uri=uri), logging.WARNING)
+                    continue
+                filesToDownload[fileName] = (uri, checksum)
+
+        destFolderPath = self.getCacheDirectory()
+
+        # Download status and log messages are collected from the worker threads and reported from the main thread
+        messageQueue = queue.Queue()
+        downloadPercents = {}
+
+        def prefetchFile(fileName, uri, checksum):
+            # Each download uses its own logic object so that download states do not interfere
+            downloader = copy.copy(self)
+            downloader.logMessage = lambda message, logLevel=logging.DEBUG: messageQueue.put((message, logLevel))
+
+            def reportHook(blocksSoFar, blockSize, totalSize):
+                downloadPercents[fileName] = min(int(100.0 * blocksSoFar * blockSize / totalSize), 100) if totalSize > 0 else None
+
+            downloader.reportHook = reportHook
+            for attemptsCount in range(maximumAttemptsCount):
+                try:
+                    filePath = downloader.downloadFile(uri, destFolderPath, fileName, checksum)
+                except ValueError:
+                    filePath = None
+                # File is removed if checksum verification failed
+                if filePath and os.path.exists(filePath):
+                    downloadPercents[fileName] = 100
+                    return filePath
+                downloader.logMessage(_("Download of {fileName} failed (attempt {current} of {total})...").format(
+                    fileName=fileName, current=attemptsCount + 1, total=maximumAttemptsCount), logging.ERROR)
+            return None
+
+        def reportProgress(reportedPercents):
+            while not messageQueue.empty():
+                self.logMessage(*messageQueue.get())
+            if progressCallback:
+                for fileName, percent in list(downloadPercents.items()):
+                    if reportedPercents.get(fileName, -1) != percent:
+                        reportedPercents[fileName] = percent
+                        progressCallback(fileName, percent)
+
+        filePaths = {}
+        reportedPercents = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, maximumNumberOfWorkers)) as executor:
+            fileNameForFuture = {executor.submit(prefetchFile, fileName, uri, checksum): fileName
+                                 for fileName, (uri, checksum) in filesToDownload.items()}
+            pendingFutures = set(fileNameForFuture)
+            while pendingFutures:
+                doneFutures, pendingFutures = concurrent.futures.wait(pendingFutures, timeout=0.2)
+                for future in doneFutures:
+                    filePaths[fileNameForFuture[future]] = future.result()
+                reportProgress(reportedPercents)
+
+        failedFileNames = [fileName for fileName, filePath in filePaths.items() if filePath is None]
+        if failedFileNames:
+            self.logMessage(_("Failed to prefetch {fileNames}").format(fileNames=", ".join(failedFileNames)), logging.ERROR)
+        return filePaths
+
     def downloadFromSource(self, source, maximumAttemptsCount=3):
         """Given an instance of SampleDataSource, downloads the associated data and
         load them into Slicer if it applies.
@@ -931,22 +1052,158 @@ class SampleDataLogic:
                             sizeCompleted=humanSizeSoFar, percentCompleted=percent, sizeTotal=humanSizeTotal) + "</i>")
             self.downloadPercent = percent
 
+    def verifiedChecksumFilePath(self, filePath):
+        """Return path of the file that stores the checksum of ``filePath`` after it has been verified."""
+        return filePath + ".checksum.json"
+
+    def isChecksumVerified(self, filePath, checksum):
+        """Return True if ``checksum`` of the file has been verified and the file has not changed since then.
+
+        This allows reusing files from the cache without computing their checksum each time.
+        """
+        import json
+
+        try:
+            with open(self.verifiedChecksumFilePath(filePath)) as verifiedChecksumFile:
+                verified = json.load(verifiedChecksumFile)
+            fileStat = os.stat(filePath)
+        except (OSError, ValueError):
+            return False
+        return (verified.get("checksum") == checksum
+                and verified.get("size") == fileStat.st_size
+                and verified.get("mtime") == fileStat.st_mtime_ns)
+
+    def saveVerifiedChecksum(self, filePath, checksum):
+        """Store the checksum of the file along with its size and modification time."""
+        import json
+
+        fileStat = os.stat(filePath)
+        try:
+            with open(self.verifiedChecksumFilePath(filePath), "w") as verifiedChecksumFile:
+                json.dump({"checksum": checksum, "size": fileStat.st_size, "mtime": fileStat.st_mtime_ns}, verifiedChecksumFile)
+        except OSError as e:
+            # Not an error, the checksum will be just computed again next time
+            self.logMessage(_("Failed to save verified checksum of {path}: {errorMessage}").format(path=filePath, errorMessage=e), logging.WARNING)
+
+    def removeCachedFile(self, filePath):
+        """Remove a file and its verified checksum from the cache."""
+        qt.QFile(filePath).remove()
+        qt.QFile(self.verifiedChecksumFilePath(filePath)).remove()
+
+    def retrieveFile(self, uri, filePath):
+        """Download ``uri`` into ``filePath``.
+
+        If the server supports HTTP range requests then large files are downloaded in multiple byte ranges
+        at the same time, using ``numberOfDownloadConnections`` connections. Downloaded ranges are stored in
+        temporary part files, so that an interrupted download is resumed on the next attempt.
+
+        :raises OSError: if download failed.
+        """
+        import urllib.parse, urllib.request
+
+        if self.numberOfDownloadConnections > 1 and urllib.parse.urlparse(uri).scheme.lower() in ["http", "https"]:
+            url, totalSize = self.getRangeDownloadInfo(uri)
+            if totalSize is not None and totalSize >= max(self.minimumParallelDownloadSize, 1):
+                self.retrieveFileRanges(url, filePath, totalSize)
+                return
+        urllib.request.urlretrieve(uri, filePath, self.reportHook)
+
+    def getRangeDownloadInfo(self, uri):
+        """Return the URL (after redirections) and size of the file if the server supports range requests.
+
+        If range requests are not supported then size is None.
+        """
+        import urllib.error, urllib.request
+
+        request = urllib.request.Request(uri, headers={"Range": "bytes=0-0"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.downloadTimeoutSec) as response:
+                # Expected Content-Range header format: "bytes 0-0/<size>"
+                totalSize = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if response.status != 206 or not totalSize.isdigit():
+                    return uri, None
+                return response.geturl(), int(totalSize)
+        except urllib.error.HTTPError:
+            return uri, None
+
+    def retrieveFileRanges(self, url, filePath, totalSize):
+        """Download ``url`` into ``filePath`` in multiple byte ranges at the same time.
+
+        :raises OSError: if download failed.
+        """
+        import concurrent.futures
+        import glob
+        import math
+        import shutil
+        import urllib.request
+
+        rangeSize = math.ceil(totalSize / self.numberOfDownloadConnections)
+        byteRanges = [(start, min(start + rangeSize, totalSize) - 1) for start in range(0, totalSize, rangeSize)]
+        partFilePaths = [f"{filePath}.part-{start}-{end}" for start, end in byteRanges]
+        # Number of downloaded bytes of each range (updated by the worker threads)
+        downloadedSizes = [0] * len(byteRanges)
+
+        def downloadRange(rangeIndex):
+            start, end = byteRanges[rangeIndex]
+            partFilePath = partFilePaths[rangeIndex]
+            rangeLength = end - start + 1
+            # Resume previously interrupted download
+            downloadedSize = os.path.getsize(partFilePath) if os.path.exists(partFilePath) else 0
+            if downloadedSize > rangeLength:
+                downloadedSize = 0
+            downloadedSizes[rangeIndex] = downloadedSize
+            if downloadedSize == rangeLength:
+                return
+            request = urllib.request.Request(url, headers={"Range": f"bytes={start + downloadedSize}-{end}"})
+            with urllib.request.urlopen(request, timeout=self.downloadTimeoutSec) as response, \
+                    open(partFilePath, "ab" if downloadedSize else "wb") as partFile:
+                if response.status != 206:
+                    raise OSError(f"Server did not return the requested byte range of {url}")
+                while True:
+                    chunk = response.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    partFile.write(chunk)
+                    downloadedSizes[rangeIndex] += len(chunk)
+            if downloadedSizes[rangeIndex] != rangeLength:
+                raise OSError(f"Incomplete download of bytes {start}-{end} of {url}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(byteRanges)) as executor:
+            futures = [executor.submit(downloadRange, rangeIndex) for rangeIndex in range(len(byteRanges))]
+            pendingFutures = futures
+            while pendingFutures:
+                _done, pendingFutures = concurrent.futures.wait(pendingFutures, timeout=0.5)
+                # Progress is reported from the main thread
+                self.reportHook(sum(downloadedSizes), 1, totalSize)
+            for future in futures:
+                # raise the error if any of the ranges failed
+                future.result()
+
+        with open(filePath, "wb") as outputFile:
+            for partFilePath in partFilePaths:
+                with open(partFilePath, "rb") as partFile:
+                    shutil.copyfileobj(partFile, outputFile, 16 * 1024 * 1024)
+        # Remove all part files, including leftovers of downloads with different number of connections
+        for partFilePath in glob.glob(glob.escape(filePath) + ".part-*"):
+            os.remove(partFilePath)
+
     def downloadFile(self, uri, destFolderPath, name, checksum=None):
         """
         :param uri: Download URL.
         :param destFolderPath: Folder to download the file into.
         :param name: File name that will be downloaded.
         :param checksum: Checksum formatted as ``<algo>:<digest>`` to verify the downloaded file. For example, ``SHA256:cc211f0dfd9a05ca3841ce1141b292898b2dd2d3f08286affadf823a7e58df93``.
+
+        Once the checksum of a file is verified, it is stored in a file next to it (along with the file size
+        and modification time), so that reusing the file from the cache does not require computing its checksum again.
         """
         self.downloadPercent = 0
         filePath = destFolderPath + "/" + name
         (algo, digest) = extractAlgoAndDigest(checksum)
         if not os.path.exists(filePath) or os.stat(filePath).st_size == 0:
-            import urllib.request, urllib.parse, urllib.error
-
             self.logMessage(_("Requesting download {name} from {uri} ...").format(name=name, uri=uri))
             try:
-                urllib.request.urlretrieve(uri, filePath, self.reportHook)
+                self.retrieveFile(uri, filePath)
                 self.logMessage(_("Download finished"))
             except OSError as e:
                 self.logMessage("\t" + _("Download failed: {errorMessage}").format(errorMessage=e), logging.ERROR)
@@ -954,24 +1211,30 @@ class SampleDataLogic:
 
             if algo is not None:
                 self.logMessage(_("Verifying checksum"))
-                current_digest = computeChecksum(algo, filePath)
+                current_digest = computeChecksum(algo, filePath, useCache=True)
                 if current_digest != digest:
                     self.logMessage(
                         _("Checksum verification failed. Computed checksum {currentChecksum} different from expected checksum {expectedChecksum}").format(
                             currentChecksum=current_digest, expectedChecksum=digest))
-                    qt.QFile(filePath).remove()
+                    self.removeCachedFile(filePath)
                 else:
+                    self.saveVerifiedChecksum(filePath, checksum)
                     self.downloadPercent = 100
                     self.logMessage(_("Checksum OK"))
         else:
             if algo is not None:
+                if self.isChecksumVerified(filePath, checksum):
+                    self.downloadPercent = 100
+                    self.logMessage(_("File already exists and checksum is OK - reusing it."))
+                    return filePath
                 self.logMessage(_("Verifying checksum"))
-                current_digest = computeChecksum(algo, filePath)
+                current_digest = computeChecksum(algo, filePath, useCache=True)
                 if current_digest != digest:
                     self.logMessage(_("File already exists in cache but checksum is different - re-downloading it."))
-                    qt.QFile(filePath).remove()
+                    self.removeCachedFile(filePath)
                     return self.downloadFile(uri, destFolderPath, name, checksum)
                 else:
+                    self.saveVerifiedChecksum(filePath, checksum)
                     self.downloadPercent = 100
                     self.logMessage(_("File already exists and checksum is OK - reusing it."))
             else:
@@ -1062,6 +1325,8 @@ class SampleDataTest(ScriptedLoadableModuleTest):
             self.test_defaultFileType,
             self.test_customDownloader,
             self.test_categoryForSource,
+            self.test_downloadFile_parallelRanges,
+            self.test_prefetchSources,
         ]:
             self.setUp()
             test()
@@ -1328,3 +1593,155 @@ class SampleDataTest(ScriptedLoadableModuleTest):
         logic = SampleDataLogic()
         source = slicer.modules.sampleDataSources[logic.builtInCategoryName][0]
         self.assertEqual(logic.categoryForSource(source), logic.builtInCategoryName)
+
+    class LocalHttpServer:
+        """Serve files from memory on a local HTTP server that supports range requests.
+
+        Usage: ``with SampleDataTest.LocalHttpServer({"name.bin": content}) as server: url = server.url("name.bin")``
+        """
+
+        def __init__(self, files):
+            self.files = files
+            self.requestedRanges = []
+            self.server = None
+
+        def __enter__(self):
+            import http.server
+            import threading
+
+            localServer = self
+
+            class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+                def do_GET(self):
+                    content = localServer.files.get(self.path.lstrip("/"))
+                    if content is None:
+                        self.send_error(404)
+                        return
+                    rangeHeader = self.headers.get("Range")
+                    localServer.requestedRanges.append(rangeHeader)
+                    if rangeHeader:
+                        start, end = rangeHeader.removeprefix("bytes=").split("-")
+                        start, end = int(start), int(end) if end else len(content) - 1
+                        body = content[start:end + 1]
+                        self.send_response(206)
+                        self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+                    else:
+                        body = content
+                        self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            self.server.shutdown()
+            self.server.server_close()
+
+        def url(self, name):
+            return f"http://127.0.0.1:{self.server.server_address[1]}/{name}"
+
+    def test_downloadFile_parallelRanges(self):
+        import hashlib
+        import unittest.mock
+
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        checksum = "SHA256:" + hashlib.sha256(content).hexdigest()
+        destFolderPath = slicer.util.tempDirectory()
+        logic = SampleDataLogic()
+        logic.numberOfDownloadConnections = 4
+        logic.minimumParallelDownloadSize = 1024 * 1024
+
+        with SampleDataTest.LocalHttpServer({"data.bin": content}) as server:
+            # Download in parallel byte ranges
+            filePath = logic.downloadFile(server.url("data.bin"), destFolderPath, "data.bin", checksum)
+            with open(filePath, "rb") as f:
+                self.assertEqual(f.read(), content)
+            # one request for getting the file size, then one request for each range
+            self.assertEqual(len(server.requestedRanges), 1 + logic.numberOfDownloadConnections)
+            self.assertTrue(all(server.requestedRanges))
+            self.assertEqual(sorted(os.listdir(destFolderPath)), ["data.bin", "data.bin.checksum.json"])
+            self.assertTrue(os.path.exists(logic.verifiedChecksumFilePath(filePath)))
+
+            # Cached file with verified checksum is reused without computing the checksum
+            with unittest.mock.patch(f"{__name__}.computeChecksum") as computeChecksumMock:
+                self.assertEqual(logic.downloadFile(server.url("data.bin"), destFolderPath, "data.bin", checksum), filePath)
+                computeChecksumMock.assert_not_called()
+
+            # Modified file is verified again and downloaded again
+            with open(filePath, "r+b") as f:
+                f.write(b"modified")
+            server.requestedRanges.clear()
+            logic.downloadFile(server.url("data.bin"), destFolderPath, "data.bin", checksum)
+            with open(filePath, "rb") as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(len(server.requestedRanges), 1 + logic.numberOfDownloadConnections)
+
+            # Interrupted download is resumed from the already downloaded part files
+            logic.removeCachedFile(filePath)
+            rangeSize = len(content) // logic.numberOfDownloadConnections + 1
+            with open(f"{filePath}.part-0-{rangeSize - 1}", "wb") as f:
+                f.write(content[:1000])
+            server.requestedRanges.clear()
+            logic.downloadFile(server.url("data.bin"), destFolderPath, "data.bin", checksum)
+            with open(filePath, "rb") as f:
+                self.assertEqual(f.read(), content)
+            self.assertIn(f"bytes=1000-{rangeSize - 1}", server.requestedRanges)
+            self.assertEqual(sorted(os.listdir(destFolderPath)), ["data.bin", "data.bin.checksum.json"])
+
+            # Single connection download
+            logic.removeCachedFile(filePath)
+            logic.numberOfDownloadConnections = 1
+            server.requestedRanges.clear()
+            logic.downloadFile(server.url("data.bin"), destFolderPath, "data.bin", checksum)
+            with open(filePath, "rb") as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(server.requestedRanges, [None])
+
+    def test_prefetchSources(self):
+        import hashlib
+        import time
+
+        contents = {f"prefetch{index}.bin": os.urandom(100 * 1024 + index) for index in range(6)}
+        logic = SampleDataLogic()
+        cacheDirectory = logic.getCacheDirectory()
+        for fileName in contents:
+            logic.removeCachedFile(os.path.join(cacheDirectory, fileName))
+
+        with SampleDataTest.LocalHttpServer(contents) as server:
+            sources = [
+                SampleDataSource(
+                    sampleName="prefetchA",
+                    uris=[server.url(fileName) for fileName in list(contents)[:3]],
+                    fileNames=list(contents)[:3],
+                    checksums=["SHA256:" + hashlib.sha256(content).hexdigest() for content in list(contents.values())[:3]]),
+                SampleDataSource(
+                    sampleName="prefetchB",
+                    uris=[server.url(fileName) for fileName in list(contents)[3:]],
+                    fileNames=list(contents)[3:]),
+                SampleDataSource(
+                    sampleName="prefetchMissing",
+                    uris=server.url("missing.bin"),
+                    fileNames="missing.bin"),
+            ]
+            progress = {}
+            sceneMTime = slicer.mrmlScene.GetMTime()
+            startTime = time.perf_counter()
+            filePaths = logic.prefetchSources(sources, maximumNumberOfWorkers=3,
+                                              progressCallback=lambda fileName, percent: progress.__setitem__(fileName, percent),
+                                              maximumAttemptsCount=1)
+            logging.info(f"Prefetched {len(contents)} files in {time.perf_counter() - startTime:.2f}s")
+
+        # nothing is loaded into the scene
+        self.assertEqual(sceneMTime, slicer.mrmlScene.GetMTime())
+        self.assertIsNone(filePaths["missing.bin"])
+        for fileName, content in contents.items():
+            with open(filePaths[fileName], "rb") as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(progress[fileName], 100)
+            logic.removeCachedFile(filePaths[fileName])
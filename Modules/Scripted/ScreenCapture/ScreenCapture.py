@@ -4,6 +4,7 @@ import os
 import ctk
 import qt
 import vtk
+import vtk.util.numpy_support
 
 import slicer
 from slicer.i18n import tr as _
@@ -703,6 +704,13 @@ class ScreenCaptureWidget(ScriptedLoadableModuleWidget):
         imageFileNamePattern = (self.fileNamePatternWidget.text
                                 if (self.outputTypeWidget.currentData == "IMAGE_SERIES") else self.logic.getRandomFilePattern())
 
+        # Frames of animations are streamed directly into the video encoder (or kept in memory for the lightbox image)
+        # instead of being written to temporary image files.
+        streamFrames = numberOfSteps > 1 and self.outputTypeWidget.currentData in ["VIDEO", "LIGHTBOX_IMAGE"]
+        fps = self.videoFrameRateSliderWidget.value
+        forwardBackward = self.forwardBackwardCheckBox.checked
+        numberOfRepeats = int(self.repeatSliderWidget.value)
+
         self.captureButton.setEnabled(True)
         self.captureButton.text = self.captureButtonLabelCancel
         slicer.app.setOverrideCursor(qt.Qt.WaitCursor)
@@ -714,6 +722,14 @@ class ScreenCaptureWidget(ScriptedLoadableModuleWidget):
         elif showViewControllers:
             logging.warning(_("View controllers are only available to be shown when capturing all views."))
         try:
+            if streamFrames:
+                repeatFrames = (forwardBackward and numberOfSteps > 2) or numberOfRepeats > 1
+                if videoOutputRequested:
+                    self.logic.startFrameStream(os.path.join(outputDir, self.videoFileNameWidget.text), fps,
+                                                self.extraVideoOptionsWidget.text, keepFrames=repeatFrames)
+                else:
+                    self.logic.startFrameStream(keepFrames=True)
+
             if numberOfSteps < 2:
                 if imageFileNamePattern != self.snapshotFileNamePattern or outputDir != self.snapshotOutputDir:
                     self.snapshotIndex = 0
@@ -751,47 +767,51 @@ class ScreenCaptureWidget(ScriptedLoadableModuleWidget):
 
             import shutil
 
-            fps = self.videoFrameRateSliderWidget.value
-
             if numberOfSteps > 1:
-                forwardBackward = self.forwardBackwardCheckBox.checked
-                numberOfRepeats = int(self.repeatSliderWidget.value)
-                filePathPattern = os.path.join(outputDir, imageFileNamePattern)
-                fileIndex = numberOfSteps
+                # Indices of the captured frames that are appended to play the animation forward-backward and repeated
+                repeatedFrameIndices = []
                 for repeatIndex in range(numberOfRepeats):
                     if forwardBackward:
-                        for step in reversed(range(1, numberOfSteps - 1)):
-                            sourceFilename = filePathPattern % step
-                            destinationFilename = filePathPattern % fileIndex
-                            self.logic.addLog(_("Copy to {filename}").format(filename=destinationFilename))
-                            shutil.copyfile(sourceFilename, destinationFilename)
-                            fileIndex += 1
+                        repeatedFrameIndices.extend(reversed(range(1, numberOfSteps - 1)))
                     if repeatIndex < numberOfRepeats - 1:
-                        for step in range(numberOfSteps):
-                            sourceFilename = filePathPattern % step
-                            destinationFilename = filePathPattern % fileIndex
-                            self.logic.addLog(_("Copy to {filename}").format(filename=destinationFilename))
-                            shutil.copyfile(sourceFilename, destinationFilename)
-                            fileIndex += 1
+                        repeatedFrameIndices.extend(range(numberOfSteps))
+                if streamFrames:
+                    frameStream = self.logic.frameStream
+                    for step in repeatedFrameIndices:
+                        frameStream.addFrame(frameStream.frames[step])
+                else:
+                    filePathPattern = os.path.join(outputDir, imageFileNamePattern)
+                    for fileIndex, step in enumerate(repeatedFrameIndices, start=numberOfSteps):
+                        sourceFilename = filePathPattern % step
+                        destinationFilename = filePathPattern % fileIndex
+                        self.logic.addLog(_("Copy to {filename}").format(filename=destinationFilename))
+                        shutil.copyfile(sourceFilename, destinationFilename)
                 if forwardBackward and (numberOfSteps > 2):
                     numberOfSteps += numberOfSteps - 2
                 numberOfSteps *= numberOfRepeats
 
             try:
-                if videoOutputRequested:
+                if streamFrames:
+                    frameStream = self.logic.stopFrameStream()
+                    if self.outputTypeWidget.currentData == "LIGHTBOX_IMAGE":
+                        self.logic.createLightboxImage(int(self.lightboxColumnCountSliderWidget.value),
+                                                       outputDir, None, numberOfSteps, self.lightboxImageFileNameWidget.text,
+                                                       images=frameStream.frames)
+                elif videoOutputRequested:
                     self.logic.createVideo(fps, self.extraVideoOptionsWidget.text,
                                            outputDir, imageFileNamePattern, self.videoFileNameWidget.text)
                 elif (self.outputTypeWidget.currentData == "LIGHTBOX_IMAGE"):
                     self.logic.createLightboxImage(int(self.lightboxColumnCountSliderWidget.value),
                                                    outputDir, imageFileNamePattern, numberOfSteps, self.lightboxImageFileNameWidget.text)
             finally:
-                if not self.outputTypeWidget.currentData == "IMAGE_SERIES":
+                if not streamFrames and not self.outputTypeWidget.currentData == "IMAGE_SERIES":
                     self.logic.deleteTemporaryFiles(outputDir, imageFileNamePattern, numberOfSteps)
 
             self.addLog(_("Done."))
             self.createdOutputFile = os.path.join(outputDir, self.videoFileNameWidget.text) if videoOutputRequested else outputDir
             self.showCreatedOutputFileButton.enabled = True
         except Exception as e:
+            self.logic.abortFrameStream()
             self.addLog(_("Error:") + str(e))
 
             import traceback
@@ -848,6 +868,14 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         self.watermarkOpacityPercent = 100
         self.watermarkImagePath = None
 
+        # If a frame stream is set then captured animation frames are sent to it instead of written to image files
+        self.frameStream = None
+
+        # Offscreen batch rendering: single views are rendered into an offscreen buffer of the requested size
+        # without processing all pending application events for each captured frame.
+        self.offscreenRendering = False
+        self.offscreenImageSize = None
+
     def requestCancel(self):
         logging.info("User requested cancelling of capture")
         self.cancelRequested = True
@@ -996,6 +1024,19 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
     def setWatermarkImagePath(self, watermarkImagePath):
         self.watermarkImagePath = watermarkImagePath
 
+    def setOffscreenRendering(self, enabled, imageSize=None):
+        """Enable rendering of captured single views into an offscreen buffer.
+
+        This makes capture speed independent of the application event loop and allows capturing
+        images of arbitrary resolution, for example for batch generation of videos on servers
+        using a virtual display (Xvfb) or offscreen OpenGL (OSMesa).
+
+        :param enabled: Render views offscreen when capturing single views. All-views capture always uses the screen.
+        :param imageSize: Size of the captured images as [width, height]. If None then the view size is used.
+        """
+        self.offscreenRendering = enabled
+        self.offscreenImageSize = imageSize
+
     def getSliceLogicFromSliceNode(self, sliceNode):
         lm = slicer.app.layoutManager()
         sliceLogic = lm.sliceWidget(sliceNode.GetLayoutName()).sliceLogic()
@@ -1035,17 +1076,24 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         :param filename: Filename of the desired output file. If none, no file will be written.
         :param transparentBackground: Set the background to be transparent for single-view captures.
         :param volumeNode: Vector volume node to store the capture image. If none, no vector volume node will be updated.
+        :return: Captured image.
         """
-        slicer.app.processEvents()
-        if view:
-            if type(view) == slicer.qMRMLSliceView or type(view) == slicer.qMRMLThreeDView:
-                view.forceRender()
+        offscreen = self.offscreenRendering and (type(view) == slicer.qMRMLSliceView or type(view) == slicer.qMRMLThreeDView)
+        if not offscreen:
+            slicer.app.processEvents()
+            if view:
+                if type(view) == slicer.qMRMLSliceView or type(view) == slicer.qMRMLThreeDView:
+                    view.forceRender()
+                else:
+                    view.repaint()
             else:
-                view.repaint()
-        else:
-            slicer.util.forceRenderAllViews()
+                slicer.util.forceRenderAllViews()
 
-        if view is None:
+        if offscreen:
+            capturedImage = self.captureRenderWindow(view.renderWindow(), transparentBackground, offscreen=True,
+                                                     imageSize=self.offscreenImageSize)
+
+        elif view is None:
             if transparentBackground:
                 logging.warning("Transparent background is only available for single-view capture")
 
@@ -1071,27 +1119,7 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
 
         else:
             # Capture single view
-
-            rw = view.renderWindow()
-            wti = vtk.vtkWindowToImageFilter()
-
-            if transparentBackground:
-                originalAlphaBitPlanes = rw.GetAlphaBitPlanes()
-                rw.SetAlphaBitPlanes(1)
-                ren = rw.GetRenderers().GetFirstRenderer()
-                originalGradientBackground = ren.GetGradientBackground()
-                ren.SetGradientBackground(False)
-                wti.SetInputBufferTypeToRGBA()
-                rw.Render()  # need to render after changing bit planes
-
-            wti.SetInput(rw)
-            wti.Update()
-
-            if transparentBackground:
-                rw.SetAlphaBitPlanes(originalAlphaBitPlanes)
-                ren.SetGradientBackground(originalGradientBackground)
-
-            capturedImage = wti.GetOutput()
+            capturedImage = self.captureRenderWindow(view.renderWindow(), transparentBackground)
 
         imageSize = capturedImage.GetDimensions()
 
@@ -1132,6 +1160,67 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
             writer.SetInputData(capturedImage)
             writer.SetFileName(filename)
             writer.Write()
+        return capturedImage
+
+    def captureRenderWindow(self, rw, transparentBackground=False, offscreen=False, imageSize=None):
+        """Capture the content of a render window as an image.
+
+        :param rw: Render window to capture.
+        :param transparentBackground: Set the background to be transparent.
+        :param offscreen: Render into the back buffer and read it from there, instead of reading
+          what is currently displayed on the screen. The render window is rendered for each captured image,
+          therefore application events do not need to be processed before capturing.
+        :param imageSize: Size of the captured image as [width, height]. Images larger than the render window
+          are rendered in multiple tiles. If None then the render window size is used.
+        :return: Captured image.
+        """
+        wti = vtk.vtkWindowToImageFilter()
+
+        if transparentBackground:
+            originalAlphaBitPlanes = rw.GetAlphaBitPlanes()
+            rw.SetAlphaBitPlanes(1)
+            ren = rw.GetRenderers().GetFirstRenderer()
+            originalGradientBackground = ren.GetGradientBackground()
+            ren.SetGradientBackground(False)
+            wti.SetInputBufferTypeToRGBA()
+            rw.Render()  # need to render after changing bit planes
+
+        wti.SetInput(rw)
+        if offscreen:
+            wti.ReadFrontBufferOff()
+            wti.ShouldRerenderOn()
+        if imageSize:
+            import math
+
+            renderWindowSize = rw.GetSize()
+            wti.SetScale(max(1, math.ceil(imageSize[0] / renderWindowSize[0])),
+                         max(1, math.ceil(imageSize[1] / renderWindowSize[1])))
+        wti.Update()
+
+        if transparentBackground:
+            rw.SetAlphaBitPlanes(originalAlphaBitPlanes)
+            ren.SetGradientBackground(originalGradientBackground)
+
+        capturedImage = wti.GetOutput()
+
+        if imageSize and list(capturedImage.GetDimensions()[0:2]) != list(imageSize):
+            # Resample the rendered tiles to the exact requested size
+            imageResize = vtk.vtkImageResize()
+            imageResize.SetInputData(capturedImage)
+            imageResize.SetOutputDimensions(imageSize[0], imageSize[1], 1)
+            imageResize.Update()
+            capturedImage = imageResize.GetOutput()
+
+        return capturedImage
+
+    def _captureFrame(self, view, filePathPattern, frameIndex, transparentBackground):
+        """Capture a frame of an animation into the active frame stream or into an image file."""
+        if self.frameStream:
+            self.frameStream.addFrame(self.captureImageFromView(view, None, transparentBackground))
+            return
+        filename = filePathPattern % frameIndex
+        self.addLog(_("Write {filename}").format(filename=filename))
+        self.captureImageFromView(view, filename, transparentBackground)
 
     def createImageWriter(self, filename):
         name, extension = os.path.splitext(filename)
@@ -1244,10 +1333,8 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         compositeNode = sliceLogic.GetSliceCompositeNode()
         offsetStepSize = (endSliceOffset - startSliceOffset) / (numberOfImages - 1)
         for offsetIndex in range(numberOfImages):
-            filename = filePathPattern % offsetIndex
-            self.addLog(_("Write {filename}").format(filename=filename))
             sliceLogic.SetSliceOffset(startSliceOffset + offsetIndex * offsetStepSize)
-            self.captureImageFromView(None if captureAllViews else sliceView, filename, transparentBackground)
+            self._captureFrame(None if captureAllViews else sliceView, filePathPattern, offsetIndex, transparentBackground)
             if self.cancelRequested:
                 break
 
@@ -1275,10 +1362,8 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         endForegroundOpacity = 1.0
         opacityStepSize = (endForegroundOpacity - startForegroundOpacity) / (numberOfImages - 1)
         for offsetIndex in range(numberOfImages):
-            filename = filePathPattern % offsetIndex
-            self.addLog(_("Write {filename}").format(filename=filename))
             compositeNode.SetForegroundOpacity(startForegroundOpacity + offsetIndex * opacityStepSize)
-            self.captureImageFromView(None if captureAllViews else sliceView, filename, transparentBackground)
+            self._captureFrame(None if captureAllViews else sliceView, filePathPattern, offsetIndex, transparentBackground)
             if self.cancelRequested:
                 break
 
@@ -1319,9 +1404,7 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
             renderView.pitchDirection = renderView.PitchUp
         for offsetIndex in range(numberOfImages):
             if not self.cancelRequested:
-                filename = filePathPattern % offsetIndex
-                self.addLog(_("Write {filename}").format(filename=filename))
-                self.captureImageFromView(None if captureAllViews else renderView, filename, transparentBackground)
+                self._captureFrame(None if captureAllViews else renderView, filePathPattern, offsetIndex, transparentBackground)
             if rotationAxis == AXIS_YAW:
                 renderView.yaw()
             else:
@@ -1363,9 +1446,7 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         stepSize = (sequenceEndIndex - sequenceStartIndex) / (numberOfImages - 1)
         for offsetIndex in range(numberOfImages):
             sequenceBrowserNode.SetSelectedItemNumber(int(sequenceStartIndex + offsetIndex * stepSize))
-            filename = filePathPattern % offsetIndex
-            self.addLog(_("Write {filename}").format(filename=filename))
-            self.captureImageFromView(None if captureAllViews else renderView, filename, transparentBackground)
+            self._captureFrame(None if captureAllViews else renderView, filePathPattern, offsetIndex, transparentBackground)
             if self.cancelRequested:
                 break
 
@@ -1373,9 +1454,14 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         if self.cancelRequested:
             raise ValueError(_("User requested cancel."))
 
-    def createLightboxImage(self, numberOfColumns, outputDir, imageFileNamePattern, numberOfImages, lightboxImageFilename):
+    def createLightboxImage(self, numberOfColumns, outputDir, imageFileNamePattern, numberOfImages, lightboxImageFilename, images=None):
+        """Create a lightbox image from captured frames.
+
+        Frames are read from the image files specified by imageFileNamePattern,
+        or taken from the images list (for example, frames kept in memory by a frame stream).
+        """
         self.addLog(_("Export to lightbox image..."))
-        filePathPattern = os.path.join(outputDir, imageFileNamePattern)
+        filePathPattern = os.path.join(outputDir, imageFileNamePattern) if images is None else None
 
         import math
 
@@ -1386,11 +1472,14 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
                 imageIndex = row * numberOfColumns + column
                 if imageIndex >= numberOfImages:
                     break
-                sourceFilename = filePathPattern % imageIndex
-                reader = self.createImageReader(sourceFilename)
-                reader.SetFileName(sourceFilename)
-                reader.Update()
-                image = reader.GetOutput()
+                if images is not None:
+                    image = images[imageIndex]
+                else:
+                    sourceFilename = filePathPattern % imageIndex
+                    reader = self.createImageReader(sourceFilename)
+                    reader.SetFileName(sourceFilename)
+                    reader.Update()
+                    image = reader.GetOutput()
 
                 if imageIndex == 0:
                     # First image, initialize output lightbox image
@@ -1419,17 +1508,49 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
 
         self.addLog(_("Lightbox image saved to file: {filename}").format(filename=outputLightboxImageFilePath))
 
+    def getValidFfmpegPath(self):
+        """Return absolute path of the ffmpeg executable. Raises ValueError if it is not available."""
+        if not self.getFfmpegPath():
+            raise ValueError(_("Video creation failed: ffmpeg executable path is not defined"))
+        ffmpegPath = os.path.abspath(self.getFfmpegPath())
+        if not os.path.isfile(ffmpegPath):
+            raise ValueError(_("Video creation failed: ffmpeg executable path is invalid: {path}").format(path=ffmpegPath))
+        return ffmpegPath
+
+    def startFrameStream(self, outputVideoFilePath=None, frameRate=None, extraOptions="", keepFrames=False):
+        """Capture frames of animations into a frame stream instead of image files.
+
+        :param outputVideoFilePath: If specified, frames are written directly to the standard input of an ffmpeg process
+          that creates this video file.
+        :param frameRate: Video frame rate (frames per second).
+        :param extraOptions: Additional ffmpeg options, such as codec settings.
+        :param keepFrames: Keep the captured frames in memory (for example, for creating a lightbox image or repeating frames).
+        :return: The started frame stream.
+        """
+        ffmpegPath = self.getValidFfmpegPath() if outputVideoFilePath else None
+        self.frameStream = ScreenCaptureFrameStream(ffmpegPath, outputVideoFilePath, frameRate, extraOptions, keepFrames, self.addLog)
+        return self.frameStream
+
+    def stopFrameStream(self):
+        """Stop capturing frames into the frame stream and finish writing the video file.
+
+        :return: The stopped frame stream, which contains the captured frames if it was started with keepFrames=True.
+        """
+        frameStream = self.frameStream
+        self.frameStream = None
+        frameStream.close()
+        return frameStream
+
+    def abortFrameStream(self):
+        """Stop capturing frames into the frame stream without completing the video file."""
+        if self.frameStream:
+            self.frameStream.abort()
+        self.frameStream = None
+
     def createVideo(self, frameRate, extraOptions, outputDir, imageFileNamePattern, videoFileName):
         self.addLog(_("Export to video..."))
 
-        # Get ffmpeg
-        import os.path
-
-        ffmpegPath = os.path.abspath(self.getFfmpegPath())
-        if not ffmpegPath:
-            raise ValueError(_("Video creation failed: ffmpeg executable path is not defined"))
-        if not os.path.isfile(ffmpegPath):
-            raise ValueError(_("Video creation failed: ffmpeg executable path is invalid: {path}").format(filepath=ffmpegPath))
+        ffmpegPath = self.getValidFfmpegPath()
 
         filePathPattern = os.path.join(outputDir, imageFileNamePattern)
         outputVideoFilePath = os.path.join(outputDir, videoFileName)
@@ -1481,6 +1602,141 @@ class ScreenCaptureLogic(ScriptedLoadableModuleLogic):
         return [filename, snapshotIndex]
 
 
+#
+# ScreenCaptureFrameStream
+#
+
+
+class ScreenCaptureFrameStream:
+    """Receives captured frames and writes them as raw video directly to the standard input of an ffmpeg process,
+    and/or keeps them in memory. This avoids encoding each frame into an image file and decoding it again.
+    """
+
+    def __init__(self, ffmpegPath=None, outputVideoFilePath=None, frameRate=None, extraOptions="", keepFrames=False, logCallback=None):
+        self.ffmpegPath = ffmpegPath
+        self.outputVideoFilePath = outputVideoFilePath
+        self.frameRate = frameRate
+        self.extraOptions = extraOptions
+        self.keepFrames = keepFrames
+        self.logCallback = logCallback
+        self.frames = []
+        self.numberOfFrames = 0
+        self.frameSize = None
+        self.startTime = None
+        self.framesPerSecond = None
+        self._process = None
+        self._stderrFile = None
+
+    def addLog(self, text):
+        if self.logCallback:
+            self.logCallback(text)
+        else:
+            logging.info(text)
+
+    def addFrame(self, image):
+        """Add a captured frame (vtkImageData with unsigned char scalars)."""
+        import time
+
+        dimensions = image.GetDimensions()
+        frameSize = (dimensions[0], dimensions[1], image.GetNumberOfScalarComponents())
+        if self.frameSize is None:
+            if image.GetScalarType() != vtk.VTK_UNSIGNED_CHAR:
+                raise ValueError(_("Captured frames must have unsigned char pixel type"))
+            self.frameSize = frameSize
+            self.startTime = time.perf_counter()
+            if self.outputVideoFilePath:
+                self._startFfmpeg()
+        elif frameSize != self.frameSize:
+            raise ValueError(_("All captured frames must have the same size"))
+
+        if self.keepFrames:
+            # Only the reference to the pixel buffer is kept, the image is detached from the capturing pipeline
+            frame = vtk.vtkImageData()
+            frame.ShallowCopy(image)
+            self.frames.append(frame)
+
+        if self._process:
+            import numpy as np
+
+            width, height, numberOfComponents = frameSize
+            pixels = vtk.util.numpy_support.vtk_to_numpy(image.GetPointData().GetScalars()).reshape(height, width, numberOfComponents)
+            # VTK image rows are stored from bottom to top, video frame rows are stored from top to bottom
+            try:
+                self._process.stdin.write(np.ascontiguousarray(pixels[::-1]).data)
+            except BrokenPipeError:
+                # ffmpeg exited, error is reported by close()
+                self.close()
+
+        self.numberOfFrames += 1
+
+    def _startFfmpeg(self):
+        import subprocess
+        import tempfile
+
+        width, height, numberOfComponents = self.frameSize
+        pixelFormats = {1: "gray", 3: "rgb24", 4: "rgba"}
+        if numberOfComponents not in pixelFormats:
+            raise ValueError(_("Unsupported number of image components: {count}").format(count=numberOfComponents))
+        ffmpegParams = [self.ffmpegPath,
+                        "-y",  # overwrite without asking
+                        "-f", "rawvideo",
+                        "-pix_fmt", pixelFormats[numberOfComponents],
+                        "-s", f"{width}x{height}",
+                        "-r", str(self.frameRate),
+                        "-i", "-"]  # read frames from standard input
+        ffmpegParams += [_f for _f in self.extraOptions.split(" ") if _f]
+        ffmpegParams.append(self.outputVideoFilePath)
+
+        self.addLog(_("Start ffmpeg:") + "\n" + " ".join(ffmpegParams))
+
+        # Error output is written to a file to prevent ffmpeg from blocking when the pipe buffer is full
+        self._stderrFile = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(ffmpegParams, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderrFile,
+                                         cwd=os.path.dirname(os.path.abspath(self.outputVideoFilePath)))
+
+    def _readErrorOutput(self):
+        self._stderrFile.seek(0)
+        stderr = self._stderrFile.read().decode(errors="replace")
+        self._stderrFile.close()
+        self._stderrFile = None
+        return stderr
+
+    def close(self):
+        """Finish writing the video file. Raises ValueError if video creation failed."""
+        import time
+
+        if self.startTime is not None and self.framesPerSecond is None:
+            elapsedTime = time.perf_counter() - self.startTime
+            self.framesPerSecond = self.numberOfFrames / elapsedTime if elapsedTime > 0 else None
+            if self.framesPerSecond:
+                self.addLog(_("Captured {count} frames ({fps:.1f} frames per second)").format(count=self.numberOfFrames, fps=self.framesPerSecond))
+
+        if not self._process:
+            return
+        process = self._process
+        self._process = None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returnCode = process.wait()
+        stderr = self._readErrorOutput()
+        if returnCode != 0:
+            self.addLog(_("ffmpeg error output: {error}").format(error=stderr))
+            raise ValueError(_("ffmpeg returned with error"))
+        self.addLog(_("Video export succeeded to file: {path}").format(path=self.outputVideoFilePath))
+        logging.debug("ffmpeg error output: " + stderr)
+
+    def abort(self):
+        """Stop the ffmpeg process without completing the video file."""
+        if not self._process:
+            return
+        self._process.kill()
+        self._process.wait()
+        self._process = None
+        self._readErrorOutput()
+
+
 class ScreenCaptureTest(ScriptedLoadableModuleTest):
     """
     This is the test case for your scripted module.
@@ -1534,6 +1790,8 @@ class ScreenCaptureTest(ScriptedLoadableModuleTest):
         self.test_SliceFade()
         self.test_3dViewRotation()
         self.test_VolumeNodeUpdate()
+        self.test_FrameStream()
+        self.test_OffscreenRendering()
 
     def test_SliceSweep(self):
         self.delayDisplay("Testing SliceSweep")
@@ -1568,3 +1826,59 @@ class ScreenCaptureTest(ScriptedLoadableModuleTest):
         self.logic.captureImageFromView(viewNode, volumeNode=volumeNode)
         self.assertIsNotNone(volumeNode.GetImageData())
         self.delayDisplay("Testing VolumeNode update completed successfully")
+
+    def test_FrameStream(self):
+        self.delayDisplay("Testing capture into frame stream")
+        import os
+
+        viewNode = slicer.mrmlScene.GetNodeByID("vtkMRMLSliceNodeRed")
+        frameStream = self.logic.startFrameStream(keepFrames=True)
+        self.logic.captureSliceSweep(viewNode, -125, 75, self.numberOfImages, self.tempDir, self.imageFileNamePattern)
+        self.logic.stopFrameStream()
+        self.assertIsNone(self.logic.frameStream)
+        self.assertEqual(frameStream.numberOfFrames, self.numberOfImages)
+        self.assertEqual(len(frameStream.frames), self.numberOfImages)
+        self.assertIsNotNone(frameStream.framesPerSecond)
+        # no image files are written
+        self.assertFalse(os.path.exists(os.path.join(self.tempDir, self.imageFileNamePattern % 0)))
+
+        lightboxImageFilename = "lightbox.png"
+        self.logic.createLightboxImage(5, self.tempDir, None, self.numberOfImages, lightboxImageFilename, images=frameStream.frames)
+        lightboxImageFilePath = os.path.join(self.tempDir, lightboxImageFilename)
+        self.assertTrue(os.path.exists(lightboxImageFilePath))
+        os.remove(lightboxImageFilePath)
+
+        if not self.logic.isFfmpegPathValid():
+            self.delayDisplay("Video encoder is not available, skip testing video frame stream")
+            return
+
+        videoFilePath = os.path.join(self.tempDir, "video.mp4")
+        frameStream = self.logic.startFrameStream(videoFilePath, 10, self.logic.videoFormatPresets[0]["extraVideoOptions"])
+        self.logic.capture3dViewRotation(slicer.mrmlScene.GetNodeByID("vtkMRMLViewNode1"), -180, 180, self.numberOfImages,
+                                         AXIS_YAW, self.tempDir, self.imageFileNamePattern)
+        self.logic.stopFrameStream()
+        self.assertEqual(frameStream.frames, [])
+        self.assertTrue(os.path.exists(videoFilePath))
+        self.assertGreater(os.path.getsize(videoFilePath), 0)
+        os.remove(videoFilePath)
+        self.delayDisplay(f"Testing capture into frame stream completed successfully ({frameStream.framesPerSecond:.1f} frames per second)")
+
+    def test_OffscreenRendering(self):
+        self.delayDisplay("Testing offscreen rendering")
+        import time
+
+        viewNode = slicer.mrmlScene.GetNodeByID("vtkMRMLSliceNodeRed")
+        imageSize = [1280, 720]
+        self.logic.setOffscreenRendering(True, imageSize)
+        try:
+            frameStream = self.logic.startFrameStream(keepFrames=True)
+            startTime = time.perf_counter()
+            self.logic.captureSliceSweep(viewNode, -125, 75, self.numberOfImages, self.tempDir, self.imageFileNamePattern)
+            elapsedTime = time.perf_counter() - startTime
+            self.logic.stopFrameStream()
+        finally:
+            self.logic.setOffscreenRendering(False)
+        self.assertEqual(len(frameStream.frames), self.numberOfImages)
+        for frame in frameStream.frames:
+            self.assertEqual(list(frame.GetDimensions()[0:2]), imageSize)
+        self.delayDisplay(f"Testing offscreen rendering completed successfully ({self.numberOfImages / elapsedTime:.1f} frames per second)")
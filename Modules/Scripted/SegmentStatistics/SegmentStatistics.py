@@ -1,4 +1,6 @@
+import csv
 import logging
+import os
 
 import ctk
 import qt
@@ -755,6 +757,183 @@ class SegmentStatisticsLogic(ScriptedLoadableModuleLogic):
         fp.write(self.exportToString(nonEmptyKeysOnly))
         fp.close()
 
+    batchInputColumnNames = ["VolumeFile", "SegmentationFile"]
+
+    def getBatchColumnNames(self):
+        """Get column names of the table written by :py:meth:`computeStatisticsForManifest`.
+        All measurement keys are included (not just non-empty ones) so that the header
+        does not depend on the content of the first processed case.
+        """
+        return SegmentStatisticsLogic.batchInputColumnNames + ["SegmentID"] + self.keys
+
+    def computeStatisticsForFiles(self, segmentationFilePath, volumeFilePath=None):
+        """Load a segmentation (and optionally a scalar volume) from file, compute statistics
+        for all segments, and remove the loaded nodes from the scene.
+        No display or view setup is performed.
+        Returns list of rows (one dict per segment, keyed by :py:meth:`getBatchColumnNames`).
+        """
+        loadedNodes = []
+        parameterNode = self.getParameterNode()
+        try:
+            # Opacities are only used for display, skip computing them
+            segmentationNode = slicer.util.loadSegmentation(segmentationFilePath, {"show": False, "autoOpacities": False})
+            loadedNodes.append(segmentationNode)
+            volumeNode = None
+            if volumeFilePath:
+                volumeNode = slicer.util.loadVolume(volumeFilePath, {"show": False, "singleFile": True, "autoWindowLevel": False})
+                loadedNodes.append(volumeNode)
+
+            parameterNode.SetParameter("Segmentation", segmentationNode.GetID())
+            parameterNode.SetParameter("ScalarVolume", volumeNode.GetID() if volumeNode else "")
+            parameterNode.SetParameter("ScalarVolumeSegmentStatisticsPlugin.enabled", str(volumeNode is not None))
+            parameterNode.SetParameter("visibleSegmentsOnly", str(False))
+            self.computeStatistics()
+
+            statistics = self.getStatistics()
+            rows = []
+            for segmentID in statistics["SegmentIDs"]:
+                row = {"VolumeFile": volumeFilePath or "", "SegmentationFile": segmentationFilePath, "SegmentID": segmentID}
+                for key in self.keys:
+                    row[key] = statistics[segmentID, key] if (segmentID, key) in statistics else ""
+                rows.append(row)
+            return rows
+        finally:
+            for node in loadedNodes:
+                # Get all display nodes before removing any, as removal changes the display node list
+                displayNodes = [node.GetNthDisplayNode(displayNodeIndex) for displayNodeIndex in range(node.GetNumberOfDisplayNodes())]
+                for displayNode in displayNodes:
+                    slicer.mrmlScene.RemoveNode(displayNode)
+                slicer.mrmlScene.RemoveNode(node.GetStorageNode())
+                slicer.mrmlScene.RemoveNode(node)
+
+    @staticmethod
+    def readManifest(manifestFilePath):
+        """Read list of (volume file, segmentation file) pairs from a CSV file.
+        The file must have a header with "SegmentationFile" column and optionally a "VolumeFile" column.
+        Relative paths are interpreted relative to the folder of the manifest file.
+        """
+        manifestDir = os.path.dirname(os.path.abspath(manifestFilePath))
+        cases = []
+        with open(manifestFilePath, newline="") as manifestFile:
+            reader = csv.DictReader(manifestFile)
+            if "SegmentationFile" not in (reader.fieldnames or []):
+                raise ValueError(f"Manifest file {manifestFilePath} does not contain a 'SegmentationFile' column")
+            for row in reader:
+                volumeFilePath = row.get("VolumeFile") or ""
+                segmentationFilePath = row["SegmentationFile"]
+                if volumeFilePath:
+                    volumeFilePath = os.path.join(manifestDir, volumeFilePath)
+                segmentationFilePath = os.path.join(manifestDir, segmentationFilePath)
+                cases.append((volumeFilePath, segmentationFilePath))
+        return cases
+
+    @staticmethod
+    def _readProcessedCases(outputFilePath, columnNames):
+        """Get set of (volume file, segmentation file) pairs that already have results in the output file."""
+        processedCases = set()
+        if not os.path.exists(outputFilePath) or os.path.getsize(outputFilePath) == 0:
+            return processedCases
+        with open(outputFilePath, newline="") as outputFile:
+            reader = csv.DictReader(outputFile)
+            if reader.fieldnames != columnNames:
+                raise ValueError(f"Cannot resume: columns of existing output file {outputFilePath} do not match current measurements")
+            for row in reader:
+                processedCases.add((row["VolumeFile"], row["SegmentationFile"]))
+        return processedCases
+
+    def _mergePartialOutputs(self, outputFilePath, partialOutputFilePaths):
+        """Append content of partial output files written by worker processes to the output file and delete them."""
+        columnNames = self.getBatchColumnNames()
+        writeHeader = not os.path.exists(outputFilePath) or os.path.getsize(outputFilePath) == 0
+        with open(outputFilePath, "a", newline="") as outputFile:
+            writer = csv.DictWriter(outputFile, fieldnames=columnNames)
+            if writeHeader:
+                writer.writeheader()
+            for partialOutputFilePath in partialOutputFilePaths:
+                if not os.path.exists(partialOutputFilePath):
+                    continue
+                with open(partialOutputFilePath, newline="") as partialOutputFile:
+                    for row in csv.DictReader(partialOutputFile):
+                        writer.writerow(row)
+                os.remove(partialOutputFilePath)
+
+    def computeStatisticsForManifest(self, manifestFilePath, outputFilePath, numberOfProcesses=1, resume=True,
+                                     workerIndex=None):
+        """Compute statistics for all (volume, segmentation) file pairs listed in a manifest file.
+
+        Results are appended to ``outputFilePath`` (CSV, one row per segment) as soon as a case is completed,
+        therefore memory usage does not grow with the number of cases.
+        If ``resume`` is enabled then cases that already have results in the output file are skipped,
+        which allows continuing an interrupted run.
+
+        If ``numberOfProcesses`` is larger than 1 then cases are distributed between that many
+        Slicer processes (started without main window), each writing a partial output file, which
+        are merged into the output file when all processes are completed.
+
+        :param workerIndex: only used internally, to process the subset of cases assigned to a worker process.
+        :return: number of cases that were processed.
+        """
+        cases = SegmentStatisticsLogic.readManifest(manifestFilePath)
+        columnNames = self.getBatchColumnNames()
+        partialOutputFilePaths = [f"{outputFilePath}.part{index}" for index in range(numberOfProcesses)]
+
+        if workerIndex is None:
+            if not resume and os.path.exists(outputFilePath):
+                os.remove(outputFilePath)
+            # Collect results of worker processes of an interrupted run
+            self._mergePartialOutputs(outputFilePath, partialOutputFilePaths)
+
+        processedCases = SegmentStatisticsLogic._readProcessedCases(outputFilePath, columnNames)
+        remainingCases = [case for case in cases if case not in processedCases]
+
+        if workerIndex is None and numberOfProcesses > 1:
+            return self._computeStatisticsForManifestInWorkers(manifestFilePath, outputFilePath, numberOfProcesses,
+                                                               partialOutputFilePaths, len(remainingCases))
+
+        if workerIndex is not None:
+            remainingCases = remainingCases[workerIndex::numberOfProcesses]
+            outputFilePath = partialOutputFilePaths[workerIndex]
+
+        writeHeader = not os.path.exists(outputFilePath) or os.path.getsize(outputFilePath) == 0
+        with open(outputFilePath, "a", newline="") as outputFile:
+            writer = csv.DictWriter(outputFile, fieldnames=columnNames)
+            if writeHeader:
+                writer.writeheader()
+            for caseIndex, (volumeFilePath, segmentationFilePath) in enumerate(remainingCases):
+                logging.info(f"Computing segment statistics [{caseIndex + 1}/{len(remainingCases)}]: {segmentationFilePath}")
+                try:
+                    rows = self.computeStatisticsForFiles(segmentationFilePath, volumeFilePath)
+                except Exception as e:
+                    # Keep going, the case will be retried when the processing is resumed
+                    logging.error(f"Failed to compute segment statistics for {segmentationFilePath}: {e}")
+                    continue
+                if not rows:
+                    # Record the case even if it has no segments, so that it is not processed again when resuming
+                    rows = [{"VolumeFile": volumeFilePath, "SegmentationFile": segmentationFilePath}]
+                writer.writerows(rows)
+                outputFile.flush()
+        return len(remainingCases)
+
+    def _computeStatisticsForManifestInWorkers(self, manifestFilePath, outputFilePath, numberOfProcesses,
+                                               partialOutputFilePaths, numberOfCases):
+        import subprocess
+
+        processes = []
+        for workerIndex in range(numberOfProcesses):
+            pythonCode = (
+                "import SegmentStatistics\n"
+                "SegmentStatistics.SegmentStatisticsLogic().computeStatisticsForManifest("
+                f"{manifestFilePath!r}, {outputFilePath!r}, numberOfProcesses={numberOfProcesses}, workerIndex={workerIndex})\n"
+                "slicer.util.exit()\n")
+            args = [slicer.app.launcherExecutableFilePath, "--no-splash", "--no-main-window", "--ignore-slicerrc",
+                    "--python-code", pythonCode]
+            processes.append(subprocess.Popen(args))
+        failedWorkers = [workerIndex for workerIndex, process in enumerate(processes) if process.wait() != 0]
+        self._mergePartialOutputs(outputFilePath, partialOutputFilePaths)
+        if failedWorkers:
+            raise RuntimeError(f"Segment statistics worker processes {failedWorkers} failed. Run again to resume processing.")
+        return numberOfCases
+
 
 class SegmentStatisticsTest(ScriptedLoadableModuleTest):
     """
@@ -775,6 +954,9 @@ class SegmentStatisticsTest(ScriptedLoadableModuleTest):
         self.setUp()
         self.test_SegmentStatisticsPlugins()
 
+        self.setUp()
+        self.test_SegmentStatisticsBatch()
+
     def test_SegmentStatisticsBasic(self):
         """This tests some aspects of the label statistics"""
 
@@ -993,6 +1175,68 @@ class SegmentStatisticsTest(ScriptedLoadableModuleTest):
         self.delayDisplay("test_SegmentStatisticsPlugins passed!")
 
 
+    def test_SegmentStatisticsBatch(self):
+        """This tests computation of statistics for a list of files"""
+
+        self.delayDisplay("Starting test_SegmentStatisticsBatch")
+
+        import SampleData
+        from SegmentStatistics import SegmentStatisticsLogic
+
+        self.delayDisplay("Save volume and segmentation files")
+
+        sourceVolumeNode = SampleData.downloadSample("MRBrainTumor1")
+        segmentationNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLSegmentationNode")
+        segmentationNode.SetReferenceImageGeometryParameterFromVolumeNode(sourceVolumeNode)
+        for radius in [10, 20]:
+            sphereSource = vtk.vtkSphereSource()
+            sphereSource.SetRadius(radius)
+            sphereSource.SetCenter(0, 30, 28)
+            sphereSource.Update()
+            segmentationNode.AddSegmentFromClosedSurfaceRepresentation(sphereSource.GetOutput(), f"Sphere{radius}")
+        segmentationNode.SetSourceRepresentationToBinaryLabelmap()
+
+        batchDir = slicer.app.temporaryPath + "/SegmentStatisticsBatchTest"
+        qt.QDir().mkpath(batchDir)
+        slicer.util.saveNode(sourceVolumeNode, batchDir + "/volume.nrrd")
+        slicer.util.saveNode(segmentationNode, batchDir + "/segmentation.seg.nrrd")
+        slicer.mrmlScene.Clear(0)
+
+        manifestFilePath = batchDir + "/manifest.csv"
+        with open(manifestFilePath, "w") as manifestFile:
+            manifestFile.write("VolumeFile,SegmentationFile\n")
+            manifestFile.write("volume.nrrd,segmentation.seg.nrrd\n")
+            manifestFile.write(",segmentation.seg.nrrd\n")
+        outputFilePath = batchDir + "/statistics.csv"
+
+        self.delayDisplay("Compute statistics")
+        segStatLogic = SegmentStatisticsLogic()
+        numberOfProcessedCases = segStatLogic.computeStatisticsForManifest(manifestFilePath, outputFilePath, resume=False)
+        self.assertEqual(numberOfProcessedCases, 2)
+
+        with open(outputFilePath, newline="") as outputFile:
+            rows = list(csv.DictReader(outputFile))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual([row["Segment"] for row in rows], ["Sphere10", "Sphere20", "Sphere10", "Sphere20"])
+        self.assertNotEqual(rows[0]["ScalarVolumeSegmentStatisticsPlugin.mean"], "")
+        self.assertEqual(rows[2]["ScalarVolumeSegmentStatisticsPlugin.mean"], "")
+        self.assertEqual(rows[0]["LabelmapSegmentStatisticsPlugin.voxel_count"], rows[2]["LabelmapSegmentStatisticsPlugin.voxel_count"])
+
+        # Loaded nodes are not kept in the scene
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLSegmentationNode"), 0)
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLScalarVolumeNode"), 0)
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLSegmentationDisplayNode"), 0)
+        self.assertEqual(slicer.mrmlScene.GetNumberOfNodesByClass("vtkMRMLScalarVolumeDisplayNode"), 0)
+
+        self.delayDisplay("Resume processing")
+        numberOfProcessedCases = segStatLogic.computeStatisticsForManifest(manifestFilePath, outputFilePath)
+        self.assertEqual(numberOfProcessedCases, 0)
+        with open(outputFilePath, newline="") as outputFile:
+            self.assertEqual(len(list(csv.DictReader(outputFile))), 4)
+
+        self.delayDisplay("test_SegmentStatisticsBatch passed!")
+
+
 class Slicelet:
     """A slicer slicelet is a module widget that comes up in stand alone mode
     implemented as a python class.
@@ -1031,11 +1275,25 @@ class SegmentStatisticsSlicelet(Slicelet):
 
 
 if __name__ == "__main__":
-    # TODO: need a way to access and parse command line arguments
     # TODO: ideally command line args should handle --xml
 
+    import argparse
     import sys
 
     print(sys.argv)
 
-    slicelet = SegmentStatisticsSlicelet()
+    if "--manifest" in sys.argv:
+        # Batch processing, for example:
+        # Slicer --no-main-window --python-script SegmentStatistics.py --manifest cases.csv --output results.csv
+        parser = argparse.ArgumentParser(description="Compute segment statistics for a list of cases")
+        parser.add_argument("--manifest", required=True,
+                            help="CSV file with SegmentationFile and (optional) VolumeFile columns")
+        parser.add_argument("--output", required=True, help="CSV file to write the results into")
+        parser.add_argument("--processes", type=int, default=1, help="number of Slicer processes to use")
+        parser.add_argument("--restart", action="store_true", help="discard existing results instead of resuming")
+        args = parser.parse_args(sys.argv[sys.argv.index("--manifest"):])
+        SegmentStatisticsLogic().computeStatisticsForManifest(
+            args.manifest, args.output, numberOfProcesses=args.processes, resume=not args.restart)
+        slicer.util.exit()
+    else:
+        slicelet = SegmentStatisticsSlicelet()